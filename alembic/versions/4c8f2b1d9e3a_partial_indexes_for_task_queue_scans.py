@@ -0,0 +1,49 @@
+"""Partial indexes for task queue scans
+
+Revision ID: 4c8f2b1d9e3a
+Revises: 9d71a8985289
+Create Date: 2026-02-18 14:22:07.511243
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4c8f2b1d9e3a'
+down_revision: Union[str, Sequence[str], None] = '9d71a8985289'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Replace ix_tasks_status_created with partial indexes.
+
+    The queue polls hit exactly two predicates: pending tasks ordered by
+    created_at (dispatch) and assigned tasks by assigned_at (timeout sweep).
+    Partial indexes cover only those rows, so they stay tiny regardless of
+    how much completed/failed history accumulates, and writes to terminal
+    tasks never touch them. The full (status, created_at) composite becomes
+    redundant and is dropped.
+    """
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY ix_tasks_pending_created "
+            "ON tasks (created_at) WHERE status = 'pending'"
+        )
+        op.execute(
+            "CREATE INDEX CONCURRENTLY ix_tasks_assigned_at "
+            "ON tasks (assigned_at) WHERE status = 'assigned'"
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_tasks_status_created")
+
+
+def downgrade() -> None:
+    """Restore the full composite index and drop the partial ones."""
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY ix_tasks_status_created ON tasks (status, created_at)"
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_tasks_assigned_at")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_tasks_pending_created")
@@ -0,0 +1,40 @@
+"""Composite bot/status index on tasks
+
+Revision ID: 7e5a90c3f1b6
+Revises: 4c8f2b1d9e3a
+Create Date: 2026-02-18 14:41:33.902764
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7e5a90c3f1b6'
+down_revision: Union[str, Sequence[str], None] = '4c8f2b1d9e3a'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Replace ix_tasks_bot_id with a (bot_id, status, created_at DESC) composite.
+
+    "What is bot X working on" queries filter on bot_id and status and want
+    newest-first ordering; the composite serves the filter and the sort in a
+    single index scan. Its bot_id prefix answers every query the old
+    single-column ix_tasks_bot_id did, so that index is dropped.
+    """
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY ix_tasks_bot_status_created "
+            "ON tasks (bot_id, status, created_at DESC)"
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_tasks_bot_id")
+
+
+def downgrade() -> None:
+    """Restore the single-column bot_id index and drop the composite."""
+    with op.get_context().autocommit_block():
+        op.execute("CREATE INDEX CONCURRENTLY ix_tasks_bot_id ON tasks (bot_id)")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_tasks_bot_status_created")
@@ -9,6 +9,7 @@ from typing import Sequence, Union
 
 from alembic import op
 import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
 
 
 # revision identifiers, used by Alembic.
@@ -20,29 +21,25 @@ depends_on: Union[str, Sequence[str], None] = None
 
 def upgrade() -> None:
     """Create initial schema with bots, workflows, and tasks tables."""
+    upgrade_schema()
+    upgrade_indexes()
+
+
+def upgrade_schema() -> None:
+    """Create the bots, workflows, and tasks tables (no indexes)."""
     # Create bots table
     op.create_table(
         'bots',
         sa.Column('id', sa.UUID(), nullable=False),
         sa.Column('name', sa.String(length=255), nullable=False),
-        sa.Column('capabilities', sa.JSON(), nullable=False),
+        sa.Column('capabilities', postgresql.JSONB(), nullable=False),
         sa.Column('status', sa.String(length=20), nullable=False, server_default='offline'),
         sa.Column('last_seen', sa.DateTime(timezone=True), nullable=True),
-        sa.Column('metadata', sa.JSON(), nullable=False, server_default='{}'),
-        sa.Column('created_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.text('now()')),
-        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.text('now()')),
+        sa.Column('metadata', postgresql.JSONB(), nullable=False, server_default='{}'),
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.func.now()),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.func.now()),
         sa.PrimaryKeyConstraint('id'),
     )
-    op.create_index(op.f('ix_bots_name'), 'bots', ['name'])
-    op.create_index(op.f('ix_bots_status'), 'bots', ['status'])
-    # PostgreSQL-specific GIN index for JSON array searching
-    op.create_index(
-        'ix_bots_status_capabilities',
-        'bots',
-        ['status', 'capabilities'],
-        postgresql_using='gin',
-    )
-
     # Create workflows table
     op.create_table(
         'workflows',
@@ -50,18 +47,14 @@ def upgrade() -> None:
         sa.Column('name', sa.String(length=255), nullable=False),
         sa.Column('description', sa.Text(), nullable=False, server_default=''),
         sa.Column('status', sa.String(length=20), nullable=False, server_default='pending'),
-        sa.Column('task_ids', sa.JSON(), nullable=False, server_default='[]'),
-        sa.Column('metadata', sa.JSON(), nullable=False, server_default='{}'),
-        sa.Column('created_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.text('now()')),
+        sa.Column('task_ids', postgresql.JSONB(), nullable=False, server_default='[]'),
+        sa.Column('metadata', postgresql.JSONB(), nullable=False, server_default='{}'),
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.func.now()),
         sa.Column('started_at', sa.DateTime(timezone=True), nullable=True),
         sa.Column('completed_at', sa.DateTime(timezone=True), nullable=True),
-        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.text('now()')),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.func.now()),
         sa.PrimaryKeyConstraint('id'),
     )
-    op.create_index(op.f('ix_workflows_created_at'), 'workflows', ['created_at'])
-    op.create_index(op.f('ix_workflows_name'), 'workflows', ['name'])
-    op.create_index(op.f('ix_workflows_status'), 'workflows', ['status'])
-
     # Create tasks table
     op.create_table(
         'tasks',
@@ -69,23 +62,52 @@ def upgrade() -> None:
         sa.Column('workflow_id', sa.UUID(), nullable=False),
         sa.Column('bot_id', sa.UUID(), nullable=True),
         sa.Column('status', sa.String(length=20), nullable=False, server_default='pending'),
-        sa.Column('payload', sa.JSON(), nullable=False),
-        sa.Column('result', sa.JSON(), nullable=True),
+        sa.Column('payload', postgresql.JSONB(), nullable=False),
+        sa.Column('result', postgresql.JSONB(), nullable=True),
         sa.Column('timeout_seconds', sa.Integer(), nullable=False, server_default='300'),
-        sa.Column('created_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.text('now()')),
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.func.now()),
         sa.Column('assigned_at', sa.DateTime(timezone=True), nullable=True),
         sa.Column('started_at', sa.DateTime(timezone=True), nullable=True),
         sa.Column('completed_at', sa.DateTime(timezone=True), nullable=True),
-        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.text('now()')),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.func.now()),
         sa.ForeignKeyConstraint(['bot_id'], ['bots.id'], ondelete='SET NULL'),
         sa.PrimaryKeyConstraint('id'),
     )
-    op.create_index(op.f('ix_tasks_bot_id'), 'tasks', ['bot_id'])
-    op.create_index(op.f('ix_tasks_created_at'), 'tasks', ['created_at'])
-    op.create_index(op.f('ix_tasks_status'), 'tasks', ['status'])
-    op.create_index(op.f('ix_tasks_workflow_id'), 'tasks', ['workflow_id'])
-    # Composite index for common query patterns
-    op.create_index('ix_tasks_status_created', 'tasks', ['status', 'created_at'])
+
+
+def upgrade_indexes() -> None:
+    """Build all indexes with CREATE INDEX CONCURRENTLY.
+
+    CONCURRENTLY avoids the ACCESS EXCLUSIVE lock a plain CREATE INDEX
+    holds for the duration of the build, which would block the API when
+    this migration is replayed against a populated database (squashed
+    migrations, hot-restore). It cannot run inside a transaction, hence
+    the autocommit block.
+    """
+    with op.get_context().autocommit_block():
+        op.execute("CREATE INDEX CONCURRENTLY ix_bots_name ON bots (name)")
+        op.execute("CREATE INDEX CONCURRENTLY ix_bots_status ON bots (status)")
+        # GIN index with jsonb_path_ops: supports only @> containment but is
+        # roughly half the size of the default jsonb_ops, so capability lookups
+        # touch fewer pages. Status stays on its own btree index above; GIN
+        # adds nothing for equality on a short string column.
+        op.execute(
+            "CREATE INDEX CONCURRENTLY ix_bots_capabilities "
+            "ON bots USING gin (capabilities jsonb_path_ops)"
+        )
+
+        op.execute("CREATE INDEX CONCURRENTLY ix_workflows_created_at ON workflows (created_at)")
+        op.execute("CREATE INDEX CONCURRENTLY ix_workflows_name ON workflows (name)")
+        op.execute("CREATE INDEX CONCURRENTLY ix_workflows_status ON workflows (status)")
+
+        op.execute("CREATE INDEX CONCURRENTLY ix_tasks_bot_id ON tasks (bot_id)")
+        op.execute("CREATE INDEX CONCURRENTLY ix_tasks_created_at ON tasks (created_at)")
+        op.execute("CREATE INDEX CONCURRENTLY ix_tasks_status ON tasks (status)")
+        op.execute("CREATE INDEX CONCURRENTLY ix_tasks_workflow_id ON tasks (workflow_id)")
+        # Composite index for common query patterns
+        op.execute(
+            "CREATE INDEX CONCURRENTLY ix_tasks_status_created ON tasks (status, created_at)"
+        )
 
 
 def downgrade() -> None:
@@ -102,7 +124,7 @@ def downgrade() -> None:
     op.drop_index(op.f('ix_workflows_created_at'), table_name='workflows')
     op.drop_table('workflows')
 
-    op.drop_index('ix_bots_status_capabilities', table_name='bots')
+    op.drop_index('ix_bots_capabilities', table_name='bots')
     op.drop_index(op.f('ix_bots_status'), table_name='bots')
     op.drop_index(op.f('ix_bots_name'), table_name='bots')
     op.drop_table('bots')
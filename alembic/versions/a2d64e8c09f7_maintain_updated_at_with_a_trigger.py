@@ -0,0 +1,52 @@
+"""Maintain updated_at with a trigger
+
+Revision ID: a2d64e8c09f7
+Revises: 7e5a90c3f1b6
+Create Date: 2026-02-18 15:05:48.170226
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a2d64e8c09f7'
+down_revision: Union[str, Sequence[str], None] = '7e5a90c3f1b6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLES = ('bots', 'tasks', 'workflows')
+
+
+def upgrade() -> None:
+    """Add a BEFORE UPDATE trigger that stamps updated_at server-side.
+
+    Keeps updated_at correct even for bulk/statement-level UPDATEs that
+    bypass the ORM, and stamps it atomically with the row change instead
+    of relying on the application clock.
+    """
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION set_updated_at()
+        RETURNS trigger AS $$
+        BEGIN
+            NEW.updated_at = now();
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+    for table in TABLES:
+        op.execute(
+            f"CREATE TRIGGER trg_{table}_updated_at "
+            f"BEFORE UPDATE ON {table} "
+            f"FOR EACH ROW EXECUTE FUNCTION set_updated_at()"
+        )
+
+
+def downgrade() -> None:
+    """Drop the updated_at triggers and their function."""
+    for table in TABLES:
+        op.execute(f"DROP TRIGGER IF EXISTS trg_{table}_updated_at ON {table}")
+    op.execute("DROP FUNCTION IF EXISTS set_updated_at()")
@@ -0,0 +1,48 @@
+"""Native uuid[] for workflow task_ids
+
+Revision ID: b6e2f4a81c57
+Revises: f8a12c6e94d3
+Create Date: 2026-04-02 09:31:17.648209
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b6e2f4a81c57'
+down_revision: Union[str, Sequence[str], None] = 'f8a12c6e94d3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Convert workflows.task_ids from JSONB to a native uuid[].
+
+    A uuid array stores each element as 16 bytes instead of a quoted
+    36-character string, and asyncpg hands the elements back as UUID
+    objects, so the repository no longer converts every element on each
+    read and write. The JSONB text form `["a", "b"]` maps onto the array
+    literal `{a, b}` by translating the brackets and dropping the quotes.
+    """
+    op.execute("ALTER TABLE workflows ALTER COLUMN task_ids DROP DEFAULT")
+    op.execute(
+        "ALTER TABLE workflows ALTER COLUMN task_ids TYPE uuid[] "
+        "USING translate(task_ids::text, '[]\"', '{}')::uuid[]"
+    )
+    op.execute(
+        "ALTER TABLE workflows ALTER COLUMN task_ids SET DEFAULT '{}'::uuid[]"
+    )
+
+
+def downgrade() -> None:
+    """Convert workflows.task_ids back to a JSONB array of strings."""
+    op.execute("ALTER TABLE workflows ALTER COLUMN task_ids DROP DEFAULT")
+    op.execute(
+        "ALTER TABLE workflows ALTER COLUMN task_ids TYPE jsonb "
+        "USING to_jsonb(task_ids)"
+    )
+    op.execute(
+        "ALTER TABLE workflows ALTER COLUMN task_ids SET DEFAULT '[]'::jsonb"
+    )
@@ -0,0 +1,45 @@
+"""GIN indexes on bot metadata and task payload
+
+Revision ID: c1f3b7d24a85
+Revises: a2d64e8c09f7
+Create Date: 2026-03-09 09:47:31.284716
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c1f3b7d24a85'
+down_revision: Union[str, Sequence[str], None] = 'a2d64e8c09f7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Extend GIN coverage to the remaining JSONB columns.
+
+    bots.capabilities already has a GIN jsonb_path_ops index from the
+    initial schema; this adds the same treatment to bots.metadata and
+    tasks.payload so containment filters (e.g. bots in a region, tasks for
+    a deploy target) can use an index scan instead of reading every row.
+    jsonb_path_ops keeps both indexes at roughly half the size of the
+    default opclass at the cost of supporting only @> containment.
+    """
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY ix_bots_metadata "
+            "ON bots USING gin (metadata jsonb_path_ops)"
+        )
+        op.execute(
+            "CREATE INDEX CONCURRENTLY ix_tasks_payload "
+            "ON tasks USING gin (payload jsonb_path_ops)"
+        )
+
+
+def downgrade() -> None:
+    """Drop the metadata and payload GIN indexes."""
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_tasks_payload")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_bots_metadata")
@@ -0,0 +1,37 @@
+"""Partial index for pending workflows
+
+Revision ID: f8a12c6e94d3
+Revises: c1f3b7d24a85
+Create Date: 2026-03-24 11:05:48.913275
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f8a12c6e94d3'
+down_revision: Union[str, Sequence[str], None] = 'c1f3b7d24a85'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add a pending-only partial index on workflows.
+
+    Same rationale as ix_tasks_pending_created (4c8f2b1d9e3a): scheduler
+    scans only ever want pending rows ordered by age, and a partial index
+    stays small no matter how much completed history the table holds.
+    """
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY ix_workflows_pending_created "
+            "ON workflows (created_at) WHERE status = 'pending'"
+        )
+
+
+def downgrade() -> None:
+    """Drop the pending-workflow partial index."""
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_workflows_pending_created")
@@ -0,0 +1,33 @@
+"""
+Shared orjson response class for API routers.
+
+One response class, one option mask, one fallback hook — every router
+serializes through the same hot C code path instead of each endpoint
+going through jsonable_encoder's Python-level type dispatch.
+"""
+from typing import Any
+
+import orjson
+from fastapi import Response
+
+# Normalize timestamps on the wire: treat naive datetimes as UTC and emit
+# the Z suffix instead of +00:00
+_OPT = orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z
+
+
+def _default(obj: Any) -> str:
+    """Fallback for types orjson has no native encoding for.
+
+    orjson already handles UUID, datetime, and str-valued enums natively;
+    anything else (e.g. pydantic URL types) stringifies.
+    """
+    return str(obj)
+
+
+class FastORJSONResponse(Response):
+    """ORJSONResponse variant with a prebound option mask and default hook."""
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, default=_default, option=_OPT)
@@ -4,21 +4,24 @@ Bot API routes.
 HTTP endpoints for bot management operations.
 See CLAUDE.md Protocol 2 - Created after Domain/Infra/Services exist.
 """
+from datetime import datetime
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, Query, status
 
-from ...dependencies import get_bot_service
+from ...dependencies import get_bot_service, get_websocket_manager
 from ...domain.services.bot_service import BotService
-from ...exceptions import DomainError, InvalidStateTransition, ResourceNotFound
+from ...domain.services.websocket_manager import WebSocketConnectionManager
+from ..responses import FastORJSONResponse
 from ..schemas.bot_schemas import (
     BotCreate,
     BotList,
     BotResponse,
     HeartbeatResponse,
+    bot_list_from_domain,
 )
 
-router = APIRouter(prefix="/bots", tags=["bots"])
+router = APIRouter(prefix="/bots", tags=["bots"], default_response_class=FastORJSONResponse)
 
 
 @router.post(
@@ -33,15 +36,12 @@ async def register_bot(
     service: BotService = Depends(get_bot_service),
 ) -> BotResponse:
     """Register a new bot."""
-    try:
-        bot = await service.register_bot(
-            name=payload.name,
-            capabilities=payload.capabilities,
-            metadata=payload.metadata,
-        )
-        return BotResponse.from_domain(bot)
-    except DomainError as e:
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    bot = await service.register_bot(
+        name=payload.name,
+        capabilities=payload.capabilities,
+        metadata=payload.metadata,
+    )
+    return BotResponse.from_domain(bot)
 
 
 @router.get(
@@ -51,15 +51,14 @@ async def register_bot(
     description="Get paginated list of all registered bots.",
 )
 async def list_bots(
-    skip: int = Query(0, ge=0, description="Number of records to skip"),
+    cursor: datetime | None = Query(None, description="Fetch bots created before this timestamp"),
     limit: int = Query(100, ge=1, le=1000, description="Maximum records to return"),
     service: BotService = Depends(get_bot_service),
 ) -> BotList:
-    """List all bots with pagination."""
-    bots = await service.list_bots(skip=skip, limit=limit)
-    # NOTE: In production, get actual total count from repository
-    # For now, returning len(bots) as total
-    return BotList.from_domain_list(bots, total=len(bots), skip=skip, limit=limit)
+    """List bots with keyset pagination."""
+    bots = await service.list_bots(cursor=cursor, limit=limit)
+    total = await service.count_bots()
+    return BotList.from_domain_list(bots, total=total, limit=limit)
 
 
 @router.get(
@@ -73,36 +72,35 @@ async def get_bot(
     service: BotService = Depends(get_bot_service),
 ) -> BotResponse:
     """Get bot by ID."""
-    try:
-        bot = await service.get_bot(bot_id)
-        return BotResponse.from_domain(bot)
-    except ResourceNotFound as e:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    bot = await service.get_bot(bot_id)
+    return BotResponse.from_domain(bot)
 
 
 @router.post(
     "/{bot_id}/heartbeat",
-    response_model=HeartbeatResponse,
+    responses={200: {"model": HeartbeatResponse}},
     summary="Send bot heartbeat",
     description="Update bot's last_seen timestamp and mark as online if offline.",
 )
 async def bot_heartbeat(
     bot_id: UUID,
     service: BotService = Depends(get_bot_service),
-) -> HeartbeatResponse:
-    """Process bot heartbeat."""
-    try:
-        await service.heartbeat(bot_id)
-        bot = await service.get_bot(bot_id)
-        return HeartbeatResponse(
-            bot_id=bot.id,
-            status=bot.status,
-            last_seen=bot.last_seen,  # type: ignore
-        )
-    except ResourceNotFound as e:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
-    except DomainError as e:
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+) -> FastORJSONResponse:
+    """Process bot heartbeat.
+
+    Heartbeats are the highest-frequency endpoint in the system, so the
+    tiny fixed-shape body is serialized straight through orjson instead of
+    building and re-dumping a Pydantic model on every call.
+    """
+    bot = await service.heartbeat(bot_id)
+    return FastORJSONResponse(
+        {
+            "bot_id": bot.id,
+            "status": bot.status,
+            "last_seen": bot.last_seen,
+            "message": "Heartbeat acknowledged",
+        }
+    )
 
 
 @router.post(
@@ -116,14 +114,8 @@ async def mark_bot_busy(
     service: BotService = Depends(get_bot_service),
 ) -> BotResponse:
     """Mark bot as busy."""
-    try:
-        await service.mark_bot_busy(bot_id)
-        bot = await service.get_bot(bot_id)
-        return BotResponse.from_domain(bot)
-    except ResourceNotFound as e:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
-    except InvalidStateTransition as e:
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    bot = await service.mark_bot_busy(bot_id)
+    return BotResponse.from_domain(bot)
 
 
 @router.post(
@@ -137,12 +129,8 @@ async def mark_bot_available(
     service: BotService = Depends(get_bot_service),
 ) -> BotResponse:
     """Mark bot as available."""
-    try:
-        await service.mark_bot_available(bot_id)
-        bot = await service.get_bot(bot_id)
-        return BotResponse.from_domain(bot)
-    except ResourceNotFound as e:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    bot = await service.mark_bot_available(bot_id)
+    return BotResponse.from_domain(bot)
 
 
 @router.get(
@@ -157,7 +145,7 @@ async def get_bots_by_capability(
 ) -> list[BotResponse]:
     """Find bots by capability."""
     bots = await service.get_by_capability(capability)
-    return [BotResponse.from_domain(bot) for bot in bots]
+    return bot_list_from_domain(bots)
 
 
 @router.get(
@@ -169,10 +157,20 @@ async def get_bots_by_capability(
 async def get_available_bots(
     capability: str | None = Query(None, description="Filter by capability"),
     service: BotService = Depends(get_bot_service),
+    ws_manager: WebSocketConnectionManager = Depends(get_websocket_manager),
 ) -> list[BotResponse]:
     """Get available bots."""
+    if capability is not None:
+        # Fast path: the WebSocket manager indexes connected bots by
+        # capability, so a hit narrows the query to a handful of primary-key
+        # lookups instead of a capability scan over the whole table
+        cached_ids = ws_manager.get_connected_bot_ids_with_capability(capability)
+        if cached_ids:
+            bots = await service.get_bots_by_ids(list(cached_ids))
+            return bot_list_from_domain([bot for bot in bots if bot.is_available()])
+
     bots = await service.get_available_bots(capability=capability)
-    return [BotResponse.from_domain(bot) for bot in bots]
+    return bot_list_from_domain(bots)
 
 
 @router.delete(
@@ -186,7 +184,4 @@ async def delete_bot(
     service: BotService = Depends(get_bot_service),
 ) -> None:
     """Delete a bot."""
-    try:
-        await service.delete_bot(bot_id)
-    except ResourceNotFound as e:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    await service.delete_bot(bot_id)
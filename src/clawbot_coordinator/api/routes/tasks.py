@@ -3,23 +3,41 @@ Task API routes.
 
 HTTP endpoints for task management operations.
 """
+from datetime import datetime
+from typing import AsyncIterator
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, Query, status
+from fastapi.responses import StreamingResponse
 
 from ...dependencies import get_task_service
+from ...domain.models.task import Task
 from ...domain.services.task_service import TaskService
-from ...exceptions import DomainError, InvalidStateTransition, ResourceNotFound
+from ..responses import FastORJSONResponse
 from ..schemas.task_schemas import (
     TaskAssign,
+    TaskClaim,
     TaskCreate,
     TaskList,
     TaskResponse,
     TaskResult,
     TaskStatusUpdate,
+    task_list_from_domain,
 )
 
-router = APIRouter(prefix="/tasks", tags=["tasks"])
+router = APIRouter(prefix="/tasks", tags=["tasks"], default_response_class=FastORJSONResponse)
+
+
+def _status_update(task: Task, message: str) -> FastORJSONResponse:
+    """Render the fixed-shape status-update body straight through orjson.
+
+    The transition endpoints are hot paths; skipping the intermediate
+    Pydantic model saves a validation pass per call.
+    """
+    return FastORJSONResponse(
+        {"task_id": task.id, "status": task.status, "message": message}
+    )
+
 
 
 @router.post(
@@ -34,15 +52,12 @@ async def create_task(
     service: TaskService = Depends(get_task_service),
 ) -> TaskResponse:
     """Create a new task."""
-    try:
-        task = await service.create_task(
-            workflow_id=payload.workflow_id,
-            payload=payload.payload,
-            timeout_seconds=payload.timeout_seconds,
-        )
-        return TaskResponse.from_domain(task)
-    except DomainError as e:
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    task = await service.create_task(
+        workflow_id=payload.workflow_id,
+        payload=payload.payload,
+        timeout_seconds=payload.timeout_seconds,
+    )
+    return TaskResponse.from_domain(task)
 
 
 @router.get(
@@ -52,13 +67,33 @@ async def create_task(
     description="Get paginated list of all tasks.",
 )
 async def list_tasks(
-    skip: int = Query(0, ge=0, description="Number of records to skip"),
+    cursor: datetime | None = Query(None, description="Fetch tasks created before this timestamp"),
     limit: int = Query(100, ge=1, le=1000, description="Maximum records to return"),
     service: TaskService = Depends(get_task_service),
 ) -> TaskList:
-    """List all tasks with pagination."""
-    tasks = await service.list_tasks(skip=skip, limit=limit)
-    return TaskList.from_domain_list(tasks, total=len(tasks), skip=skip, limit=limit)
+    """List tasks with keyset pagination."""
+    tasks = await service.list_tasks(cursor=cursor, limit=limit)
+    total = await service.count_tasks()
+    return TaskList.from_domain_list(tasks, total=total, limit=limit)
+
+
+@router.post(
+    "/claim",
+    response_model=list[TaskResponse],
+    summary="Claim pending tasks",
+    description="Atomically claim the oldest pending tasks for a bot.",
+)
+async def claim_tasks(
+    payload: TaskClaim,
+    service: TaskService = Depends(get_task_service),
+) -> list[TaskResponse]:
+    """Claim pending tasks for a bot.
+
+    Safe for concurrent schedulers: each call claims a disjoint set of
+    tasks in a single atomic statement.
+    """
+    tasks = await service.claim_pending_tasks(payload.bot_id, payload.limit)
+    return task_list_from_domain(tasks)
 
 
 @router.get(
@@ -72,16 +107,13 @@ async def get_task(
     service: TaskService = Depends(get_task_service),
 ) -> TaskResponse:
     """Get task by ID."""
-    try:
-        task = await service.get_task(task_id)
-        return TaskResponse.from_domain(task)
-    except ResourceNotFound as e:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    task = await service.get_task(task_id)
+    return TaskResponse.from_domain(task)
 
 
 @router.post(
     "/{task_id}/assign",
-    response_model=TaskStatusUpdate,
+    responses={200: {"model": TaskStatusUpdate}},
     summary="Assign task to bot",
     description="Assign a pending task to a bot.",
 )
@@ -89,50 +121,30 @@ async def assign_task(
     task_id: UUID,
     payload: TaskAssign,
     service: TaskService = Depends(get_task_service),
-) -> TaskStatusUpdate:
+) -> FastORJSONResponse:
     """Assign task to a bot."""
-    try:
-        await service.assign_task_to_bot(task_id, payload.bot_id)
-        task = await service.get_task(task_id)
-        return TaskStatusUpdate(
-            task_id=task.id,
-            status=task.status,
-            message="Task assigned to bot",
-        )
-    except ResourceNotFound as e:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
-    except InvalidStateTransition as e:
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    task = await service.assign_task_to_bot(task_id, payload.bot_id)
+    return _status_update(task, "Task assigned to bot")
 
 
 @router.post(
     "/{task_id}/start",
-    response_model=TaskStatusUpdate,
+    responses={200: {"model": TaskStatusUpdate}},
     summary="Start task execution",
     description="Transition task from assigned to in-progress.",
 )
 async def start_task(
     task_id: UUID,
     service: TaskService = Depends(get_task_service),
-) -> TaskStatusUpdate:
+) -> FastORJSONResponse:
     """Start task execution."""
-    try:
-        await service.start_task(task_id)
-        task = await service.get_task(task_id)
-        return TaskStatusUpdate(
-            task_id=task.id,
-            status=task.status,
-            message="Task started",
-        )
-    except ResourceNotFound as e:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
-    except InvalidStateTransition as e:
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    task = await service.start_task(task_id)
+    return _status_update(task, "Task started")
 
 
 @router.post(
     "/{task_id}/complete",
-    response_model=TaskStatusUpdate,
+    responses={200: {"model": TaskStatusUpdate}},
     summary="Complete task",
     description="Mark task as successfully completed with result.",
 )
@@ -140,25 +152,15 @@ async def complete_task(
     task_id: UUID,
     payload: TaskResult,
     service: TaskService = Depends(get_task_service),
-) -> TaskStatusUpdate:
+) -> FastORJSONResponse:
     """Complete a task with result."""
-    try:
-        await service.complete_task(task_id, payload.result)
-        task = await service.get_task(task_id)
-        return TaskStatusUpdate(
-            task_id=task.id,
-            status=task.status,
-            message="Task completed successfully",
-        )
-    except ResourceNotFound as e:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
-    except InvalidStateTransition as e:
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    task = await service.complete_task(task_id, payload.result)
+    return _status_update(task, "Task completed successfully")
 
 
 @router.post(
     "/{task_id}/fail",
-    response_model=TaskStatusUpdate,
+    responses={200: {"model": TaskStatusUpdate}},
     summary="Fail task",
     description="Mark task as failed with error information.",
 )
@@ -166,43 +168,25 @@ async def fail_task(
     task_id: UUID,
     payload: TaskResult,
     service: TaskService = Depends(get_task_service),
-) -> TaskStatusUpdate:
+) -> FastORJSONResponse:
     """Fail a task with error information."""
-    try:
-        await service.fail_task(task_id, payload.result)
-        task = await service.get_task(task_id)
-        return TaskStatusUpdate(
-            task_id=task.id,
-            status=task.status,
-            message="Task marked as failed",
-        )
-    except ResourceNotFound as e:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
-    except InvalidStateTransition as e:
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    task = await service.fail_task(task_id, payload.result)
+    return _status_update(task, "Task marked as failed")
 
 
 @router.post(
     "/{task_id}/cancel",
-    response_model=TaskStatusUpdate,
+    responses={200: {"model": TaskStatusUpdate}},
     summary="Cancel task",
     description="Cancel a task (can be done from any state).",
 )
 async def cancel_task(
     task_id: UUID,
     service: TaskService = Depends(get_task_service),
-) -> TaskStatusUpdate:
+) -> FastORJSONResponse:
     """Cancel a task."""
-    try:
-        await service.cancel_task(task_id)
-        task = await service.get_task(task_id)
-        return TaskStatusUpdate(
-            task_id=task.id,
-            status=task.status,
-            message="Task cancelled",
-        )
-    except ResourceNotFound as e:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    task = await service.cancel_task(task_id)
+    return _status_update(task, "Task cancelled")
 
 
 @router.get(
@@ -217,7 +201,30 @@ async def get_tasks_by_workflow(
 ) -> list[TaskResponse]:
     """Get all tasks for a workflow."""
     tasks = await service.get_tasks_by_workflow(workflow_id)
-    return [TaskResponse.from_domain(task) for task in tasks]
+    return task_list_from_domain(tasks)
+
+
+@router.get(
+    "/workflow/{workflow_id}/stream",
+    summary="Stream tasks by workflow",
+    description="Stream all tasks for a workflow as newline-delimited JSON.",
+)
+async def stream_tasks_by_workflow(
+    workflow_id: UUID,
+    service: TaskService = Depends(get_task_service),
+) -> StreamingResponse:
+    """Stream all tasks for a workflow as NDJSON.
+
+    Unlike the list endpoint, rows are serialized and sent as they arrive
+    from the database, so time-to-first-byte and peak memory stay constant
+    regardless of workflow size.
+    """
+
+    async def generate() -> AsyncIterator[bytes]:
+        async for task in service.iter_tasks_by_workflow(workflow_id):
+            yield TaskResponse.from_domain(task).model_dump_json().encode() + b"\n"
+
+    return StreamingResponse(generate(), media_type="application/x-ndjson")
 
 
 @router.get(
@@ -232,7 +239,25 @@ async def get_tasks_by_bot(
 ) -> list[TaskResponse]:
     """Get all tasks assigned to a bot."""
     tasks = await service.get_tasks_by_bot(bot_id)
-    return [TaskResponse.from_domain(task) for task in tasks]
+    return task_list_from_domain(tasks)
+
+
+@router.get(
+    "/bot/{bot_id}/stream",
+    summary="Stream tasks by bot",
+    description="Stream all tasks assigned to a bot as newline-delimited JSON.",
+)
+async def stream_tasks_by_bot(
+    bot_id: UUID,
+    service: TaskService = Depends(get_task_service),
+) -> StreamingResponse:
+    """Stream all tasks assigned to a bot as NDJSON."""
+
+    async def generate() -> AsyncIterator[bytes]:
+        async for task in service.iter_tasks_by_bot(bot_id):
+            yield TaskResponse.from_domain(task).model_dump_json().encode() + b"\n"
+
+    return StreamingResponse(generate(), media_type="application/x-ndjson")
 
 
 @router.get(
@@ -247,7 +272,7 @@ async def get_pending_tasks(
 ) -> list[TaskResponse]:
     """Get pending tasks."""
     tasks = await service.get_pending_tasks(limit)
-    return [TaskResponse.from_domain(task) for task in tasks]
+    return task_list_from_domain(tasks)
 
 
 @router.delete(
@@ -261,7 +286,4 @@ async def delete_task(
     service: TaskService = Depends(get_task_service),
 ) -> None:
     """Delete a task."""
-    try:
-        await service.delete_task(task_id)
-    except ResourceNotFound as e:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    await service.delete_task(task_id)
@@ -1,26 +1,50 @@
 """WebSocket routes for real-time bot communication."""
-import json
+import asyncio
 from uuid import UUID
 
+import msgspec
+
 from fastapi import APIRouter, Depends, WebSocket, WebSocketDisconnect, status
 from fastapi.responses import JSONResponse
 
-from ...dependencies import get_bot_service, get_task_service, get_websocket_manager
-from ...domain.models.websocket_message import (
-    ConnectedMessage,
+from ...dependencies import (
+    get_bot_service,
+    get_heartbeat_batcher,
+    get_task_service,
+    get_websocket_manager,
+)
+from ...domain.models.websocket_message_fast import (
+    ENCODER,
+    INCOMING_DECODER,
     HeartbeatMessage,
-    MessageType,
-    TaskAssignedMessage,
     TaskCompleteMessage,
+    connected_message,
+    task_assigned_message,
 )
+from ...domain.models.bot import Bot
+from ...domain.models.task import Task
 from ...domain.services.bot_service import BotService
 from ...domain.services.task_service import TaskService
 from ...domain.services.websocket_manager import WebSocketConnectionManager
 from ...exceptions import DomainError, ResourceNotFound
+from ...workers.heartbeat_batcher import HeartbeatBatcher
+from ..schemas.websocket_schemas import BroadcastBatchRequest
 
 router = APIRouter(tags=["websocket"])
 
 
+def _render_task_assigned(task: Task) -> bytes:
+    """Render the task_assigned wire message without a Pydantic pass.
+
+    Encodes a msgspec Struct instead of walking the TaskAssignedMessage
+    schema per send. Field-for-field compatible with
+    TaskAssignedMessage.model_dump_json().
+    """
+    return ENCODER.encode(
+        task_assigned_message(task.id, task.workflow_id, task.payload)
+    )
+
+
 @router.websocket("/ws/control")
 async def websocket_control(
     websocket: WebSocket,
@@ -28,6 +52,7 @@ async def websocket_control(
     ws_manager: WebSocketConnectionManager = Depends(get_websocket_manager),
     bot_service: BotService = Depends(get_bot_service),
     task_service: TaskService = Depends(get_task_service),
+    heartbeat_batcher: HeartbeatBatcher | None = Depends(get_heartbeat_batcher),
 ) -> None:
     """
     WebSocket endpoint for bot control.
@@ -51,91 +76,117 @@ async def websocket_control(
         await websocket.close(code=status.WS_1008_POLICY_VIOLATION, reason="Invalid bot_id")
         return
 
-    # Verify bot exists
+    # Pipeline the handshake: the bot-existence SELECT runs while the
+    # WebSocket upgrade completes, instead of back-to-back
+    bot_task = asyncio.create_task(bot_service.get_bot(bot_uuid))
+    try:
+        await websocket.accept()
+    except BaseException:
+        # Client dropped mid-handshake; reap the lookup before the
+        # dependency teardown closes its session under it
+        bot_task.cancel()
+        try:
+            await bot_task
+        except (asyncio.CancelledError, ResourceNotFound):
+            pass
+        raise
+
     try:
-        bot = await bot_service.get_bot(bot_uuid)
+        bot = await bot_task
     except ResourceNotFound:
+        # Existence check lost the race with accept - reject after accept
         await websocket.close(code=status.WS_1008_POLICY_VIOLATION, reason="Bot not found")
         return
 
-    # Accept connection
-    await websocket.accept()
-
     # Register connection
-    ws_manager.connect(bot_uuid, websocket)
-
-    # Send connected message
-    connected_msg = ConnectedMessage(bot_id=bot_uuid)
-    await websocket.send_json(connected_msg.model_dump(mode="json"))
-
-    # Mark bot as online
-    try:
-        if bot.status.value == "offline":
-            bot.go_online()
-            await bot_service.save_bot(bot)
-    except DomainError:
-        pass  # Ignore state transition errors
+    ws_manager.connect(bot_uuid, websocket, capabilities=bot.capabilities)
+
+    # Send connected message and persist the online transition concurrently;
+    # the msgspec encode is a single C-level pass over the Struct, no
+    # validator walk or intermediate dict
+    await asyncio.gather(
+        websocket.send_bytes(ENCODER.encode(connected_message(bot_uuid))),
+        _mark_online_if_offline(bot, bot_service),
+    )
 
     try:
         # Listen for messages from bot
         while True:
             data = await websocket.receive_text()
-            message = json.loads(data)
-            message_type = message.get("type")
-
-            if message_type == MessageType.TASK_COMPLETE:
+            try:
+                # Typed decode + tag dispatch in one pass
+                message = INCOMING_DECODER.decode(data)
+            except msgspec.DecodeError:
+                # Malformed or unknown message type - ignore
+                continue
+
+            if isinstance(message, TaskCompleteMessage):
                 # Handle task completion
                 await _handle_task_complete(message, task_service, bot_uuid)
 
-            elif message_type == MessageType.HEARTBEAT:
+            elif isinstance(message, HeartbeatMessage):
                 # Handle heartbeat
-                await _handle_heartbeat(bot_uuid, bot_service)
-
-            else:
-                # Unknown message type - ignore
-                pass
+                await _handle_heartbeat(bot_uuid, bot_service, heartbeat_batcher)
 
     except WebSocketDisconnect:
-        # Bot disconnected
+        # Bot disconnected - single UPDATE, no re-fetch of the bot
         ws_manager.disconnect(bot_uuid)
-
-        # Mark bot as offline
-        try:
-            bot = await bot_service.get_bot(bot_uuid)
-            bot.go_offline()
-            await bot_service.save_bot(bot)
-        except (ResourceNotFound, DomainError):
-            pass
+        await bot_service.mark_bot_offline(bot_uuid)
 
     except Exception:
         # Unexpected error - disconnect
         ws_manager.disconnect(bot_uuid)
+        await bot_service.mark_bot_offline(bot_uuid)
+
+
+async def _mark_online_if_offline(bot: Bot, bot_service: BotService) -> None:
+    """Transition a freshly connected bot online.
+
+    Runs inside the handshake gather, so state-transition errors are
+    swallowed here rather than tearing down the connection.
+    """
+    try:
+        if bot.status.value == "offline":
+            bot.go_online()
+            await bot_service.save_bot(bot)
+    except DomainError:
+        pass  # Ignore state transition errors
 
 
 async def _handle_task_complete(
-    message: dict,
+    message: TaskCompleteMessage,
     task_service: TaskService,
     bot_id: UUID,
 ) -> None:
     """Handle task completion message from bot."""
+    payload = message.payload
     try:
-        task_id = UUID(message["payload"]["task_id"])
-        success = message["payload"]["success"]
-
-        if success:
-            result = message["payload"].get("result", {})
-            await task_service.complete_task(task_id, result)
+        if payload.success:
+            await task_service.complete_task(payload.task_id, payload.result or {})
         else:
-            error = message["payload"].get("error", "Unknown error")
-            await task_service.fail_task(task_id, error)
+            await task_service.fail_task(payload.task_id, payload.error or "Unknown error")
 
-    except (KeyError, ValueError, ResourceNotFound, DomainError):
-        # Invalid message or task not found - ignore
+    except (ResourceNotFound, DomainError):
+        # Task not found or invalid transition - ignore
         pass
 
 
-async def _handle_heartbeat(bot_id: UUID, bot_service: BotService) -> None:
-    """Handle heartbeat message from bot."""
+async def _handle_heartbeat(
+    bot_id: UUID,
+    bot_service: BotService,
+    batcher: HeartbeatBatcher | None,
+) -> None:
+    """Handle heartbeat message from bot.
+
+    Nothing here needs the updated bot, so heartbeats are fire-and-forget:
+    enqueue into the batcher, which merges a window's worth of heartbeats
+    into one UPDATE. Falls back to the synchronous path when the batcher
+    isn't running (test clients without lifespan startup).
+    """
+    if batcher is not None:
+        batcher.enqueue(bot_id)
+        return
+
     try:
         await bot_service.heartbeat(bot_id)
     except (ResourceNotFound, DomainError):
@@ -181,14 +232,8 @@ async def broadcast_task_assignment(
         )
 
     # Create and send task assigned message
-    message = TaskAssignedMessage(
-        task_id=task.id,
-        workflow_id=task.workflow_id,
-        task_payload=task.payload,
-    )
-
     try:
-        await websocket.send_json(message.model_dump(mode="json"))
+        await websocket.send_bytes(_render_task_assigned(task))
         return JSONResponse(
             status_code=status.HTTP_200_OK,
             content={"status": "sent", "bot_id": str(bot_id), "task_id": str(task_id)},
@@ -202,6 +247,57 @@ async def broadcast_task_assignment(
         )
 
 
+@router.post("/ws/broadcast/tasks")
+async def broadcast_task_assignments(
+    payload: BroadcastBatchRequest,
+    ws_manager: WebSocketConnectionManager = Depends(get_websocket_manager),
+    task_service: TaskService = Depends(get_task_service),
+) -> JSONResponse:
+    """
+    Broadcast a batch of task assignments to connected bots.
+
+    Fetches all tasks in a single query and fans out the WebSocket sends
+    concurrently, so notifying N bots costs one HTTP round-trip and one
+    SELECT instead of N of each.
+
+    Returns:
+        JSON response listing sent, skipped (not connected), and failed task IDs
+    """
+    tasks = await task_service.get_tasks_by_ids(
+        [item.task_id for item in payload.assignments]
+    )
+    tasks_by_id = {task.id: task for task in tasks}
+
+    sends: list = []
+    send_targets: list[tuple[UUID, UUID]] = []
+    skipped: list[str] = []
+    for item in payload.assignments:
+        task = tasks_by_id.get(item.task_id)
+        websocket = ws_manager.get_connection(item.bot_id)
+        if task is None or websocket is None:
+            skipped.append(str(item.task_id))
+            continue
+        sends.append(websocket.send_bytes(_render_task_assigned(task)))
+        send_targets.append((item.task_id, item.bot_id))
+
+    results = await asyncio.gather(*sends, return_exceptions=True)
+
+    sent: list[str] = []
+    failed: list[str] = []
+    for (task_id, bot_id), result in zip(send_targets, results):
+        if isinstance(result, BaseException):
+            # Failed to send - bot may have disconnected
+            ws_manager.disconnect(bot_id)
+            failed.append(str(task_id))
+        else:
+            sent.append(str(task_id))
+
+    return JSONResponse(
+        status_code=status.HTTP_200_OK,
+        content={"sent": sent, "skipped": skipped, "failed": failed},
+    )
+
+
 @router.get("/ws/connections")
 async def list_active_connections(
     ws_manager: WebSocketConnectionManager = Depends(get_websocket_manager),
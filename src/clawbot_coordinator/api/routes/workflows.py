@@ -1,98 +1,145 @@
 """Workflow API routes."""
+import asyncio
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+import orjson
+from fastapi import APIRouter, Depends, Query, Request, Response, status
+from fastapi.exceptions import RequestValidationError
+from pydantic import ValidationError
 
-from ...dependencies import get_workflow_service
+from ...dependencies import (
+    get_workflow_read_service,
+    get_workflow_service,
+    get_workflow_write_service,
+)
 from ...domain.services.workflow_service import WorkflowService
-from ...exceptions import DomainError, ResourceNotFound
+from ..responses import FastORJSONResponse
 from ..schemas.task_schemas import TaskResponse
-from ..schemas.workflow_schemas import WorkflowCreate, WorkflowResponse, WorkflowWithTasks
+from ..schemas.workflow_schemas import (
+    WorkflowCreate,
+    WorkflowResponse,
+    WorkflowWithTasks,
+    workflow_list_json,
+)
 
-router = APIRouter(prefix="/workflows", tags=["workflows"])
+# FastORJSONResponse encodes UUIDs and datetimes natively in C, skipping the
+# stdlib json + jsonable_encoder pipeline on every response
+router = APIRouter(
+    prefix="/workflows",
+    tags=["workflows"],
+    default_response_class=FastORJSONResponse,
+)
 
+# Above this many items, serialization runs in a worker thread so a large
+# response body doesn't stall the event loop for other requests
+_SERIALIZE_OFFLOAD_THRESHOLD = 50
 
-@router.post("", response_model=WorkflowResponse, status_code=status.HTTP_201_CREATED)
+
+@router.post(
+    "",
+    response_model=WorkflowResponse,
+    status_code=status.HTTP_201_CREATED,
+    openapi_extra={
+        "requestBody": {
+            "content": {
+                "application/json": {"schema": WorkflowCreate.model_json_schema()}
+            },
+            "required": True,
+        }
+    },
+)
 async def create_workflow(
-    payload: WorkflowCreate,
+    request: Request,
     service: WorkflowService = Depends(get_workflow_service),
 ) -> WorkflowResponse:
-    """Create a new workflow with tasks."""
+    """Create a new workflow with tasks.
+
+    Parses the raw body with model_validate_json so pydantic-core decodes
+    the bytes in a single pass instead of stdlib json feeding a dict back
+    into validation; large task_payloads lists benefit the most.
+    """
     try:
-        workflow = await service.create_workflow(
-            name=payload.name,
-            description=payload.description,
-            task_payloads=payload.task_payloads,
-            metadata=payload.metadata,
-        )
-        return WorkflowResponse.from_domain(workflow)
-    except DomainError as e:
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
-
-
-@router.get("", response_model=list[WorkflowResponse])
+        payload = WorkflowCreate.model_validate_json(await request.body())
+    except ValidationError as exc:
+        raise RequestValidationError(exc.errors()) from exc
+    workflow = await service.create_workflow(
+        name=payload.name,
+        description=payload.description,
+        task_payloads=payload.task_payloads,
+        metadata=payload.metadata,
+    )
+    return WorkflowResponse.from_domain(workflow)
+
+
+# GET routes document their schema via `responses` instead of
+# `response_model`: the model still shows up in OpenAPI, but FastAPI never
+# builds the response-validation machinery for these endpoints
+@router.get("", responses={200: {"model": list[WorkflowResponse]}})
 async def list_workflows(
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
-    service: WorkflowService = Depends(get_workflow_service),
-) -> list[WorkflowResponse]:
-    """List all workflows."""
+    service: WorkflowService = Depends(get_workflow_read_service),
+) -> Response:
+    """List all workflows.
+
+    The page is converted and serialized by a single module-level
+    TypeAdapter and returned as raw bytes, so FastAPI skips the
+    jsonable_encoder pass over every row; response_model is kept for the
+    OpenAPI schema.
+    """
     workflows = await service.list_workflows(skip=skip, limit=limit)
-    return [WorkflowResponse.from_domain(w) for w in workflows]
+    if len(workflows) > _SERIALIZE_OFFLOAD_THRESHOLD:
+        body = await asyncio.to_thread(workflow_list_json, workflows)
+    else:
+        body = workflow_list_json(workflows)
+    return Response(content=body, media_type="application/json")
 
 
-@router.get("/{workflow_id}", response_model=WorkflowResponse)
+@router.get("/{workflow_id}", responses={200: {"model": WorkflowResponse}})
 async def get_workflow(
     workflow_id: UUID,
-    service: WorkflowService = Depends(get_workflow_service),
-) -> WorkflowResponse:
+    service: WorkflowService = Depends(get_workflow_read_service),
+) -> FastORJSONResponse:
     """Get workflow by ID."""
-    try:
-        workflow = await service.get_workflow(workflow_id)
-        return WorkflowResponse.from_domain(workflow)
-    except ResourceNotFound as e:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    workflow = await service.get_workflow(workflow_id)
+    return FastORJSONResponse(WorkflowResponse.from_domain(workflow).model_dump())
 
 
-@router.get("/{workflow_id}/tasks", response_model=WorkflowWithTasks)
+@router.get("/{workflow_id}/tasks", responses={200: {"model": WorkflowWithTasks}})
 async def get_workflow_with_tasks(
     workflow_id: UUID,
-    service: WorkflowService = Depends(get_workflow_service),
-) -> WorkflowWithTasks:
-    """Get workflow with all its tasks."""
-    try:
-        workflow, tasks = await service.get_workflow_with_tasks(workflow_id)
-        return WorkflowWithTasks(
-            workflow=WorkflowResponse.from_domain(workflow),
-            tasks=[TaskResponse.from_domain(t) for t in tasks],
-        )
-    except ResourceNotFound as e:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    service: WorkflowService = Depends(get_workflow_read_service),
+) -> Response:
+    """Get workflow with all its tasks.
+
+    Skips the response_model re-validation pass; with large workflows the
+    embedded task list dominates serialization cost.
+    """
+    workflow, tasks = await service.get_workflow_with_tasks(workflow_id)
+    payload = {
+        "workflow": WorkflowResponse.from_domain(workflow).model_dump(),
+        "tasks": [TaskResponse.from_domain(t).model_dump() for t in tasks],
+    }
+    if len(tasks) > _SERIALIZE_OFFLOAD_THRESHOLD:
+        body = await asyncio.to_thread(orjson.dumps, payload)
+        return Response(content=body, media_type="application/json")
+    return FastORJSONResponse(payload)
 
 
 @router.post("/{workflow_id}/start", response_model=WorkflowResponse)
 async def start_workflow(
     workflow_id: UUID,
-    service: WorkflowService = Depends(get_workflow_service),
+    service: WorkflowService = Depends(get_workflow_write_service),
 ) -> WorkflowResponse:
     """Start workflow execution."""
-    try:
-        await service.start_workflow(workflow_id)
-        workflow = await service.get_workflow(workflow_id)
-        return WorkflowResponse.from_domain(workflow)
-    except ResourceNotFound as e:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
-    except DomainError as e:
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    workflow = await service.start_workflow(workflow_id)
+    return WorkflowResponse.from_domain(workflow)
 
 
 @router.delete("/{workflow_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_workflow(
     workflow_id: UUID,
-    service: WorkflowService = Depends(get_workflow_service),
+    service: WorkflowService = Depends(get_workflow_write_service),
 ) -> None:
     """Delete a workflow."""
-    try:
-        await service.delete_workflow(workflow_id)
-    except ResourceNotFound as e:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    await service.delete_workflow(workflow_id)
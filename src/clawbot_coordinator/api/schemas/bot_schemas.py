@@ -8,7 +8,7 @@ from datetime import datetime
 from typing import Any
 from uuid import UUID
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 
 from ...domain.models.bot import Bot, BotStatus
 
@@ -61,7 +61,10 @@ class BotResponse(BaseModel):
         Returns:
             BotResponse DTO
         """
-        return cls(
+        # model_construct skips validation: the domain model already
+        # validated every field, so re-running the validators here is pure
+        # overhead on the hot read path
+        return cls.model_construct(
             id=bot.id,
             name=bot.name,
             capabilities=bot.capabilities,
@@ -88,35 +91,48 @@ class BotResponse(BaseModel):
     }
 
 
+# Validates a whole page in one pydantic-core pass instead of re-entering
+# the validation machinery once per item via from_domain
+_BOT_LIST_ADAPTER: TypeAdapter[list[BotResponse]] = TypeAdapter(list[BotResponse])
+
+
+def bot_list_from_domain(bots: list[Bot]) -> list[BotResponse]:
+    """Convert a list of Bot domain models to DTOs in a single bulk pass."""
+    return _BOT_LIST_ADAPTER.validate_python(bots, from_attributes=True)
+
+
 class BotList(BaseModel):
-    """Response schema for paginated bot list."""
+    """Response schema for cursor-paginated bot list."""
 
     items: list[BotResponse]
     total: int
-    skip: int
     limit: int
+    next_cursor: datetime | None = None
 
     @classmethod
     def from_domain_list(
-        cls, bots: list[Bot], total: int, skip: int, limit: int
+        cls, bots: list[Bot], total: int, limit: int
     ) -> "BotList":
         """
         Convert list of domain models to paginated response.
 
+        Computes next_cursor from the last item's created_at so clients
+        can fetch the following page with `?cursor=<next_cursor>`.
+
         Args:
-            bots: List of Bot domain models
+            bots: List of Bot domain models (ordered by created_at descending)
             total: Total count of bots (for pagination)
-            skip: Number of items skipped
             limit: Maximum items per page
 
         Returns:
             BotList DTO
         """
+        next_cursor = bots[-1].created_at if len(bots) == limit else None
         return cls(
-            items=[BotResponse.from_domain(bot) for bot in bots],
+            items=bot_list_from_domain(bots),
             total=total,
-            skip=skip,
             limit=limit,
+            next_cursor=next_cursor,
         )
 
 
@@ -7,7 +7,7 @@ from datetime import datetime
 from typing import Any
 from uuid import UUID
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 
 from ...domain.models.task import Task, TaskStatus
 
@@ -31,6 +31,13 @@ class TaskAssign(BaseModel):
     bot_id: UUID = Field(..., description="Bot to assign task to")
 
 
+class TaskClaim(BaseModel):
+    """Request schema for atomically claiming pending tasks."""
+
+    bot_id: UUID = Field(..., description="Bot claiming the tasks")
+    limit: int = Field(default=10, ge=1, le=100, description="Maximum tasks to claim")
+
+
 class TaskResult(BaseModel):
     """Request schema for task completion or failure."""
 
@@ -64,7 +71,9 @@ class TaskResponse(BaseModel):
         Returns:
             TaskResponse DTO
         """
-        return cls(
+        # Fields come straight from the validated domain model, so skip
+        # pydantic validation entirely
+        return cls.model_construct(
             id=task.id,
             workflow_id=task.workflow_id,
             bot_id=task.bot_id,
@@ -99,35 +108,48 @@ class TaskResponse(BaseModel):
     }
 
 
+# Validates a whole page in one pydantic-core pass instead of re-entering
+# the validation machinery once per item via from_domain
+_TASK_LIST_ADAPTER: TypeAdapter[list[TaskResponse]] = TypeAdapter(list[TaskResponse])
+
+
+def task_list_from_domain(tasks: list[Task]) -> list[TaskResponse]:
+    """Convert a list of Task domain models to DTOs in a single bulk pass."""
+    return _TASK_LIST_ADAPTER.validate_python(tasks, from_attributes=True)
+
+
 class TaskList(BaseModel):
-    """Response schema for paginated task list."""
+    """Response schema for cursor-paginated task list."""
 
     items: list[TaskResponse]
     total: int
-    skip: int
     limit: int
+    next_cursor: datetime | None = None
 
     @classmethod
     def from_domain_list(
-        cls, tasks: list[Task], total: int, skip: int, limit: int
+        cls, tasks: list[Task], total: int, limit: int
     ) -> "TaskList":
         """
         Convert list of domain models to paginated response.
 
+        Computes next_cursor from the last item's created_at so clients
+        can fetch the following page with `?cursor=<next_cursor>`.
+
         Args:
-            tasks: List of Task domain models
+            tasks: List of Task domain models (ordered by created_at descending)
             total: Total count of tasks
-            skip: Number of items skipped
             limit: Maximum items per page
 
         Returns:
             TaskList DTO
         """
+        next_cursor = tasks[-1].created_at if len(tasks) == limit else None
         return cls(
-            items=[TaskResponse.from_domain(task) for task in tasks],
+            items=task_list_from_domain(tasks),
             total=total,
-            skip=skip,
             limit=limit,
+            next_cursor=next_cursor,
         )
 
 
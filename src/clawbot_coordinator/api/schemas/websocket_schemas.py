@@ -0,0 +1,21 @@
+"""API schemas for WebSocket support endpoints."""
+from uuid import UUID
+
+from pydantic import BaseModel, Field
+
+
+class TaskAssignmentItem(BaseModel):
+    """A single task-to-bot assignment to broadcast."""
+
+    task_id: UUID = Field(..., description="Task to broadcast")
+    bot_id: UUID = Field(..., description="Bot to notify via WebSocket")
+
+
+class BroadcastBatchRequest(BaseModel):
+    """Request schema for broadcasting a batch of task assignments."""
+
+    assignments: list[TaskAssignmentItem] = Field(
+        ...,
+        min_length=1,
+        description="Assignments to broadcast",
+    )
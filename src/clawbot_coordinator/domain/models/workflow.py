@@ -6,7 +6,7 @@ This is a pure domain model using Pydantic - no SQLAlchemy dependencies.
 """
 from datetime import datetime, timezone
 from enum import Enum
-from typing import Any
+from typing import Any, Iterable
 from uuid import UUID, uuid4
 
 from pydantic import BaseModel, ConfigDict, Field
@@ -14,6 +14,12 @@ from pydantic import BaseModel, ConfigDict, Field
 from ...exceptions import InvalidStateTransition
 
 
+def _utcnow() -> datetime:
+    """Timestamp default factory; a named function avoids rebuilding a
+    lambda closure and the timezone attribute lookup per instantiation."""
+    return datetime.now(timezone.utc)
+
+
 class WorkflowStatus(str, Enum):
     """Valid states for a workflow."""
 
@@ -24,6 +30,13 @@ class WorkflowStatus(str, Enum):
     CANCELLED = "cancelled"
 
 
+# Terminal states as a module-level frozenset: is_terminal is a single
+# hash probe instead of rebuilding a tuple and walking it per call
+_TERMINAL_WORKFLOW_STATUSES: frozenset[WorkflowStatus] = frozenset(
+    {WorkflowStatus.COMPLETED, WorkflowStatus.FAILED, WorkflowStatus.CANCELLED}
+)
+
+
 class Workflow(BaseModel):
     """
     Workflow domain model representing an orchestrated sequence of tasks.
@@ -39,17 +52,20 @@ class Workflow(BaseModel):
     name: str = Field(..., min_length=1, max_length=255, description="Workflow name")
     description: str = Field(default="", description="Workflow description")
     status: WorkflowStatus = Field(default=WorkflowStatus.PENDING)
-    task_ids: list[UUID] = Field(default_factory=list, description="Ordered list of task IDs")
+    task_ids: tuple[UUID, ...] = Field(
+        default_factory=tuple, description="Ordered task IDs"
+    )
     metadata: dict[str, Any] = Field(default_factory=dict, description="Arbitrary metadata")
 
-    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    created_at: datetime = Field(default_factory=_utcnow)
     started_at: datetime | None = Field(default=None)
     completed_at: datetime | None = Field(default=None)
-    updated_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    updated_at: datetime = Field(default_factory=_utcnow)
 
-    model_config = ConfigDict(
-        validate_assignment=True,
-    )
+    # No validate_assignment: mutation happens only inside the transition
+    # methods, which write well-typed values; per-assignment validation on
+    # the hot state-machine paths was pure overhead
+    model_config = ConfigDict()
 
     def start(self) -> None:
         """
@@ -67,9 +83,10 @@ class Workflow(BaseModel):
                 attempted_action="start",
             )
 
+        now = _utcnow()
         self.status = WorkflowStatus.IN_PROGRESS
-        self.started_at = datetime.now(timezone.utc)
-        self.updated_at = datetime.now(timezone.utc)
+        self.started_at = now
+        self.updated_at = now
 
     def complete(self) -> None:
         """
@@ -87,9 +104,10 @@ class Workflow(BaseModel):
                 attempted_action="complete",
             )
 
+        now = _utcnow()
         self.status = WorkflowStatus.COMPLETED
-        self.completed_at = datetime.now(timezone.utc)
-        self.updated_at = datetime.now(timezone.utc)
+        self.completed_at = now
+        self.updated_at = now
 
     def fail(self) -> None:
         """
@@ -107,9 +125,10 @@ class Workflow(BaseModel):
                 attempted_action="fail",
             )
 
+        now = _utcnow()
         self.status = WorkflowStatus.FAILED
-        self.completed_at = datetime.now(timezone.utc)
-        self.updated_at = datetime.now(timezone.utc)
+        self.completed_at = now
+        self.updated_at = now
 
     def cancel(self) -> None:
         """
@@ -118,22 +137,25 @@ class Workflow(BaseModel):
         Transition: any → cancelled
         Can be called from any state.
         """
+        now = _utcnow()
         self.status = WorkflowStatus.CANCELLED
         if not self.completed_at:
-            self.completed_at = datetime.now(timezone.utc)
-        self.updated_at = datetime.now(timezone.utc)
+            self.completed_at = now
+        self.updated_at = now
 
-    def add_task(self, task_id: UUID) -> None:
+    def add_tasks(self, task_ids: Iterable[UUID]) -> None:
         """
-        Add a task to the workflow.
+        Append tasks to the workflow.
 
-        Tasks are executed in the order they are added.
+        Tasks are executed in the order they are added. task_ids is a tuple
+        (smaller than a list, never overallocates), so additions go through
+        this method, which rebuilds it once per batch rather than per task.
 
         Args:
-            task_id: UUID of the task to add
+            task_ids: UUIDs of the tasks to add, in execution order
         """
-        self.task_ids.append(task_id)
-        self.updated_at = datetime.now(timezone.utc)
+        self.task_ids = self.task_ids + tuple(task_ids)
+        self.updated_at = _utcnow()
 
     def has_tasks(self) -> bool:
         """
@@ -168,11 +190,7 @@ class Workflow(BaseModel):
         Returns:
             True if workflow is completed, failed, or cancelled
         """
-        return self.status in (
-            WorkflowStatus.COMPLETED,
-            WorkflowStatus.FAILED,
-            WorkflowStatus.CANCELLED,
-        )
+        return self.status in _TERMINAL_WORKFLOW_STATUSES
 
     def duration(self) -> float | None:
         """
@@ -189,4 +207,4 @@ class Workflow(BaseModel):
             return (self.completed_at - self.started_at).total_seconds()
 
         # Workflow still in progress, return elapsed time
-        return (datetime.now(timezone.utc) - self.started_at).total_seconds()
+        return (_utcnow() - self.started_at).total_seconds()
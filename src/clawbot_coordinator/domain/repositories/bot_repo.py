@@ -7,9 +7,11 @@ interacts with persistence. Infrastructure layer provides concrete implementatio
 See CLAUDE.md Protocol 3 for layer isolation rules.
 """
 from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Any, AsyncIterator
 from uuid import UUID
 
-from ..models.bot import Bot
+from ..models.bot import Bot, BotStatus
 
 
 class BotRepository(ABC):
@@ -40,6 +42,19 @@ class BotRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    async def save_many(self, bots: list[Bot]) -> None:
+        """
+        Persist a batch of bots (insert or update) in a single round-trip.
+
+        Covers both bulk inserts (fleet registration) and bulk updates
+        (timeout sweeps freeing many bots at once).
+
+        Args:
+            bots: Bot domain models to persist
+        """
+        pass
+
     @abstractmethod
     async def delete(self, bot_id: UUID) -> bool:
         """
@@ -67,6 +82,145 @@ class BotRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    async def get_page(
+        self, cursor: datetime | None = None, limit: int = 100
+    ) -> list[Bot]:
+        """
+        Fetch a page of bots using keyset (cursor) pagination.
+
+        Unlike OFFSET-based pagination, this is an index range scan with
+        constant cost regardless of how deep the client pages.
+
+        Args:
+            cursor: Fetch bots created strictly before this timestamp
+                (None fetches the newest page)
+            limit: Maximum number of records to return
+
+        Returns:
+            List of Bot domain models ordered by created_at descending
+        """
+        pass
+
+    @abstractmethod
+    def iter_all(self, batch_size: int = 500) -> AsyncIterator[Bot]:
+        """
+        Stream all bots without materializing the full list.
+
+        Implementations should fetch rows incrementally so peak memory is
+        bounded by batch_size, not table size; intended for exports and
+        sweeps that get_all's pagination does not fit.
+
+        Args:
+            batch_size: Number of rows to fetch per round-trip
+
+        Returns:
+            Async iterator over bots ordered by created_at descending
+        """
+        pass
+
+    @abstractmethod
+    async def estimate_count(self) -> int:
+        """
+        Estimate the total number of bots.
+
+        Implementations may return a planner estimate rather than an exact
+        COUNT(*) to keep list responses O(page) instead of O(table).
+
+        Returns:
+            Approximate number of bots
+        """
+        pass
+
+    @abstractmethod
+    async def mark_offline(self, bot_id: UUID) -> bool:
+        """
+        Set a bot's status to offline with a single UPDATE.
+
+        Skips the read-modify-write cycle, so disconnect cleanup costs one
+        round-trip instead of a SELECT followed by an UPDATE.
+
+        Args:
+            bot_id: Unique identifier of the bot
+
+        Returns:
+            True if a bot was updated, False if not found
+        """
+        pass
+
+    @abstractmethod
+    async def touch_heartbeat(self, bot_id: UUID) -> Bot | None:
+        """
+        Process a heartbeat as a single atomic UPDATE ... RETURNING.
+
+        Updates last_seen and flips offline bots online (busy bots stay
+        busy) in one statement. Heartbeats are the highest-frequency call
+        in the system, so this replaces the get-mutate-save cycle's three
+        round-trips with one.
+
+        Args:
+            bot_id: Unique identifier of the bot
+
+        Returns:
+            Updated Bot, or None if the bot does not exist
+        """
+        pass
+
+    @abstractmethod
+    async def touch_heartbeats(self, bot_ids: list[UUID]) -> None:
+        """
+        Apply the heartbeat transition to many bots in one UPDATE.
+
+        Batch variant of touch_heartbeat for debounced heartbeat paths:
+        updates last_seen and flips offline bots online for every given ID
+        in a single statement. Unknown IDs are silently skipped.
+
+        Args:
+            bot_ids: Unique identifiers of the bots to touch
+        """
+        pass
+
+    @abstractmethod
+    async def update_status_returning(
+        self,
+        bot_id: UUID,
+        new_status: str,
+        allowed_prev_statuses: list[str] | None = None,
+        extra_values: dict[str, Any] | None = None,
+    ) -> Bot | None:
+        """
+        Atomically transition a bot's status and return the updated bot.
+
+        Same fused SELECT-check-UPDATE shape as the task repository: the
+        WHERE clause enforces the state-machine precondition, so the happy
+        path costs one round-trip and concurrent callers cannot race
+        between check and write.
+
+        Args:
+            bot_id: Unique identifier of the bot
+            new_status: Status to transition into
+            allowed_prev_statuses: Statuses the transition is valid from
+                (None allows any)
+            extra_values: Additional columns to set (e.g. last_seen)
+
+        Returns:
+            Updated Bot, or None if no row matched (missing or wrong state)
+        """
+        pass
+
+    @abstractmethod
+    async def get_by_ids(self, bot_ids: list[UUID]) -> list[Bot]:
+        """
+        Fetch multiple bots by ID in a single query.
+
+        Args:
+            bot_ids: IDs of the bots to fetch
+
+        Returns:
+            List of found bots (missing IDs are silently omitted)
+        """
+        pass
+
     @abstractmethod
     async def get_by_capability(self, capability: str) -> list[Bot]:
         """
@@ -81,12 +235,15 @@ class BotRepository(ABC):
         pass
 
     @abstractmethod
-    async def get_by_status(self, status: str) -> list[Bot]:
+    async def get_by_status(self, status: BotStatus) -> list[Bot]:
         """
         Find all bots with a specific status.
 
+        Takes the enum rather than a raw string so mistyped statuses fail
+        at the call site instead of silently matching nothing.
+
         Args:
-            status: Bot status ("online", "offline", "busy")
+            status: Bot status to filter by
 
         Returns:
             List of bots with the specified status
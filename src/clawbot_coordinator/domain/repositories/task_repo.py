@@ -5,9 +5,11 @@ Abstract interface for task persistence operations.
 See CLAUDE.md Protocol 3 for layer isolation rules.
 """
 from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Any, AsyncIterator, Collection
 from uuid import UUID
 
-from ..models.task import Task
+from ..models.task import Task, TaskStatus
 
 
 class TaskRepository(ABC):
@@ -38,6 +40,19 @@ class TaskRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    async def save_many(self, tasks: list[Task]) -> None:
+        """
+        Persist a batch of tasks (insert or update) in a single round-trip.
+
+        Covers both bulk inserts (workflow creation) and bulk updates
+        (timeout sweeps failing many tasks at once).
+
+        Args:
+            tasks: Task domain models to persist
+        """
+        pass
+
     @abstractmethod
     async def delete(self, task_id: UUID) -> bool:
         """
@@ -51,6 +66,35 @@ class TaskRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    async def update_status_returning(
+        self,
+        task_id: UUID,
+        new_status: str,
+        allowed_prev_statuses: list[str] | None = None,
+        extra_values: dict[str, Any] | None = None,
+    ) -> Task | None:
+        """
+        Atomically transition a task's status and return the updated task.
+
+        Fuses the SELECT-check-UPDATE cycle into a single statement whose
+        WHERE clause enforces the state-machine precondition, eliminating
+        both a round-trip and the read-modify-write race between concurrent
+        callers.
+
+        Args:
+            task_id: Unique identifier of the task
+            new_status: Status to transition into
+            allowed_prev_statuses: Statuses the transition is valid from
+                (None allows any, e.g. for cancellation)
+            extra_values: Additional columns to set (timestamps, bot_id, result)
+
+        Returns:
+            Updated Task, or None if the task is missing or the precondition
+            failed
+        """
+        pass
+
     @abstractmethod
     async def get_all(self, skip: int = 0, limit: int = 100) -> list[Task]:
         """
@@ -65,6 +109,69 @@ class TaskRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    async def get_page(
+        self, cursor: datetime | None = None, limit: int = 100
+    ) -> list[Task]:
+        """
+        Fetch a page of tasks using keyset (cursor) pagination.
+
+        Unlike OFFSET-based pagination, this is an index range scan with
+        constant cost regardless of how deep the client pages.
+
+        Args:
+            cursor: Fetch tasks created strictly before this timestamp
+                (None fetches the newest page)
+            limit: Maximum number of records to return
+
+        Returns:
+            List of Task domain models ordered by created_at descending
+        """
+        pass
+
+    @abstractmethod
+    def iter_all(self, batch_size: int = 500) -> AsyncIterator[Task]:
+        """
+        Stream all tasks without materializing the full list.
+
+        Implementations should fetch rows incrementally so peak memory is
+        bounded by batch_size, not table size; intended for exports and
+        sweeps that get_all's pagination does not fit.
+
+        Args:
+            batch_size: Number of rows to fetch per round-trip
+
+        Returns:
+            Async iterator over tasks ordered by created_at descending
+        """
+        pass
+
+    @abstractmethod
+    async def get_by_ids(self, task_ids: list[UUID]) -> list[Task]:
+        """
+        Fetch multiple tasks by ID in a single query.
+
+        Args:
+            task_ids: Task identifiers to fetch
+
+        Returns:
+            List of found tasks (missing IDs are silently skipped)
+        """
+        pass
+
+    @abstractmethod
+    async def estimate_count(self) -> int:
+        """
+        Estimate the total number of tasks.
+
+        Implementations may return a planner estimate rather than an exact
+        COUNT(*) to keep list responses O(page) instead of O(table).
+
+        Returns:
+            Approximate number of tasks
+        """
+        pass
+
     @abstractmethod
     async def get_by_workflow(self, workflow_id: UUID) -> list[Task]:
         """
@@ -79,12 +186,31 @@ class TaskRepository(ABC):
         pass
 
     @abstractmethod
-    async def get_by_status(self, status: str) -> list[Task]:
+    def iter_by_workflow(self, workflow_id: UUID) -> AsyncIterator[Task]:
+        """
+        Stream tasks belonging to a workflow without materializing the list.
+
+        Implementations should fetch rows incrementally so peak memory stays
+        bounded by the batch size, not the workflow size.
+
+        Args:
+            workflow_id: Workflow identifier
+
+        Returns:
+            Async iterator over tasks in the workflow, ordered by created_at
+        """
+        pass
+
+    @abstractmethod
+    async def get_by_status(self, status: TaskStatus) -> list[Task]:
         """
         Find all tasks with a specific status.
 
+        Takes the enum rather than a raw string so mistyped statuses fail
+        at the call site instead of silently matching nothing.
+
         Args:
-            status: Task status ("pending", "assigned", "in_progress", etc.)
+            status: Task status to filter by
 
         Returns:
             List of tasks with the specified status
@@ -104,6 +230,19 @@ class TaskRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    def iter_by_bot(self, bot_id: UUID) -> AsyncIterator[Task]:
+        """
+        Stream tasks assigned to a bot without materializing the list.
+
+        Args:
+            bot_id: Bot identifier
+
+        Returns:
+            Async iterator over the bot's tasks, newest first
+        """
+        pass
+
     @abstractmethod
     async def get_pending_tasks(self, limit: int = 10) -> list[Task]:
         """
@@ -118,14 +257,67 @@ class TaskRepository(ABC):
         pass
 
     @abstractmethod
-    async def get_timeout_candidates(self) -> list[Task]:
+    async def claim_pending_tasks(self, bot_id: UUID, limit: int = 10) -> list[Task]:
+        """
+        Atomically claim up to `limit` pending tasks for a bot.
+
+        Selects the oldest pending tasks and transitions them to assigned in
+        the same statement, so concurrent schedulers never claim the same
+        task twice. Implementations should skip rows locked by other
+        claimers rather than blocking on them.
+
+        Args:
+            bot_id: Bot the claimed tasks are assigned to
+            limit: Maximum number of tasks to claim
+
+        Returns:
+            List of claimed tasks, oldest first (may be empty)
+        """
+        pass
+
+    @abstractmethod
+    async def get_timeout_candidates(self, now: datetime) -> list[Task]:
         """
-        Find tasks that may have timed out.
+        Find in-progress tasks that have exceeded their timeout as of `now`.
 
-        Returns tasks that are in-progress and have exceeded their timeout.
+        Implementations should evaluate the timeout predicate in the query
+        itself (started_at + timeout_seconds < now), so the sweep returns
+        only actual timeouts instead of reconstructing every in-progress
+        task for a Python-side filter.
+
+        Args:
+            now: Reference time for the timeout comparison
+
+        Returns:
+            List of timed-out tasks needing timeout handling
+        """
+        pass
+
+    @abstractmethod
+    async def find_tasks(
+        self,
+        *,
+        workflow_id: UUID | None = None,
+        bot_id: UUID | None = None,
+        statuses: Collection[TaskStatus] | None = None,
+        limit: int | None = None,
+    ) -> list[Task]:
+        """
+        Find tasks matching any combination of filters in one query.
+
+        Generalizes get_by_workflow, get_by_bot, and get_by_status: callers
+        that need a joint filter (e.g. active tasks for a bot within a
+        workflow) get a single round-trip with the predicates pushed into
+        SQL instead of fetching per-filter lists and intersecting in Python.
+
+        Args:
+            workflow_id: Restrict to tasks in this workflow
+            bot_id: Restrict to tasks assigned to this bot
+            statuses: Restrict to tasks in any of these statuses
+            limit: Maximum number of tasks to return (None for no limit)
 
         Returns:
-            List of tasks that may need timeout handling
+            List of matching tasks ordered by creation time
         """
         pass
 
@@ -4,9 +4,10 @@ Workflow repository interface (Port).
 Abstract interface for workflow persistence operations.
 """
 from abc import ABC, abstractmethod
+from typing import Any, AsyncIterator
 from uuid import UUID
 
-from ..models.workflow import Workflow
+from ..models.workflow import Workflow, WorkflowStatus
 
 
 class WorkflowRepository(ABC):
@@ -35,6 +36,19 @@ class WorkflowRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    async def save_many(self, workflows: list[Workflow]) -> None:
+        """
+        Insert a batch of new workflows in a single round-trip.
+
+        Unlike save, this is insert-only: callers must pass workflows that
+        do not exist yet (e.g. bulk imports).
+
+        Args:
+            workflows: New Workflow domain models to insert
+        """
+        pass
+
     @abstractmethod
     async def delete(self, workflow_id: UUID) -> bool:
         """
@@ -48,6 +62,30 @@ class WorkflowRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    async def update_status_returning(
+        self,
+        workflow_id: UUID,
+        new_status: str,
+        allowed_prev_statuses: list[str] | None = None,
+        extra_values: dict[str, Any] | None = None,
+    ) -> Workflow | None:
+        """
+        Atomically transition a workflow's status and return the updated workflow.
+
+        Args:
+            workflow_id: Unique identifier of the workflow
+            new_status: Status to transition to
+            allowed_prev_statuses: Statuses the workflow must currently be in,
+                or None to allow the transition from any status
+            extra_values: Additional column values to set (e.g. started_at)
+
+        Returns:
+            Updated Workflow if the transition applied, None if the workflow
+            was missing or not in an allowed status
+        """
+        pass
+
     @abstractmethod
     async def get_all(self, skip: int = 0, limit: int = 100) -> list[Workflow]:
         """
@@ -63,12 +101,32 @@ class WorkflowRepository(ABC):
         pass
 
     @abstractmethod
-    async def get_by_status(self, status: str) -> list[Workflow]:
+    def iter_all(self, batch_size: int = 500) -> AsyncIterator[Workflow]:
+        """
+        Stream all workflows without materializing the full list.
+
+        Implementations should fetch rows incrementally so peak memory is
+        bounded by batch_size, not table size; intended for exports and
+        sweeps that get_all's pagination does not fit.
+
+        Args:
+            batch_size: Number of rows to fetch per round-trip
+
+        Returns:
+            Async iterator over workflows ordered by created_at descending
+        """
+        pass
+
+    @abstractmethod
+    async def get_by_status(self, status: WorkflowStatus) -> list[Workflow]:
         """
         Find all workflows with a specific status.
 
+        Takes the enum rather than a raw string so mistyped statuses fail
+        at the call site instead of silently matching nothing.
+
         Args:
-            status: Workflow status
+            status: Workflow status to filter by
 
         Returns:
             List of workflows with the specified status
@@ -4,12 +4,13 @@ Bot service - business logic for bot management.
 This service coordinates bot registration, heartbeat tracking, and availability management.
 Accepts repository interface for dependency injection (see CLAUDE.md Checkpoint 3).
 """
+from datetime import datetime, timezone
 from typing import Any
 from uuid import UUID
 
-from ..models.bot import Bot
+from ..models.bot import Bot, BotStatus
 from ..repositories.bot_repo import BotRepository
-from ...exceptions import ResourceNotFound
+from ...exceptions import InvalidStateTransition, ResourceNotFound
 
 
 class BotService:
@@ -56,7 +57,7 @@ class BotService:
         await self._repo.save(bot)
         return bot
 
-    async def heartbeat(self, bot_id: UUID) -> None:
+    async def heartbeat(self, bot_id: UUID) -> Bot:
         """
         Process heartbeat from a bot.
 
@@ -66,15 +67,18 @@ class BotService:
         Args:
             bot_id: ID of the bot sending heartbeat
 
+        Returns:
+            Updated Bot instance
+
         Raises:
             ResourceNotFound: If bot with given ID doesn't exist
         """
-        bot = await self._repo.get(bot_id)
+        # Single atomic UPDATE ... RETURNING instead of get-mutate-save;
+        # Bot.heartbeat documents the same transition for in-memory use
+        bot = await self._repo.touch_heartbeat(bot_id)
         if not bot:
             raise ResourceNotFound("Bot", str(bot_id))
-
-        bot.heartbeat()
-        await self._repo.save(bot)
+        return bot
 
     async def get_bot(self, bot_id: UUID) -> Bot:
         """
@@ -106,6 +110,18 @@ class BotService:
         """
         return await self._repo.get_by_capability(capability)
 
+    async def get_bots_by_ids(self, bot_ids: list[UUID]) -> list[Bot]:
+        """
+        Fetch multiple bots by ID in a single query.
+
+        Args:
+            bot_ids: IDs of the bots to fetch
+
+        Returns:
+            List of found bots (missing IDs are silently omitted)
+        """
+        return await self._repo.get_by_ids(bot_ids)
+
     async def get_available_bots(self, capability: str | None = None) -> list[Bot]:
         """
         Get all available (online) bots.
@@ -118,53 +134,102 @@ class BotService:
         """
         return await self._repo.get_available_bots(capability)
 
-    async def mark_bot_busy(self, bot_id: UUID) -> None:
+    async def mark_bot_busy(self, bot_id: UUID) -> Bot:
         """
         Mark a bot as busy (working on a task).
 
         Args:
             bot_id: ID of the bot to mark busy
 
+        Returns:
+            Updated Bot instance
+
         Raises:
             ResourceNotFound: If bot doesn't exist
             InvalidStateTransition: If bot is not online
         """
-        bot = await self._repo.get(bot_id)
-        if not bot:
-            raise ResourceNotFound("Bot", str(bot_id))
+        # Single fused UPDATE ... RETURNING with the online precondition in
+        # the WHERE clause (mirroring Bot.go_busy), instead of loading the
+        # row to check its state. Only the error path re-reads the bot to
+        # distinguish "not found" from "wrong state".
+        bot = await self._repo.update_status_returning(
+            bot_id,
+            BotStatus.BUSY.value,
+            [BotStatus.ONLINE.value],
+        )
+        if bot is not None:
+            return bot
 
-        bot.go_busy()
-        await self._repo.save(bot)
+        existing = await self._repo.get(bot_id)
+        if existing is None:
+            raise ResourceNotFound("Bot", str(bot_id))
+        raise InvalidStateTransition(
+            entity_type="Bot",
+            current_state=existing.status.value,
+            attempted_action="go_busy",
+        )
 
-    async def mark_bot_available(self, bot_id: UUID) -> None:
+    async def mark_bot_available(self, bot_id: UUID) -> Bot:
         """
         Mark a bot as available (online and ready for work).
 
         Args:
             bot_id: ID of the bot to mark available
 
+        Returns:
+            Updated Bot instance
+
         Raises:
             ResourceNotFound: If bot doesn't exist
         """
-        bot = await self._repo.get(bot_id)
+        # go_online is valid from any state, so no status precondition;
+        # one UPDATE ... RETURNING replaces the get-mutate-save cycle
+        bot = await self._repo.update_status_returning(
+            bot_id,
+            BotStatus.ONLINE.value,
+            None,
+            {"last_seen": datetime.now(timezone.utc)},
+        )
         if not bot:
             raise ResourceNotFound("Bot", str(bot_id))
+        return bot
 
-        bot.go_online()
-        await self._repo.save(bot)
+    async def mark_bot_offline(self, bot_id: UUID) -> None:
+        """
+        Mark a bot as offline without a prior fetch.
 
-    async def list_bots(self, skip: int = 0, limit: int = 100) -> list[Bot]:
+        Issues a single UPDATE instead of get/go_offline/save, which keeps
+        disconnect cleanup to one round-trip. A missing bot is a no-op, so
+        this is safe to call from teardown paths.
+
+        Args:
+            bot_id: ID of the bot to mark offline
         """
-        List all bots with pagination.
+        await self._repo.mark_offline(bot_id)
+
+    async def list_bots(
+        self, cursor: datetime | None = None, limit: int = 100
+    ) -> list[Bot]:
+        """
+        List bots using keyset (cursor) pagination.
 
         Args:
-            skip: Number of records to skip
+            cursor: Fetch bots created before this timestamp (None for newest page)
             limit: Maximum number of records to return
 
         Returns:
-            List of bots
+            List of bots ordered by created_at descending
+        """
+        return await self._repo.get_page(cursor=cursor, limit=limit)
+
+    async def count_bots(self) -> int:
+        """
+        Get the (approximate) total number of bots.
+
+        Returns:
+            Estimated bot count suitable for pagination metadata
         """
-        return await self._repo.get_all(skip=skip, limit=limit)
+        return await self._repo.estimate_count()
 
     async def save_bot(self, bot: Bot) -> None:
         """
@@ -4,14 +4,15 @@ Task service - business logic for task management.
 Coordinates task lifecycle, assignment to bots, and workflow integration.
 Accepts repository interfaces for dependency injection (see CLAUDE.md Checkpoint 3).
 """
-from typing import Any
+from datetime import datetime, timezone
+from typing import Any, AsyncIterator
 from uuid import UUID
 
 from ..models.bot import BotStatus
-from ..models.task import Task
+from ..models.task import Task, TaskStatus
 from ..repositories.bot_repo import BotRepository
 from ..repositories.task_repo import TaskRepository
-from ...exceptions import ResourceNotFound
+from ...exceptions import InvalidStateTransition, ResourceNotFound
 
 
 class TaskService:
@@ -60,7 +61,46 @@ class TaskService:
         await self._task_repo.save(task)
         return task
 
-    async def assign_task_to_bot(self, task_id: UUID, bot_id: UUID) -> None:
+    async def _transition_task(
+        self,
+        task_id: UUID,
+        attempted_action: str,
+        new_status: TaskStatus,
+        allowed_prev: list[TaskStatus] | None,
+        extra_values: dict[str, Any] | None = None,
+    ) -> Task:
+        """
+        Run a state transition as one fused UPDATE ... RETURNING.
+
+        The repository enforces the state-machine precondition in the
+        statement itself (mirroring the Task model's transition rules), so
+        the happy path costs one round-trip and concurrent callers cannot
+        race between check and write. Only the error path re-reads the task
+        to distinguish "not found" from "wrong state".
+
+        Raises:
+            ResourceNotFound: If the task doesn't exist
+            InvalidStateTransition: If the task is in a disallowed state
+        """
+        task = await self._task_repo.update_status_returning(
+            task_id,
+            new_status.value,
+            [s.value for s in allowed_prev] if allowed_prev is not None else None,
+            extra_values,
+        )
+        if task is not None:
+            return task
+
+        existing = await self._task_repo.get(task_id)
+        if existing is None:
+            raise ResourceNotFound("Task", str(task_id))
+        raise InvalidStateTransition(
+            entity_type="Task",
+            current_state=existing.status.value,
+            attempted_action=attempted_action,
+        )
+
+    async def assign_task_to_bot(self, task_id: UUID, bot_id: UUID) -> Task:
         """
         Assign task to a bot.
 
@@ -68,40 +108,51 @@ class TaskService:
             task_id: ID of task to assign
             bot_id: ID of bot to assign to
 
+        Returns:
+            Updated Task instance
+
         Raises:
             ResourceNotFound: If task or bot doesn't exist
             InvalidStateTransition: If task is not pending
         """
-        task = await self._task_repo.get(task_id)
-        if not task:
-            raise ResourceNotFound("Task", str(task_id))
-
+        # Serial on purpose: both repositories share one AsyncSession (see
+        # dependencies.py), which does not allow concurrent statements, and
+        # the bot-existence check must gate the transition anyway
         bot = await self._bot_repo.get(bot_id)
         if not bot:
             raise ResourceNotFound("Bot", str(bot_id))
 
-        task.assign_to(bot_id)
-        await self._task_repo.save(task)
+        return await self._transition_task(
+            task_id,
+            "assign_to",
+            TaskStatus.ASSIGNED,
+            [TaskStatus.PENDING],
+            {"bot_id": bot_id, "assigned_at": datetime.now(timezone.utc)},
+        )
 
-    async def start_task(self, task_id: UUID) -> None:
+    async def start_task(self, task_id: UUID) -> Task:
         """
         Start task execution.
 
         Args:
             task_id: ID of task to start
 
+        Returns:
+            Updated Task instance
+
         Raises:
             ResourceNotFound: If task doesn't exist
             InvalidStateTransition: If task is not assigned
         """
-        task = await self._task_repo.get(task_id)
-        if not task:
-            raise ResourceNotFound("Task", str(task_id))
-
-        task.start()
-        await self._task_repo.save(task)
+        return await self._transition_task(
+            task_id,
+            "start",
+            TaskStatus.IN_PROGRESS,
+            [TaskStatus.ASSIGNED],
+            {"started_at": datetime.now(timezone.utc)},
+        )
 
-    async def complete_task(self, task_id: UUID, result: dict[str, Any]) -> None:
+    async def complete_task(self, task_id: UUID, result: dict[str, Any]) -> Task:
         """
         Mark task as completed.
 
@@ -111,16 +162,20 @@ class TaskService:
             task_id: ID of task to complete
             result: Task execution result
 
+        Returns:
+            Updated Task instance
+
         Raises:
             ResourceNotFound: If task doesn't exist
             InvalidStateTransition: If task is not in progress
         """
-        task = await self._task_repo.get(task_id)
-        if not task:
-            raise ResourceNotFound("Task", str(task_id))
-
-        task.complete(result)
-        await self._task_repo.save(task)
+        task = await self._transition_task(
+            task_id,
+            "complete",
+            TaskStatus.COMPLETED,
+            [TaskStatus.IN_PROGRESS],
+            {"result": result, "completed_at": datetime.now(timezone.utc)},
+        )
 
         # Free the bot if task was assigned
         if task.bot_id:
@@ -129,7 +184,9 @@ class TaskService:
                 bot.go_online()  # Mark bot available again
                 await self._bot_repo.save(bot)
 
-    async def fail_task(self, task_id: UUID, error: dict[str, Any]) -> None:
+        return task
+
+    async def fail_task(self, task_id: UUID, error: dict[str, Any]) -> Task:
         """
         Mark task as failed.
 
@@ -139,16 +196,20 @@ class TaskService:
             task_id: ID of task to fail
             error: Error information
 
+        Returns:
+            Updated Task instance
+
         Raises:
             ResourceNotFound: If task doesn't exist
             InvalidStateTransition: If task is not in progress
         """
-        task = await self._task_repo.get(task_id)
-        if not task:
-            raise ResourceNotFound("Task", str(task_id))
-
-        task.fail(error)
-        await self._task_repo.save(task)
+        task = await self._transition_task(
+            task_id,
+            "fail",
+            TaskStatus.FAILED,
+            [TaskStatus.IN_PROGRESS],
+            {"result": error, "completed_at": datetime.now(timezone.utc)},
+        )
 
         # Free the bot if task was assigned
         if task.bot_id:
@@ -157,7 +218,9 @@ class TaskService:
                 bot.go_online()
                 await self._bot_repo.save(bot)
 
-    async def cancel_task(self, task_id: UUID) -> None:
+        return task
+
+    async def cancel_task(self, task_id: UUID) -> Task:
         """
         Cancel a task.
 
@@ -166,15 +229,19 @@ class TaskService:
         Args:
             task_id: ID of task to cancel
 
+        Returns:
+            Updated Task instance
+
         Raises:
             ResourceNotFound: If task doesn't exist
         """
-        task = await self._task_repo.get(task_id)
-        if not task:
-            raise ResourceNotFound("Task", str(task_id))
-
-        task.cancel()
-        await self._task_repo.save(task)
+        task = await self._transition_task(
+            task_id,
+            "cancel",
+            TaskStatus.CANCELLED,
+            None,  # cancel is valid from any state
+            {"completed_at": datetime.now(timezone.utc)},
+        )
 
         # Free the bot if task was assigned and bot is busy
         if task.bot_id:
@@ -183,6 +250,8 @@ class TaskService:
                 bot.go_online()
                 await self._bot_repo.save(bot)
 
+        return task
+
     async def get_task(self, task_id: UUID) -> Task:
         """
         Fetch task by ID.
@@ -213,6 +282,29 @@ class TaskService:
         """
         return await self._task_repo.get_pending_tasks(limit)
 
+    async def claim_pending_tasks(self, bot_id: UUID, limit: int = 10) -> list[Task]:
+        """
+        Atomically claim pending tasks for a bot.
+
+        Unlike get_pending_tasks followed by per-task assignment, the claim
+        is one statement and concurrent schedulers receive disjoint sets.
+
+        Args:
+            bot_id: Bot the claimed tasks are assigned to
+            limit: Maximum number of tasks to claim
+
+        Returns:
+            List of claimed tasks, oldest first (may be empty)
+
+        Raises:
+            ResourceNotFound: If the bot doesn't exist
+        """
+        bot = await self._bot_repo.get(bot_id)
+        if not bot:
+            raise ResourceNotFound("Bot", str(bot_id))
+
+        return await self._task_repo.claim_pending_tasks(bot_id, limit)
+
     async def get_tasks_by_workflow(self, workflow_id: UUID) -> list[Task]:
         """
         Get all tasks for a workflow.
@@ -225,6 +317,30 @@ class TaskService:
         """
         return await self._task_repo.get_by_workflow(workflow_id)
 
+    def iter_tasks_by_workflow(self, workflow_id: UUID) -> AsyncIterator[Task]:
+        """
+        Stream tasks for a workflow without materializing the list.
+
+        Args:
+            workflow_id: Workflow ID
+
+        Returns:
+            Async iterator over tasks in the workflow
+        """
+        return self._task_repo.iter_by_workflow(workflow_id)
+
+    async def get_tasks_by_ids(self, task_ids: list[UUID]) -> list[Task]:
+        """
+        Get multiple tasks by ID in one repository round-trip.
+
+        Args:
+            task_ids: Task identifiers to fetch
+
+        Returns:
+            List of found tasks (missing IDs are silently skipped)
+        """
+        return await self._task_repo.get_by_ids(task_ids)
+
     async def get_tasks_by_bot(self, bot_id: UUID) -> list[Task]:
         """
         Get all tasks assigned to a bot.
@@ -237,46 +353,78 @@ class TaskService:
         """
         return await self._task_repo.get_by_bot(bot_id)
 
+    def iter_tasks_by_bot(self, bot_id: UUID) -> AsyncIterator[Task]:
+        """
+        Stream tasks assigned to a bot without materializing the list.
+
+        Args:
+            bot_id: Bot ID
+
+        Returns:
+            Async iterator over the bot's tasks, newest first
+        """
+        return self._task_repo.iter_by_bot(bot_id)
+
     async def handle_timed_out_tasks(self) -> int:
         """
         Handle tasks that have exceeded their timeout.
 
-        Fails timed-out tasks and frees their bots.
+        Fails timed-out tasks and frees their bots. The sweep is batched:
+        one save_many for the failed tasks, one get_by_ids for their bots,
+        one save_many for the freed ones — three round-trips total instead
+        of three per task.
 
         Returns:
             Number of tasks that were failed due to timeout
         """
-        timeout_tasks = await self._task_repo.get_timeout_candidates()
-        failed_count = 0
-
-        for task in timeout_tasks:
-            if task.is_timed_out():
-                # Fail the task
-                task.fail({"error": "Task exceeded timeout", "timeout_seconds": task.timeout_seconds})
-                await self._task_repo.save(task)
-                failed_count += 1
-
-                # Free the bot
-                if task.bot_id:
-                    bot = await self._bot_repo.get(task.bot_id)
-                    if bot and bot.status == BotStatus.BUSY:
-                        bot.go_online()
-                        await self._bot_repo.save(bot)
+        # The repository evaluates the timeout predicate in SQL, so every
+        # returned task is a true positive; no Python-side re-check needed
+        failed = await self._task_repo.get_timeout_candidates(
+            datetime.now(timezone.utc)
+        )
+        if not failed:
+            return 0
+
+        for task in failed:
+            task.fail(
+                {"error": "Task exceeded timeout", "timeout_seconds": task.timeout_seconds}
+            )
+        await self._task_repo.save_many(failed)
+
+        bot_ids = list({task.bot_id for task in failed if task.bot_id})
+        if bot_ids:
+            bots = await self._bot_repo.get_by_ids(bot_ids)
+            freed = [bot for bot in bots if bot.status == BotStatus.BUSY]
+            for bot in freed:
+                bot.go_online()
+            if freed:
+                await self._bot_repo.save_many(freed)
 
-        return failed_count
+        return len(failed)
 
-    async def list_tasks(self, skip: int = 0, limit: int = 100) -> list[Task]:
+    async def list_tasks(
+        self, cursor: datetime | None = None, limit: int = 100
+    ) -> list[Task]:
         """
-        List all tasks with pagination.
+        List tasks using keyset (cursor) pagination.
 
         Args:
-            skip: Number of records to skip
+            cursor: Fetch tasks created before this timestamp (None for newest page)
             limit: Maximum number of records to return
 
         Returns:
-            List of tasks
+            List of tasks ordered by created_at descending
+        """
+        return await self._task_repo.get_page(cursor=cursor, limit=limit)
+
+    async def count_tasks(self) -> int:
+        """
+        Get the (approximate) total number of tasks.
+
+        Returns:
+            Estimated task count suitable for pagination metadata
         """
-        return await self._task_repo.get_all(skip=skip, limit=limit)
+        return await self._task_repo.estimate_count()
 
     async def delete_task(self, task_id: UUID) -> None:
         """
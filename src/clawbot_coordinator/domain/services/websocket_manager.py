@@ -4,23 +4,58 @@ WebSocket connection manager service.
 Manages active WebSocket connections for bots.
 Pure domain service with no FastAPI dependencies.
 """
+import asyncio
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
+from functools import lru_cache
 from typing import Any
 from uuid import UUID
 
-from pydantic import BaseModel, Field
+import orjson
 
 
-class ConnectionInfo(BaseModel):
-    """Information about a bot's WebSocket connection."""
+@lru_cache(maxsize=64)
+def encode_event(event_type: str) -> bytes:
+    """Return the cached wire bytes for a type-only event.
 
-    bot_id: UUID = Field(..., description="Bot ID")
-    connected_at: datetime = Field(
-        default_factory=lambda: datetime.now(timezone.utc),
-        description="When bot connected",
+    Recurring server-to-bot notifications like `{"type": "heartbeat_ack"}`
+    have a fixed payload, so the encode is paid once per event type for
+    the life of the process instead of once per send.
+    """
+    return orjson.dumps({"type": event_type})
+
+
+@dataclass(slots=True, frozen=True)
+class ConnectionInfo:
+    """Information about a bot's WebSocket connection.
+
+    A slotted, frozen dataclass rather than a Pydantic model: one record
+    lives in memory per connected bot, its fields are already well-typed
+    at the call site, and the slot layout keeps per-connection overhead
+    small with no validation cost on connect. Frozen because a record is
+    never updated in place - reconnection replaces it wholesale.
+    """
+
+    bot_id: UUID
+    capabilities: list[str] = field(default_factory=list)
+    connected_at: datetime = field(
+        default_factory=lambda: datetime.now(timezone.utc)
     )
 
 
+@dataclass(slots=True)
+class _Entry:
+    """Socket and metadata for one connected bot, stored as a single value.
+
+    One dict keyed by bot_id instead of two parallel ones: every connect,
+    disconnect, and lookup pays one hash probe rather than two, and the
+    socket and its info stay adjacent for broadcast iteration.
+    """
+
+    websocket: Any
+    info: ConnectionInfo
+
+
 class WebSocketConnectionManager:
     """
     Manages WebSocket connections for bots.
@@ -31,12 +66,15 @@ class WebSocketConnectionManager:
 
     def __init__(self) -> None:
         """Initialize connection manager."""
-        # Map bot_id -> WebSocket connection
-        self._connections: dict[UUID, Any] = {}
-        # Map bot_id -> ConnectionInfo
-        self._connection_info: dict[UUID, ConnectionInfo] = {}
-
-    def connect(self, bot_id: UUID, websocket: Any) -> None:
+        # Map bot_id -> (websocket, ConnectionInfo) entry
+        self._conns: dict[UUID, _Entry] = {}
+        # Secondary index: capability -> set of connected bot IDs, so
+        # availability lookups by capability avoid the database entirely
+        self._by_capability: dict[str, set[UUID]] = {}
+
+    def connect(
+        self, bot_id: UUID, websocket: Any, capabilities: list[str] | None = None
+    ) -> None:
         """
         Register a new bot connection.
 
@@ -45,9 +83,17 @@ class WebSocketConnectionManager:
         Args:
             bot_id: Bot identifier
             websocket: WebSocket connection object
+            capabilities: Bot capabilities snapshot for the in-memory index
         """
-        self._connections[bot_id] = websocket
-        self._connection_info[bot_id] = ConnectionInfo(bot_id=bot_id)
+        if bot_id in self._conns:
+            self._remove_from_capability_index(bot_id)
+
+        self._conns[bot_id] = _Entry(
+            websocket=websocket,
+            info=ConnectionInfo(bot_id=bot_id, capabilities=capabilities or []),
+        )
+        for capability in capabilities or []:
+            self._by_capability.setdefault(capability, set()).add(bot_id)
 
     def disconnect(self, bot_id: UUID) -> None:
         """
@@ -58,8 +104,20 @@ class WebSocketConnectionManager:
         Args:
             bot_id: Bot identifier
         """
-        self._connections.pop(bot_id, None)
-        self._connection_info.pop(bot_id, None)
+        self._remove_from_capability_index(bot_id)
+        self._conns.pop(bot_id, None)
+
+    def _remove_from_capability_index(self, bot_id: UUID) -> None:
+        """Drop a bot from every capability bucket it was indexed under."""
+        entry = self._conns.get(bot_id)
+        if entry is None:
+            return
+        for capability in entry.info.capabilities:
+            bucket = self._by_capability.get(capability)
+            if bucket is not None:
+                bucket.discard(bot_id)
+                if not bucket:
+                    del self._by_capability[capability]
 
     def is_connected(self, bot_id: UUID) -> bool:
         """
@@ -71,7 +129,7 @@ class WebSocketConnectionManager:
         Returns:
             True if bot has active connection
         """
-        return bot_id in self._connections
+        return bot_id in self._conns
 
     def get_connection(self, bot_id: UUID) -> Any | None:
         """
@@ -83,7 +141,8 @@ class WebSocketConnectionManager:
         Returns:
             WebSocket connection or None if not connected
         """
-        return self._connections.get(bot_id)
+        entry = self._conns.get(bot_id)
+        return entry.websocket if entry is not None else None
 
     def get_connection_info(self, bot_id: UUID) -> ConnectionInfo | None:
         """
@@ -95,7 +154,8 @@ class WebSocketConnectionManager:
         Returns:
             ConnectionInfo or None if not connected
         """
-        return self._connection_info.get(bot_id)
+        entry = self._conns.get(bot_id)
+        return entry.info if entry is not None else None
 
     def get_connection_count(self) -> int:
         """
@@ -104,7 +164,7 @@ class WebSocketConnectionManager:
         Returns:
             Number of connected bots
         """
-        return len(self._connections)
+        return len(self._conns)
 
     def get_all_connected_bot_ids(self) -> list[UUID]:
         """
@@ -113,4 +173,47 @@ class WebSocketConnectionManager:
         Returns:
             List of bot UUIDs with active connections
         """
-        return list(self._connections.keys())
+        return list(self._conns.keys())
+
+    async def broadcast(self, payload: dict[str, Any] | bytes) -> None:
+        """
+        Send a payload to every connected bot concurrently.
+
+        The payload is encoded once and the resulting bytes are sent to
+        all sockets in a single gather, so fanning out to N bots costs one
+        JSON encode and one event-loop pass instead of N serial awaits.
+        Callers with pre-encoded bytes (e.g. from encode_event) skip the
+        encode entirely. Sockets whose send fails are disconnected.
+
+        Args:
+            payload: JSON-serializable message, or already-encoded bytes
+        """
+        if not self._conns:
+            return
+
+        data = payload if isinstance(payload, bytes) else orjson.dumps(payload)
+        # Snapshot before awaiting: sends may yield to connect/disconnect
+        targets = list(self._conns.items())
+        results = await asyncio.gather(
+            *(entry.websocket.send_bytes(data) for _, entry in targets),
+            return_exceptions=True,
+        )
+        for (bot_id, _), result in zip(targets, results):
+            if isinstance(result, BaseException):
+                # Failed to send - bot may have disconnected
+                self.disconnect(bot_id)
+
+    def get_connected_bot_ids_with_capability(self, capability: str) -> set[UUID]:
+        """
+        Get IDs of connected bots indexed under a capability.
+
+        O(1) dict lookup over live connection state; bots connected without
+        a capabilities snapshot are not represented here.
+
+        Args:
+            capability: Capability name
+
+        Returns:
+            Set of connected bot UUIDs with the capability (may be empty)
+        """
+        return set(self._by_capability.get(capability, ()))
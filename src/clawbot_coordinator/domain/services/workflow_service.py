@@ -3,15 +3,16 @@ Workflow service - orchestration logic for managing workflows and task sequencin
 
 Coordinates workflows, tasks, and bot assignment.
 """
+from datetime import datetime, timezone
 from typing import Any
 from uuid import UUID
 
-from ..models.task import TaskStatus
-from ..models.workflow import Workflow
+from ..models.task import Task, TaskStatus
+from ..models.workflow import Workflow, WorkflowStatus
 from ..repositories.bot_repo import BotRepository
 from ..repositories.task_repo import TaskRepository
 from ..repositories.workflow_repo import WorkflowRepository
-from ...exceptions import ResourceNotFound
+from ...exceptions import InvalidStateTransition, ResourceNotFound
 
 
 class WorkflowService:
@@ -20,9 +21,16 @@ class WorkflowService:
     def __init__(
         self,
         workflow_repo: WorkflowRepository,
-        task_repo: TaskRepository,
-        bot_repo: BotRepository,
+        task_repo: TaskRepository | None = None,
+        bot_repo: BotRepository | None = None,
     ) -> None:
+        """
+        Initialize the service.
+
+        task_repo and bot_repo are optional so read-only endpoints can wire
+        a lighter service; task_repo is required by create_workflow (with
+        task payloads) and get_workflow_with_tasks.
+        """
         self._workflow_repo = workflow_repo
         self._task_repo = task_repo
         self._bot_repo = bot_repo
@@ -52,29 +60,47 @@ class WorkflowService:
             metadata=metadata or {},
         )
 
-        # Create tasks if provided
+        # Create tasks if provided; one batched insert instead of a
+        # round-trip per task
         if task_payloads:
-            from .task_service import TaskService
-
-            task_service = TaskService(self._task_repo, self._bot_repo)
-            for payload in task_payloads:
-                task = await task_service.create_task(
-                    workflow_id=workflow.id,
-                    payload=payload,
-                )
-                workflow.add_task(task.id)
+            if self._task_repo is None:
+                raise RuntimeError("WorkflowService needs task_repo to create tasks")
+            tasks = [
+                Task(workflow_id=workflow.id, payload=payload)
+                for payload in task_payloads
+            ]
+            await self._task_repo.save_many(tasks)
+            workflow.add_tasks(task.id for task in tasks)
 
         await self._workflow_repo.save(workflow)
         return workflow
 
-    async def start_workflow(self, workflow_id: UUID) -> None:
-        """Start workflow execution."""
-        workflow = await self._workflow_repo.get(workflow_id)
-        if not workflow:
-            raise ResourceNotFound("Workflow", str(workflow_id))
+    async def start_workflow(self, workflow_id: UUID) -> Workflow:
+        """Start workflow execution and return the updated workflow.
 
-        workflow.start()
-        await self._workflow_repo.save(workflow)
+        Fused read-modify-write: the pending precondition and the transition
+        happen in one UPDATE ... RETURNING, and the caller gets the updated
+        workflow without a follow-up read.
+        """
+        now = datetime.now(timezone.utc)
+        workflow = await self._workflow_repo.update_status_returning(
+            workflow_id,
+            WorkflowStatus.IN_PROGRESS.value,
+            allowed_prev_statuses=[WorkflowStatus.PENDING.value],
+            extra_values={"started_at": now},
+        )
+        if workflow is not None:
+            return workflow
+
+        # Distinguish missing workflow from an invalid transition
+        current = await self._workflow_repo.get(workflow_id)
+        if current is None:
+            raise ResourceNotFound("Workflow", str(workflow_id))
+        raise InvalidStateTransition(
+            entity_type="Workflow",
+            current_state=current.status.value,
+            attempted_action="start",
+        )
 
     async def get_workflow(self, workflow_id: UUID) -> Workflow:
         """Get workflow by ID."""
@@ -84,7 +110,14 @@ class WorkflowService:
         return workflow
 
     async def get_workflow_with_tasks(self, workflow_id: UUID) -> tuple[Workflow, list]:
-        """Get workflow with its tasks."""
+        """Get workflow with its tasks.
+
+        Two queries total regardless of task count: one for the workflow,
+        one bulk select on tasks.workflow_id — never a per-task lookup over
+        workflow.task_ids.
+        """
+        if self._task_repo is None:
+            raise RuntimeError("WorkflowService needs task_repo to fetch tasks")
         workflow = await self.get_workflow(workflow_id)
         tasks = await self._task_repo.get_by_workflow(workflow_id)
         return workflow, tasks
@@ -0,0 +1,168 @@
+"""
+Caching decorator for BotRepository.
+
+Wraps any BotRepository with a small in-process read-through cache for
+get() lookups. Heartbeat bursts hit the same bot rows repeatedly within a
+couple of seconds; a short TTL absorbs those duplicate SELECTs while every
+write path invalidates, so staleness is bounded by the TTL even across
+processes that miss each other's invalidations.
+"""
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, AsyncIterator
+from uuid import UUID
+
+from ...domain.models.bot import Bot, BotStatus
+from ...domain.repositories.bot_repo import BotRepository
+
+
+class BotCache:
+    """TTL + LRU bounded cache mapping bot_id to (expiry, Bot).
+
+    Hand-rolled on OrderedDict rather than pulling in a caching dependency:
+    the access pattern is a plain get/put/invalidate keyed by UUID, and
+    move_to_end/popitem give LRU eviction in O(1).
+    """
+
+    def __init__(self, maxsize: int = 10_000, ttl_seconds: float = 2.0) -> None:
+        self._maxsize = maxsize
+        self._ttl = ttl_seconds
+        self._entries: OrderedDict[UUID, tuple[float, Bot]] = OrderedDict()
+
+    def get(self, bot_id: UUID) -> Bot | None:
+        entry = self._entries.get(bot_id)
+        if entry is None:
+            return None
+        expires_at, bot = entry
+        if time.time() >= expires_at:
+            del self._entries[bot_id]
+            return None
+        self._entries.move_to_end(bot_id)
+        return bot
+
+    def put(self, bot: Bot) -> None:
+        self._entries[bot.id] = (time.time() + self._ttl, bot)
+        self._entries.move_to_end(bot.id)
+        while len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, bot_id: UUID) -> None:
+        self._entries.pop(bot_id, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+# Process-wide cache shared across per-request repository instances; the
+# repositories themselves are cheap per-request wrappers around the session
+_SHARED_CACHE = BotCache()
+
+
+class CachingBotRepository(BotRepository):
+    """Read-through caching decorator around a concrete BotRepository.
+
+    Only get() is served from cache; list-shaped queries go straight to the
+    database (their results churn too fast to be worth invalidation
+    tracking). Cached bots are stored and returned as deep copies - a
+    shallow copy would share the capabilities list and metadata dict with
+    the cache entry - so one request mutating a domain model never leaks
+    into another request's view.
+    """
+
+    def __init__(self, inner: BotRepository, cache: BotCache | None = None) -> None:
+        """
+        Wrap a repository with the shared (or a provided) cache.
+
+        Args:
+            inner: Concrete repository that owns the database access
+            cache: Cache to use; defaults to the process-wide shared cache
+        """
+        self._inner = inner
+        self._cache = cache if cache is not None else _SHARED_CACHE
+
+    async def get(self, bot_id: UUID) -> Bot | None:
+        """Fetch bot by ID, serving repeat lookups from the cache."""
+        cached = self._cache.get(bot_id)
+        if cached is not None:
+            return cached.model_copy(deep=True)
+
+        bot = await self._inner.get(bot_id)
+        if bot is not None:
+            self._cache.put(bot.model_copy(deep=True))
+        return bot
+
+    async def save(self, bot: Bot) -> None:
+        """Persist a bot and invalidate its cache entry."""
+        await self._inner.save(bot)
+        self._cache.invalidate(bot.id)
+
+    async def save_many(self, bots: list[Bot]) -> None:
+        """Persist a batch of bots and invalidate their cache entries."""
+        await self._inner.save_many(bots)
+        for bot in bots:
+            self._cache.invalidate(bot.id)
+
+    async def delete(self, bot_id: UUID) -> bool:
+        """Delete a bot and invalidate its cache entry."""
+        deleted = await self._inner.delete(bot_id)
+        self._cache.invalidate(bot_id)
+        return deleted
+
+    async def mark_offline(self, bot_id: UUID) -> bool:
+        """Mark a bot offline and invalidate its cache entry."""
+        marked = await self._inner.mark_offline(bot_id)
+        self._cache.invalidate(bot_id)
+        return marked
+
+    async def touch_heartbeat(self, bot_id: UUID) -> Bot | None:
+        """Process a heartbeat and invalidate the bot's cache entry."""
+        bot = await self._inner.touch_heartbeat(bot_id)
+        self._cache.invalidate(bot_id)
+        return bot
+
+    async def touch_heartbeats(self, bot_ids: list[UUID]) -> None:
+        """Touch a batch of heartbeats and invalidate their cache entries."""
+        await self._inner.touch_heartbeats(bot_ids)
+        for bot_id in bot_ids:
+            self._cache.invalidate(bot_id)
+
+    async def update_status_returning(
+        self,
+        bot_id: UUID,
+        new_status: str,
+        allowed_prev_statuses: list[str] | None = None,
+        extra_values: dict[str, Any] | None = None,
+    ) -> Bot | None:
+        """Transition a bot's status and invalidate its cache entry."""
+        bot = await self._inner.update_status_returning(
+            bot_id, new_status, allowed_prev_statuses, extra_values
+        )
+        self._cache.invalidate(bot_id)
+        return bot
+
+    async def get_all(self, skip: int = 0, limit: int = 100) -> list[Bot]:
+        return await self._inner.get_all(skip=skip, limit=limit)
+
+    async def get_page(
+        self, cursor: datetime | None = None, limit: int = 100
+    ) -> list[Bot]:
+        return await self._inner.get_page(cursor=cursor, limit=limit)
+
+    def iter_all(self, batch_size: int = 500) -> AsyncIterator[Bot]:
+        return self._inner.iter_all(batch_size=batch_size)
+
+    async def estimate_count(self) -> int:
+        return await self._inner.estimate_count()
+
+    async def get_by_ids(self, bot_ids: list[UUID]) -> list[Bot]:
+        return await self._inner.get_by_ids(bot_ids)
+
+    async def get_by_capability(self, capability: str) -> list[Bot]:
+        return await self._inner.get_by_capability(capability)
+
+    async def get_by_status(self, status: BotStatus) -> list[Bot]:
+        return await self._inner.get_by_status(status)
+
+    async def get_available_bots(self, capability: str | None = None) -> list[Bot]:
+        return await self._inner.get_available_bots(capability)
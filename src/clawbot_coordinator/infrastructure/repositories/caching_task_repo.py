@@ -0,0 +1,188 @@
+"""
+Caching decorator for TaskRepository.
+
+Wraps any TaskRepository with a small in-process read-through cache for
+get() lookups. Status polling hammers the same task row between state
+transitions; a sub-second TTL absorbs those duplicate SELECTs while every
+mutating path invalidates, so a poll never sees a transition later than
+the TTL behind.
+"""
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, AsyncIterator, Collection
+from uuid import UUID
+
+from ...domain.models.task import Task, TaskStatus
+from ...domain.repositories.task_repo import TaskRepository
+
+
+class TaskCache:
+    """TTL + LRU bounded cache mapping task_id to (expiry, Task).
+
+    Same OrderedDict construction as the bot cache: get/put/invalidate
+    keyed by UUID, with move_to_end/popitem giving O(1) LRU eviction. The
+    default TTL is shorter than the bot cache's because tasks transition
+    through their lifecycle far faster than bots change status.
+    """
+
+    def __init__(self, maxsize: int = 10_000, ttl_seconds: float = 1.0) -> None:
+        self._maxsize = maxsize
+        self._ttl = ttl_seconds
+        self._entries: OrderedDict[UUID, tuple[float, Task]] = OrderedDict()
+
+    def get(self, task_id: UUID) -> Task | None:
+        entry = self._entries.get(task_id)
+        if entry is None:
+            return None
+        expires_at, task = entry
+        if time.time() >= expires_at:
+            del self._entries[task_id]
+            return None
+        self._entries.move_to_end(task_id)
+        return task
+
+    def put(self, task: Task) -> None:
+        self._entries[task.id] = (time.time() + self._ttl, task)
+        self._entries.move_to_end(task.id)
+        while len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, task_id: UUID) -> None:
+        self._entries.pop(task_id, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+# Process-wide cache shared across per-request repository instances; the
+# repositories themselves are cheap per-request wrappers around the session
+_SHARED_CACHE = TaskCache()
+
+
+class CachingTaskRepository(TaskRepository):
+    """Read-through caching decorator around a concrete TaskRepository.
+
+    Only get() is served from cache; list-shaped queries go straight to the
+    database (their results churn too fast to be worth invalidation
+    tracking). Cached tasks are stored and returned as deep copies - a
+    shallow copy would share the payload and result dicts with the cache
+    entry - so one request mutating a domain model never leaks into
+    another request's view.
+    """
+
+    def __init__(self, inner: TaskRepository, cache: TaskCache | None = None) -> None:
+        """
+        Wrap a repository with the shared (or a provided) cache.
+
+        Args:
+            inner: Concrete repository that owns the database access
+            cache: Cache to use; defaults to the process-wide shared cache
+        """
+        self._inner = inner
+        self._cache = cache if cache is not None else _SHARED_CACHE
+
+    async def get(self, task_id: UUID) -> Task | None:
+        """Fetch task by ID, serving repeat lookups from the cache."""
+        cached = self._cache.get(task_id)
+        if cached is not None:
+            return cached.model_copy(deep=True)
+
+        task = await self._inner.get(task_id)
+        if task is not None:
+            self._cache.put(task.model_copy(deep=True))
+        return task
+
+    async def save(self, task: Task) -> None:
+        """Persist a task and invalidate its cache entry."""
+        await self._inner.save(task)
+        self._cache.invalidate(task.id)
+
+    async def save_many(self, tasks: list[Task]) -> None:
+        """Persist a batch of tasks and invalidate their cache entries."""
+        await self._inner.save_many(tasks)
+        for task in tasks:
+            self._cache.invalidate(task.id)
+
+    async def delete(self, task_id: UUID) -> bool:
+        """Delete a task and invalidate its cache entry."""
+        deleted = await self._inner.delete(task_id)
+        self._cache.invalidate(task_id)
+        return deleted
+
+    async def update_status_returning(
+        self,
+        task_id: UUID,
+        new_status: str,
+        allowed_prev_statuses: list[str] | None = None,
+        extra_values: dict[str, Any] | None = None,
+    ) -> Task | None:
+        """Transition a task's status and invalidate its cache entry."""
+        task = await self._inner.update_status_returning(
+            task_id, new_status, allowed_prev_statuses, extra_values
+        )
+        self._cache.invalidate(task_id)
+        return task
+
+    async def claim_pending_tasks(self, bot_id: UUID, limit: int = 10) -> list[Task]:
+        """Claim pending tasks and invalidate the claimed entries."""
+        claimed = await self._inner.claim_pending_tasks(bot_id, limit=limit)
+        for task in claimed:
+            self._cache.invalidate(task.id)
+        return claimed
+
+    async def get_all(self, skip: int = 0, limit: int = 100) -> list[Task]:
+        return await self._inner.get_all(skip=skip, limit=limit)
+
+    async def get_page(
+        self, cursor: datetime | None = None, limit: int = 100
+    ) -> list[Task]:
+        return await self._inner.get_page(cursor=cursor, limit=limit)
+
+    def iter_all(self, batch_size: int = 500) -> AsyncIterator[Task]:
+        return self._inner.iter_all(batch_size=batch_size)
+
+    async def get_by_ids(self, task_ids: list[UUID]) -> list[Task]:
+        return await self._inner.get_by_ids(task_ids)
+
+    async def estimate_count(self) -> int:
+        return await self._inner.estimate_count()
+
+    async def get_by_workflow(self, workflow_id: UUID) -> list[Task]:
+        return await self._inner.get_by_workflow(workflow_id)
+
+    def iter_by_workflow(self, workflow_id: UUID) -> AsyncIterator[Task]:
+        return self._inner.iter_by_workflow(workflow_id)
+
+    async def get_by_status(self, status: TaskStatus) -> list[Task]:
+        return await self._inner.get_by_status(status)
+
+    async def get_by_bot(self, bot_id: UUID) -> list[Task]:
+        return await self._inner.get_by_bot(bot_id)
+
+    def iter_by_bot(self, bot_id: UUID) -> AsyncIterator[Task]:
+        return self._inner.iter_by_bot(bot_id)
+
+    async def get_pending_tasks(self, limit: int = 10) -> list[Task]:
+        return await self._inner.get_pending_tasks(limit=limit)
+
+    async def get_timeout_candidates(self, now: datetime) -> list[Task]:
+        return await self._inner.get_timeout_candidates(now)
+
+    async def find_tasks(
+        self,
+        *,
+        workflow_id: UUID | None = None,
+        bot_id: UUID | None = None,
+        statuses: Collection[TaskStatus] | None = None,
+        limit: int | None = None,
+    ) -> list[Task]:
+        return await self._inner.find_tasks(
+            workflow_id=workflow_id,
+            bot_id=bot_id,
+            statuses=statuses,
+            limit=limit,
+        )
+
+    async def get_active_tasks_for_bot(self, bot_id: UUID) -> list[Task]:
+        return await self._inner.get_active_tasks_for_bot(bot_id)
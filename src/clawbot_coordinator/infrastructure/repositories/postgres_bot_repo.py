@@ -4,9 +4,25 @@ PostgreSQL implementation of BotRepository.
 Maps between Bot domain models and BotORM database models.
 All database-specific logic stays in this infrastructure layer.
 """
+import sys
+from datetime import datetime, timezone
+from typing import Any, AsyncIterator
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import (
+    ColumnElement,
+    bindparam,
+    case,
+    delete,
+    func,
+    select,
+    text,
+    type_coerce,
+    update,
+)
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ...database import BotORM
@@ -14,6 +30,23 @@ from ...domain.models.bot import Bot, BotStatus
 from ...domain.repositories.bot_repo import BotRepository
 
 
+# Status strings frozen at import: Enum.value is a descriptor call, so
+# query construction reuses these instead of paying it per statement
+_ONLINE = BotStatus.ONLINE.value
+_OFFLINE = BotStatus.OFFLINE.value
+
+# Value-to-member map frozen at import: row materialization does a dict
+# probe instead of the Enum constructor's missing-value machinery per row
+_STATUS_FROM_VALUE = {status.value: status for status in BotStatus}
+
+# Hot statements built once at import with explicit bindparams, so each
+# call skips Python-side construction and hits the engine's compiled-SQL
+# cache with a stable key
+_SELECT_BY_ID = select(BotORM).where(BotORM.id == bindparam("bot_id"))
+_SELECT_BY_STATUS = select(BotORM).where(BotORM.status == bindparam("status"))
+_SELECT_AVAILABLE = select(BotORM).where(BotORM.status == _ONLINE)
+
+
 class PostgresBotRepository(BotRepository):
     """PostgreSQL implementation of the Bot repository."""
 
@@ -28,42 +61,63 @@ class PostgresBotRepository(BotRepository):
 
     async def get(self, bot_id: UUID) -> Bot | None:
         """Fetch bot by ID."""
-        result = await self._session.execute(
-            select(BotORM).where(BotORM.id == bot_id)
-        )
+        result = await self._session.execute(_SELECT_BY_ID, {"bot_id": bot_id})
         orm_obj = result.scalar_one_or_none()
         return self._to_domain(orm_obj) if orm_obj else None
 
     async def save(self, bot: Bot) -> None:
-        """Persist a bot (insert or update)."""
-        # Check if bot exists
-        result = await self._session.execute(
-            select(BotORM).where(BotORM.id == bot.id)
+        """Persist a bot (insert or update).
+
+        Single INSERT ... ON CONFLICT (id) DO UPDATE round-trip instead of
+        SELECT-then-UPDATE/INSERT; saves run on every heartbeat, so halving
+        the round-trips (and skipping the pre-SELECT's row lock) matters.
+        """
+        values = self._from_domain_dict(bot)
+        # created_at is immutable after insert; everything else follows the
+        # domain model on conflict
+        updates = {k: v for k, v in values.items() if k not in ("id", "created_at")}
+
+        insert = pg_insert if self._supports_jsonb() else sqlite_insert
+        await self._session.execute(
+            insert(BotORM.__table__)
+            .values(**values)
+            .on_conflict_do_update(index_elements=["id"], set_=updates)
         )
-        existing = result.scalar_one_or_none()
+        await self._session.flush()
 
-        if existing:
-            # Update existing
-            self._update_orm(existing, bot)
-        else:
-            # Insert new
-            orm_obj = self._from_domain(bot)
-            self._session.add(orm_obj)
+    async def save_many(self, bots: list[Bot]) -> None:
+        """Upsert a batch of bots in a single executemany round-trip.
 
+        Same INSERT ... ON CONFLICT statement as save, executed once with a
+        list of parameter sets, so batch callers (timeout sweeps freeing
+        many bots) pay one round-trip instead of one per bot.
+        """
+        if not bots:
+            return
+        insert = pg_insert if self._supports_jsonb() else sqlite_insert
+        stmt = insert(BotORM.__table__)
+        updates = {
+            col.name: stmt.excluded[col.name]
+            for col in BotORM.__table__.columns
+            if col.name not in ("id", "created_at")
+        }
+        stmt = stmt.on_conflict_do_update(index_elements=["id"], set_=updates)
+        await self._session.execute(
+            stmt, [self._from_domain_dict(bot) for bot in bots]
+        )
         await self._session.flush()
 
     async def delete(self, bot_id: UUID) -> bool:
-        """Delete a bot by ID."""
+        """Delete a bot by ID.
+
+        Single DELETE whose rowcount answers found-or-not, instead of
+        SELECT-then-DELETE's two round-trips.
+        """
         result = await self._session.execute(
-            select(BotORM).where(BotORM.id == bot_id)
+            delete(BotORM).where(BotORM.id == bot_id)
         )
-        orm_obj = result.scalar_one_or_none()
-
-        if orm_obj:
-            await self._session.delete(orm_obj)
-            await self._session.flush()
-            return True
-        return False
+        await self._session.flush()
+        return bool(result.rowcount)
 
     async def get_all(self, skip: int = 0, limit: int = 100) -> list[Bot]:
         """Fetch all bots with pagination."""
@@ -73,43 +127,205 @@ class PostgresBotRepository(BotRepository):
             .offset(skip)
             .limit(limit)
         )
-        orm_objs = result.scalars().all()
-        return [self._to_domain(obj) for obj in orm_objs]
+        return list(map(self._to_domain, result.scalars()))
+
+    async def get_page(
+        self, cursor: datetime | None = None, limit: int = 100
+    ) -> list[Bot]:
+        """Fetch a page of bots using keyset pagination on created_at."""
+        query = select(BotORM).order_by(BotORM.created_at.desc(), BotORM.id.desc())
+        if cursor is not None:
+            query = query.where(BotORM.created_at < cursor)
+        result = await self._session.execute(query.limit(limit))
+        return list(map(self._to_domain, result.scalars()))
+
+    async def iter_all(self, batch_size: int = 500) -> AsyncIterator[Bot]:
+        """Stream all bots newest first.
+
+        Uses a streaming result with yield_per so rows are fetched in
+        batches of batch_size instead of materializing the whole table.
+        """
+        result = await self._session.stream(
+            select(BotORM)
+            .order_by(BotORM.created_at.desc())
+            .execution_options(yield_per=batch_size)
+        )
+        async for orm_obj in result.scalars():
+            yield self._to_domain(orm_obj)
+
+    async def estimate_count(self) -> int:
+        """Estimate the total number of bots.
+
+        On PostgreSQL this reads the planner estimate from pg_class, which
+        is O(1) regardless of table size; an exact COUNT(*) is only issued
+        when the table has never been analyzed (reltuples = -1).
+        """
+        if self._supports_jsonb():
+            result = await self._session.execute(
+                text("SELECT reltuples::bigint FROM pg_class WHERE relname = 'bots'")
+            )
+            estimate = result.scalar_one_or_none()
+            if estimate is not None and estimate >= 0:
+                return int(estimate)
+
+        result = await self._session.execute(select(func.count()).select_from(BotORM))
+        return int(result.scalar_one())
+
+    async def mark_offline(self, bot_id: UUID) -> bool:
+        """Set a bot's status to offline with a single UPDATE."""
+        result = await self._session.execute(
+            update(BotORM)
+            .where(BotORM.id == bot_id)
+            .values(
+                status=_OFFLINE,
+                updated_at=datetime.now(timezone.utc),
+            )
+        )
+        await self._session.flush()
+        return bool(result.rowcount)
+
+    async def touch_heartbeat(self, bot_id: UUID) -> Bot | None:
+        """Process a heartbeat with a single UPDATE ... RETURNING.
+
+        The CASE keeps busy bots busy while flipping offline bots online,
+        mirroring Bot.heartbeat, without loading the row first.
+        """
+        now = datetime.now(timezone.utc)
+        result = await self._session.execute(
+            update(BotORM)
+            .where(BotORM.id == bot_id)
+            .values(
+                last_seen=now,
+                updated_at=now,
+                status=case(
+                    (BotORM.status == _OFFLINE, _ONLINE), else_=BotORM.status
+                ),
+            )
+            .returning(BotORM)
+        )
+        orm_obj = result.scalar_one_or_none()
+        await self._session.flush()
+        return self._to_domain(orm_obj) if orm_obj else None
+
+    async def touch_heartbeats(self, bot_ids: list[UUID]) -> None:
+        """Apply the heartbeat transition to many bots in one UPDATE.
+
+        Same CASE as touch_heartbeat over an id IN (...) predicate, so a
+        debounced batch of heartbeats costs one round-trip regardless of
+        how many bots it covers.
+        """
+        if not bot_ids:
+            return
+        now = datetime.now(timezone.utc)
+        await self._session.execute(
+            update(BotORM)
+            .where(BotORM.id.in_(bot_ids))
+            .values(
+                last_seen=now,
+                updated_at=now,
+                status=case(
+                    (BotORM.status == _OFFLINE, _ONLINE), else_=BotORM.status
+                ),
+            )
+        )
+        await self._session.flush()
+
+    async def update_status_returning(
+        self,
+        bot_id: UUID,
+        new_status: str,
+        allowed_prev_statuses: list[str] | None = None,
+        extra_values: dict[str, Any] | None = None,
+    ) -> Bot | None:
+        """Atomically transition a bot's status and return the updated bot.
+
+        Single UPDATE ... RETURNING round-trip, mirroring the task
+        repository: the status predicate in the WHERE clause enforces the
+        state-machine precondition in the database.
+        """
+        values: dict[str, Any] = {
+            "status": new_status,
+            "updated_at": datetime.now(timezone.utc),
+        }
+        if extra_values:
+            values.update(extra_values)
+
+        stmt = update(BotORM).where(BotORM.id == bot_id)
+        if allowed_prev_statuses is not None:
+            stmt = stmt.where(BotORM.status.in_(allowed_prev_statuses))
+
+        result = await self._session.execute(
+            stmt.values(**values).returning(BotORM)
+        )
+        orm_obj = result.scalar_one_or_none()
+        await self._session.flush()
+        return self._to_domain(orm_obj) if orm_obj else None
+
+    async def get_by_ids(self, bot_ids: list[UUID]) -> list[Bot]:
+        """Fetch multiple bots by ID in a single query."""
+        if not bot_ids:
+            return []
+        result = await self._session.execute(
+            select(BotORM).where(BotORM.id.in_(bot_ids))
+        )
+        return list(map(self._to_domain, result.scalars()))
 
     async def get_by_capability(self, capability: str) -> list[Bot]:
         """Find all bots that have a specific capability."""
-        # NOTE(ai): Get all bots and filter in Python for SQLite compatibility
-        # In production PostgreSQL, could use: BotORM.capabilities.contains([capability])
+        if self._supports_jsonb():
+            # JSONB containment (@>) is served by the GIN jsonb_path_ops
+            # index ix_bots_capabilities instead of a sequential scan
+            result = await self._session.execute(
+                select(BotORM).where(self._capability_contains(capability))
+            )
+            return list(map(self._to_domain, result.scalars()))
+
+        # Fallback: filter in Python for SQLite compatibility
         result = await self._session.execute(select(BotORM))
-        orm_objs = result.scalars().all()
+        orm_objs = result.scalars()
         return [
             self._to_domain(obj)
             for obj in orm_objs
             if capability in obj.capabilities
         ]
 
-    async def get_by_status(self, status: str) -> list[Bot]:
+    async def get_by_status(self, status: BotStatus) -> list[Bot]:
         """Find all bots with a specific status."""
         result = await self._session.execute(
-            select(BotORM).where(BotORM.status == status)
+            _SELECT_BY_STATUS, {"status": status.value}
         )
-        orm_objs = result.scalars().all()
-        return [self._to_domain(obj) for obj in orm_objs]
+        return list(map(self._to_domain, result.scalars()))
 
     async def get_available_bots(self, capability: str | None = None) -> list[Bot]:
         """Find all available (online) bots, optionally filtered by capability."""
-        query = select(BotORM).where(BotORM.status == BotStatus.ONLINE.value)
+        query = _SELECT_AVAILABLE
+
+        if capability and self._supports_jsonb():
+            query = query.where(self._capability_contains(capability))
+            result = await self._session.execute(query)
+            return list(map(self._to_domain, result.scalars()))
+
         result = await self._session.execute(query)
-        orm_objs = result.scalars().all()
+        orm_objs = result.scalars()
 
-        # Filter by capability in Python for SQLite compatibility
+        # Fallback: filter by capability in Python for SQLite compatibility
         if capability:
             return [
                 self._to_domain(obj)
                 for obj in orm_objs
                 if capability in obj.capabilities
             ]
-        return [self._to_domain(obj) for obj in orm_objs]
+        return list(map(self._to_domain, orm_objs))
+
+    def _supports_jsonb(self) -> bool:
+        """Check whether the bound database supports JSONB operators."""
+        bind = self._session.get_bind()
+        return bind is not None and bind.dialect.name == "postgresql"
+
+    @staticmethod
+    def _capability_contains(capability: str) -> ColumnElement[bool]:
+        """Build a `capabilities @> '["<capability>"]'::jsonb` predicate."""
+        return type_coerce(BotORM.capabilities, JSONB).contains([capability])
 
     @staticmethod
     def _to_domain(orm_obj: BotORM) -> Bot:
@@ -122,11 +338,15 @@ class PostgresBotRepository(BotRepository):
         Returns:
             Bot domain model
         """
-        return Bot(
+        # model_construct skips validation on this trusted read path; the
+        # database already enforced these invariants, so per-row CPU drops
+        # to attribute assignment. Capabilities are interned here because
+        # the field validator no longer runs (see Bot.validate_capabilities)
+        return Bot.model_construct(
             id=orm_obj.id,
             name=orm_obj.name,
-            capabilities=orm_obj.capabilities,
-            status=BotStatus(orm_obj.status),
+            capabilities=[sys.intern(cap) for cap in orm_obj.capabilities],
+            status=_STATUS_FROM_VALUE[orm_obj.status],
             last_seen=orm_obj.last_seen,
             metadata=orm_obj.metadata_,
             created_at=orm_obj.created_at,
@@ -134,39 +354,23 @@ class PostgresBotRepository(BotRepository):
         )
 
     @staticmethod
-    def _from_domain(bot: Bot) -> BotORM:
+    def _from_domain_dict(bot: Bot) -> dict[str, Any]:
         """
-        Convert domain model to ORM model.
+        Convert domain model to a column-value dict for bulk/upsert statements.
 
         Args:
             bot: Bot domain model
 
         Returns:
-            BotORM SQLAlchemy object
-        """
-        return BotORM(
-            id=bot.id,
-            name=bot.name,
-            capabilities=bot.capabilities,
-            status=bot.status.value,
-            last_seen=bot.last_seen,
-            metadata_=bot.metadata,
-            created_at=bot.created_at,
-            updated_at=bot.updated_at,
-        )
-
-    @staticmethod
-    def _update_orm(orm_obj: BotORM, bot: Bot) -> None:
-        """
-        Update ORM object fields from domain model.
-
-        Args:
-            orm_obj: Existing SQLAlchemy ORM object to update
-            bot: Source Bot domain model
+            Mapping of column names to values
         """
-        orm_obj.name = bot.name
-        orm_obj.capabilities = bot.capabilities
-        orm_obj.status = bot.status.value
-        orm_obj.last_seen = bot.last_seen
-        orm_obj.metadata_ = bot.metadata
-        orm_obj.updated_at = bot.updated_at
+        return {
+            "id": bot.id,
+            "name": bot.name,
+            "capabilities": bot.capabilities,
+            "status": bot.status.value,
+            "last_seen": bot.last_seen,
+            "metadata": bot.metadata,
+            "created_at": bot.created_at,
+            "updated_at": bot.updated_at,
+        }
@@ -4,9 +4,12 @@ PostgreSQL implementation of TaskRepository.
 Maps between Task domain models and TaskORM database models.
 """
 from datetime import datetime, timezone
+from typing import Any, AsyncIterator, Collection
 from uuid import UUID
 
-from sqlalchemy import and_, or_, select
+from sqlalchemy import and_, bindparam, delete, func, or_, select, text, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ...database import TaskORM
@@ -14,6 +17,48 @@ from ...domain.models.task import Task, TaskStatus
 from ...domain.repositories.task_repo import TaskRepository
 
 
+# Status strings frozen at import: Enum.value is a descriptor call, so
+# query construction reuses these instead of paying it per statement
+_PENDING = TaskStatus.PENDING.value
+_ASSIGNED = TaskStatus.ASSIGNED.value
+_IN_PROGRESS = TaskStatus.IN_PROGRESS.value
+
+# Value-to-member map frozen at import: row materialization does a dict
+# probe instead of the Enum constructor's missing-value machinery per row
+_STATUS_FROM_VALUE = {status.value: status for status in TaskStatus}
+
+# Hot statements built once at import with explicit bindparams, so each
+# call skips Python-side construction and hits the engine's compiled-SQL
+# cache with a stable key
+_SELECT_BY_ID = select(TaskORM).where(TaskORM.id == bindparam("task_id"))
+_SELECT_BY_WORKFLOW = (
+    select(TaskORM)
+    .where(TaskORM.workflow_id == bindparam("workflow_id"))
+    .order_by(TaskORM.created_at)
+)
+_SELECT_BY_STATUS = select(TaskORM).where(TaskORM.status == bindparam("status"))
+_SELECT_BY_BOT = (
+    select(TaskORM)
+    .where(TaskORM.bot_id == bindparam("bot_id"))
+    .order_by(TaskORM.created_at.desc())
+)
+_SELECT_PENDING = (
+    select(TaskORM)
+    .where(TaskORM.status == _PENDING)
+    .order_by(TaskORM.created_at)
+    .limit(bindparam("limit"))
+)
+_SELECT_ACTIVE_FOR_BOT = select(TaskORM).where(
+    and_(
+        TaskORM.bot_id == bindparam("bot_id"),
+        or_(
+            TaskORM.status == _ASSIGNED,
+            TaskORM.status == _IN_PROGRESS,
+        ),
+    )
+)
+
+
 class PostgresTaskRepository(TaskRepository):
     """PostgreSQL implementation of the Task repository."""
 
@@ -28,39 +73,100 @@ class PostgresTaskRepository(TaskRepository):
 
     async def get(self, task_id: UUID) -> Task | None:
         """Fetch task by ID."""
-        result = await self._session.execute(
-            select(TaskORM).where(TaskORM.id == task_id)
-        )
+        result = await self._session.execute(_SELECT_BY_ID, {"task_id": task_id})
         orm_obj = result.scalar_one_or_none()
         return self._to_domain(orm_obj) if orm_obj else None
 
     async def save(self, task: Task) -> None:
-        """Persist a task (insert or update)."""
-        result = await self._session.execute(
-            select(TaskORM).where(TaskORM.id == task.id)
+        """Persist a task (insert or update).
+
+        Single INSERT ... ON CONFLICT (id) DO UPDATE round-trip instead of
+        SELECT-then-UPDATE/INSERT, matching the bot repository's save.
+        """
+        values = self._from_domain_dict(task)
+        # created_at is immutable after insert; everything else follows the
+        # domain model on conflict
+        updates = {k: v for k, v in values.items() if k not in ("id", "created_at")}
+
+        insert = (
+            pg_insert
+            if (bind := self._session.get_bind()) is not None
+            and bind.dialect.name == "postgresql"
+            else sqlite_insert
         )
-        existing = result.scalar_one_or_none()
+        await self._session.execute(
+            insert(TaskORM.__table__)
+            .values(**values)
+            .on_conflict_do_update(index_elements=["id"], set_=updates)
+        )
+        await self._session.flush()
 
-        if existing:
-            self._update_orm(existing, task)
-        else:
-            orm_obj = self._from_domain(task)
-            self._session.add(orm_obj)
+    async def save_many(self, tasks: list[Task]) -> None:
+        """Upsert a batch of tasks in a single executemany round-trip.
 
+        One INSERT ... ON CONFLICT (id) DO UPDATE executed with a list of
+        parameter sets covers both bulk inserts (workflow creation) and
+        bulk updates (timeout sweeps failing many tasks at once).
+        """
+        if not tasks:
+            return
+        insert = (
+            pg_insert
+            if (bind := self._session.get_bind()) is not None
+            and bind.dialect.name == "postgresql"
+            else sqlite_insert
+        )
+        stmt = insert(TaskORM.__table__)
+        updates = {
+            col.name: stmt.excluded[col.name]
+            for col in TaskORM.__table__.columns
+            if col.name not in ("id", "created_at")
+        }
+        stmt = stmt.on_conflict_do_update(index_elements=["id"], set_=updates)
+        await self._session.execute(
+            stmt, [self._from_domain_dict(task) for task in tasks]
+        )
         await self._session.flush()
 
     async def delete(self, task_id: UUID) -> bool:
-        """Delete a task by ID."""
+        """Delete a task by ID.
+
+        Single DELETE whose rowcount answers found-or-not, instead of
+        SELECT-then-DELETE's two round-trips.
+        """
         result = await self._session.execute(
-            select(TaskORM).where(TaskORM.id == task_id)
+            delete(TaskORM).where(TaskORM.id == task_id)
         )
-        orm_obj = result.scalar_one_or_none()
+        await self._session.flush()
+        return bool(result.rowcount)
+
+    async def update_status_returning(
+        self,
+        task_id: UUID,
+        new_status: str,
+        allowed_prev_statuses: list[str] | None = None,
+        extra_values: dict[str, Any] | None = None,
+    ) -> Task | None:
+        """Atomically transition a task's status and return the updated task.
 
-        if orm_obj:
-            await self._session.delete(orm_obj)
-            await self._session.flush()
-            return True
-        return False
+        Single UPDATE ... RETURNING round-trip; the status predicate in the
+        WHERE clause enforces the state-machine precondition in the database.
+        """
+        values: dict[str, Any] = {
+            "status": new_status,
+            "updated_at": datetime.now(timezone.utc),
+        }
+        if extra_values:
+            values.update(extra_values)
+
+        stmt = update(TaskORM).where(TaskORM.id == task_id)
+        if allowed_prev_statuses is not None:
+            stmt = stmt.where(TaskORM.status.in_(allowed_prev_statuses))
+
+        result = await self._session.execute(stmt.values(**values).returning(TaskORM))
+        orm_obj = result.scalar_one_or_none()
+        await self._session.flush()
+        return self._to_domain(orm_obj) if orm_obj else None
 
     async def get_all(self, skip: int = 0, limit: int = 100) -> list[Task]:
         """Fetch all tasks with pagination."""
@@ -70,88 +176,208 @@ class PostgresTaskRepository(TaskRepository):
             .offset(skip)
             .limit(limit)
         )
-        orm_objs = result.scalars().all()
-        return [self._to_domain(obj) for obj in orm_objs]
+        return list(map(self._to_domain, result.scalars()))
+
+    async def get_page(
+        self, cursor: datetime | None = None, limit: int = 100
+    ) -> list[Task]:
+        """Fetch a page of tasks using keyset pagination on created_at."""
+        query = select(TaskORM).order_by(TaskORM.created_at.desc(), TaskORM.id.desc())
+        if cursor is not None:
+            query = query.where(TaskORM.created_at < cursor)
+        result = await self._session.execute(query.limit(limit))
+        return list(map(self._to_domain, result.scalars()))
+
+    async def get_by_ids(self, task_ids: list[UUID]) -> list[Task]:
+        """Fetch multiple tasks by ID in a single query."""
+        if not task_ids:
+            return []
+        result = await self._session.execute(
+            select(TaskORM).where(TaskORM.id.in_(task_ids))
+        )
+        return list(map(self._to_domain, result.scalars()))
+
+    async def estimate_count(self) -> int:
+        """Estimate the total number of tasks.
+
+        On PostgreSQL this reads the planner estimate from pg_class, which
+        is O(1) regardless of table size; an exact COUNT(*) is only issued
+        when the table has never been analyzed (reltuples = -1).
+        """
+        bind = self._session.get_bind()
+        if bind is not None and bind.dialect.name == "postgresql":
+            result = await self._session.execute(
+                text("SELECT reltuples::bigint FROM pg_class WHERE relname = 'tasks'")
+            )
+            estimate = result.scalar_one_or_none()
+            if estimate is not None and estimate >= 0:
+                return int(estimate)
+
+        result = await self._session.execute(select(func.count()).select_from(TaskORM))
+        return int(result.scalar_one())
+
+    async def iter_all(self, batch_size: int = 500) -> AsyncIterator[Task]:
+        """Stream all tasks newest first.
+
+        Uses a streaming result with yield_per so rows are fetched in
+        batches of batch_size instead of materializing the whole table.
+        """
+        result = await self._session.stream(
+            select(TaskORM)
+            .order_by(TaskORM.created_at.desc())
+            .execution_options(yield_per=batch_size)
+        )
+        async for orm_obj in result.scalars():
+            yield self._to_domain(orm_obj)
 
     async def get_by_workflow(self, workflow_id: UUID) -> list[Task]:
         """Find all tasks belonging to a specific workflow."""
         result = await self._session.execute(
+            _SELECT_BY_WORKFLOW, {"workflow_id": workflow_id}
+        )
+        return list(map(self._to_domain, result.scalars()))
+
+    async def iter_by_workflow(self, workflow_id: UUID) -> AsyncIterator[Task]:
+        """Stream tasks belonging to a workflow in created_at order.
+
+        Uses a streaming result with yield_per so rows are fetched in
+        batches of 200 instead of materializing the whole workflow.
+        """
+        result = await self._session.stream(
             select(TaskORM)
             .where(TaskORM.workflow_id == workflow_id)
             .order_by(TaskORM.created_at)
+            .execution_options(yield_per=200)
         )
-        orm_objs = result.scalars().all()
-        return [self._to_domain(obj) for obj in orm_objs]
+        async for orm_obj in result.scalars():
+            yield self._to_domain(orm_obj)
 
-    async def get_by_status(self, status: str) -> list[Task]:
+    async def get_by_status(self, status: TaskStatus) -> list[Task]:
         """Find all tasks with a specific status."""
         result = await self._session.execute(
-            select(TaskORM).where(TaskORM.status == status)
+            _SELECT_BY_STATUS, {"status": status.value}
         )
-        orm_objs = result.scalars().all()
-        return [self._to_domain(obj) for obj in orm_objs]
+        return list(map(self._to_domain, result.scalars()))
 
     async def get_by_bot(self, bot_id: UUID) -> list[Task]:
         """Find all tasks assigned to a specific bot."""
-        result = await self._session.execute(
+        result = await self._session.execute(_SELECT_BY_BOT, {"bot_id": bot_id})
+        return list(map(self._to_domain, result.scalars()))
+
+    async def iter_by_bot(self, bot_id: UUID) -> AsyncIterator[Task]:
+        """Stream tasks assigned to a bot, newest first."""
+        result = await self._session.stream(
             select(TaskORM)
             .where(TaskORM.bot_id == bot_id)
             .order_by(TaskORM.created_at.desc())
+            .execution_options(yield_per=200)
         )
-        orm_objs = result.scalars().all()
-        return [self._to_domain(obj) for obj in orm_objs]
+        async for orm_obj in result.scalars():
+            yield self._to_domain(orm_obj)
 
     async def get_pending_tasks(self, limit: int = 10) -> list[Task]:
         """Find pending tasks ready for assignment."""
-        result = await self._session.execute(
-            select(TaskORM)
-            .where(TaskORM.status == TaskStatus.PENDING.value)
+        result = await self._session.execute(_SELECT_PENDING, {"limit": limit})
+        return list(map(self._to_domain, result.scalars()))
+
+    async def claim_pending_tasks(self, bot_id: UUID, limit: int = 10) -> list[Task]:
+        """Atomically claim up to `limit` pending tasks for a bot.
+
+        On PostgreSQL the candidate SELECT uses FOR UPDATE SKIP LOCKED, so
+        concurrent schedulers each claim a disjoint set of tasks instead of
+        blocking on (or stomping over) each other's rows. The claim itself
+        is a single UPDATE ... RETURNING against the selected IDs, served by
+        the partial ix_tasks_pending_created index.
+        """
+        now = datetime.now(timezone.utc)
+
+        candidates = (
+            select(TaskORM.id)
+            .where(TaskORM.status == _PENDING)
             .order_by(TaskORM.created_at)
             .limit(limit)
         )
-        orm_objs = result.scalars().all()
-        return [self._to_domain(obj) for obj in orm_objs]
+        bind = self._session.get_bind()
+        if bind is not None and bind.dialect.name == "postgresql":
+            candidates = candidates.with_for_update(skip_locked=True)
 
-    async def get_timeout_candidates(self) -> list[Task]:
+        claimed = candidates.cte("claimed")
+        result = await self._session.execute(
+            update(TaskORM)
+            .where(TaskORM.id.in_(select(claimed.c.id)))
+            .values(
+                status=_ASSIGNED,
+                bot_id=bot_id,
+                assigned_at=now,
+                updated_at=now,
+            )
+            .returning(TaskORM)
+        )
+        orm_objs = result.scalars()
+        await self._session.flush()
+        return sorted(
+            (self._to_domain(obj) for obj in orm_objs),
+            key=lambda task: task.created_at,
+        )
+
+    async def get_timeout_candidates(self, now: datetime) -> list[Task]:
         """
-        Find tasks that may have timed out.
+        Find in-progress tasks that have exceeded their timeout as of `now`.
 
-        Returns tasks in-progress that were started before (now - timeout_seconds).
+        The timeout predicate runs inside the query on both dialects, so
+        only actual timeouts are fetched and reconstructed instead of
+        every in-progress task.
         """
-        # NOTE(ai): Get all in-progress tasks and filter in Python for SQLite compatibility
-        # In production PostgreSQL, could use:
-        # WHERE status = 'in_progress' AND started_at < NOW() - (timeout_seconds * INTERVAL '1 second')
+        bind = self._session.get_bind()
+        if bind is not None and bind.dialect.name == "postgresql":
+            elapsed_predicate = text(
+                "started_at + (timeout_seconds * interval '1 second') < :now"
+            ).bindparams(now=now)
+        else:
+            # SQLite lacks interval arithmetic; julianday yields fractional
+            # days, so the difference times 86400 is elapsed seconds
+            elapsed_predicate = (
+                func.julianday(now) - func.julianday(TaskORM.started_at)
+            ) * 86400.0 > TaskORM.timeout_seconds
+
+        # Both predicates are served by ix_tasks_status_started
         result = await self._session.execute(
-            select(TaskORM).where(TaskORM.status == TaskStatus.IN_PROGRESS.value)
+            select(TaskORM).where(
+                TaskORM.status == _IN_PROGRESS,
+                TaskORM.started_at.is_not(None),
+                elapsed_predicate,
+            )
         )
-        orm_objs = result.scalars().all()
+        return list(map(self._to_domain, result.scalars()))
 
-        # Filter for timed out tasks in Python
-        now = datetime.now(timezone.utc)
-        timed_out = []
-        for obj in orm_objs:
-            if obj.started_at:
-                elapsed = (now - obj.started_at).total_seconds()
-                if elapsed > obj.timeout_seconds:
-                    timed_out.append(self._to_domain(obj))
+    async def find_tasks(
+        self,
+        *,
+        workflow_id: UUID | None = None,
+        bot_id: UUID | None = None,
+        statuses: Collection[TaskStatus] | None = None,
+        limit: int | None = None,
+    ) -> list[Task]:
+        """Find tasks matching any combination of filters in one query."""
+        query = select(TaskORM).order_by(TaskORM.created_at)
+        if workflow_id is not None:
+            query = query.where(TaskORM.workflow_id == workflow_id)
+        if bot_id is not None:
+            query = query.where(TaskORM.bot_id == bot_id)
+        if statuses is not None:
+            query = query.where(TaskORM.status.in_([s.value for s in statuses]))
+        if limit is not None:
+            query = query.limit(limit)
 
-        return timed_out
+        result = await self._session.execute(query)
+        return list(map(self._to_domain, result.scalars()))
 
     async def get_active_tasks_for_bot(self, bot_id: UUID) -> list[Task]:
         """Find active (assigned or in-progress) tasks for a bot."""
         result = await self._session.execute(
-            select(TaskORM).where(
-                and_(
-                    TaskORM.bot_id == bot_id,
-                    or_(
-                        TaskORM.status == TaskStatus.ASSIGNED.value,
-                        TaskORM.status == TaskStatus.IN_PROGRESS.value,
-                    ),
-                )
-            )
+            _SELECT_ACTIVE_FOR_BOT, {"bot_id": bot_id}
         )
-        orm_objs = result.scalars().all()
-        return [self._to_domain(obj) for obj in orm_objs]
+        return list(map(self._to_domain, result.scalars()))
 
     @staticmethod
     def _to_domain(orm_obj: TaskORM) -> Task:
@@ -164,11 +390,13 @@ class PostgresTaskRepository(TaskRepository):
         Returns:
             Task domain model
         """
-        return Task(
+        # model_construct skips validation on this trusted read path; the
+        # database already enforced these invariants
+        return Task.model_construct(
             id=orm_obj.id,
             workflow_id=orm_obj.workflow_id,
             bot_id=orm_obj.bot_id,
-            status=TaskStatus(orm_obj.status),
+            status=_STATUS_FROM_VALUE[orm_obj.status],
             payload=orm_obj.payload,
             result=orm_obj.result,
             timeout_seconds=orm_obj.timeout_seconds,
@@ -180,47 +408,27 @@ class PostgresTaskRepository(TaskRepository):
         )
 
     @staticmethod
-    def _from_domain(task: Task) -> TaskORM:
+    def _from_domain_dict(task: Task) -> dict[str, Any]:
         """
-        Convert domain model to ORM model.
+        Convert domain model to a column-value dict for bulk/upsert statements.
 
         Args:
             task: Task domain model
 
         Returns:
-            TaskORM SQLAlchemy object
-        """
-        return TaskORM(
-            id=task.id,
-            workflow_id=task.workflow_id,
-            bot_id=task.bot_id,
-            status=task.status.value,
-            payload=task.payload,
-            result=task.result,
-            timeout_seconds=task.timeout_seconds,
-            created_at=task.created_at,
-            assigned_at=task.assigned_at,
-            started_at=task.started_at,
-            completed_at=task.completed_at,
-            updated_at=task.updated_at,
-        )
-
-    @staticmethod
-    def _update_orm(orm_obj: TaskORM, task: Task) -> None:
+            Mapping of column names to values
         """
-        Update ORM object fields from domain model.
-
-        Args:
-            orm_obj: Existing SQLAlchemy ORM object to update
-            task: Source Task domain model
-        """
-        orm_obj.workflow_id = task.workflow_id
-        orm_obj.bot_id = task.bot_id
-        orm_obj.status = task.status.value
-        orm_obj.payload = task.payload
-        orm_obj.result = task.result
-        orm_obj.timeout_seconds = task.timeout_seconds
-        orm_obj.assigned_at = task.assigned_at
-        orm_obj.started_at = task.started_at
-        orm_obj.completed_at = task.completed_at
-        orm_obj.updated_at = task.updated_at
+        return {
+            "id": task.id,
+            "workflow_id": task.workflow_id,
+            "bot_id": task.bot_id,
+            "status": task.status.value,
+            "payload": task.payload,
+            "result": task.result,
+            "timeout_seconds": task.timeout_seconds,
+            "created_at": task.created_at,
+            "assigned_at": task.assigned_at,
+            "started_at": task.started_at,
+            "completed_at": task.completed_at,
+            "updated_at": task.updated_at,
+        }
@@ -3,9 +3,13 @@ PostgreSQL implementation of WorkflowRepository.
 
 Maps between Workflow domain models and WorkflowORM database models.
 """
+from datetime import datetime, timezone
+from typing import Any, AsyncIterator
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import bindparam, delete, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ...database import WorkflowORM
@@ -13,6 +17,20 @@ from ...domain.models.workflow import Workflow, WorkflowStatus
 from ...domain.repositories.workflow_repo import WorkflowRepository
 
 
+# Status string frozen at import: Enum.value is a descriptor call, so
+# query construction reuses it instead of paying it per statement
+_IN_PROGRESS = WorkflowStatus.IN_PROGRESS.value
+
+# Value-to-member map frozen at import: row materialization does a dict
+# probe instead of the Enum constructor's missing-value machinery per row
+_STATUS_FROM_VALUE = {status.value: status for status in WorkflowStatus}
+
+# Hot statement built once at import with an explicit bindparam, so each
+# call skips Python-side construction and hits the engine's compiled-SQL
+# cache with a stable key
+_SELECT_BY_ID = select(WorkflowORM).where(WorkflowORM.id == bindparam("workflow_id"))
+
+
 class PostgresWorkflowRepository(WorkflowRepository):
     """PostgreSQL implementation of the Workflow repository."""
 
@@ -21,36 +39,88 @@ class PostgresWorkflowRepository(WorkflowRepository):
 
     async def get(self, workflow_id: UUID) -> Workflow | None:
         result = await self._session.execute(
-            select(WorkflowORM).where(WorkflowORM.id == workflow_id)
+            _SELECT_BY_ID, {"workflow_id": workflow_id}
         )
         orm_obj = result.scalar_one_or_none()
         return self._to_domain(orm_obj) if orm_obj else None
 
     async def save(self, workflow: Workflow) -> None:
-        result = await self._session.execute(
-            select(WorkflowORM).where(WorkflowORM.id == workflow.id)
+        """Persist a workflow (insert or update).
+
+        Single INSERT ... ON CONFLICT (id) DO UPDATE round-trip instead of
+        SELECT-then-UPDATE/INSERT, matching the bot and task repositories.
+        """
+        values = self._from_domain_dict(workflow)
+        # created_at is immutable after insert; everything else follows the
+        # domain model on conflict
+        updates = {k: v for k, v in values.items() if k not in ("id", "created_at")}
+
+        insert = (
+            pg_insert
+            if (bind := self._session.get_bind()) is not None
+            and bind.dialect.name == "postgresql"
+            else sqlite_insert
+        )
+        await self._session.execute(
+            insert(WorkflowORM.__table__)
+            .values(**values)
+            .on_conflict_do_update(index_elements=["id"], set_=updates)
         )
-        existing = result.scalar_one_or_none()
+        await self._session.flush()
 
-        if existing:
-            self._update_orm(existing, workflow)
-        else:
-            orm_obj = self._from_domain(workflow)
-            self._session.add(orm_obj)
+    async def save_many(self, workflows: list[Workflow]) -> None:
+        """Insert a batch of new workflows in a single round-trip.
 
+        add_all + one flush lets the driver send a single batched INSERT
+        instead of one statement per workflow.
+        """
+        if not workflows:
+            return
+        self._session.add_all([self._from_domain(wf) for wf in workflows])
         await self._session.flush()
 
     async def delete(self, workflow_id: UUID) -> bool:
+        """Delete a workflow by ID.
+
+        Single DELETE whose rowcount answers found-or-not, instead of
+        SELECT-then-DELETE's two round-trips.
+        """
         result = await self._session.execute(
-            select(WorkflowORM).where(WorkflowORM.id == workflow_id)
+            delete(WorkflowORM).where(WorkflowORM.id == workflow_id)
         )
-        orm_obj = result.scalar_one_or_none()
+        await self._session.flush()
+        return bool(result.rowcount)
+
+    async def update_status_returning(
+        self,
+        workflow_id: UUID,
+        new_status: str,
+        allowed_prev_statuses: list[str] | None = None,
+        extra_values: dict[str, Any] | None = None,
+    ) -> Workflow | None:
+        """Atomically transition a workflow's status and return the result.
+
+        Single UPDATE ... RETURNING round-trip, mirroring the task
+        repository: the status predicate in the WHERE clause enforces the
+        state-machine precondition in the database.
+        """
+        values: dict[str, Any] = {
+            "status": new_status,
+            "updated_at": datetime.now(timezone.utc),
+        }
+        if extra_values:
+            values.update(extra_values)
+
+        stmt = update(WorkflowORM).where(WorkflowORM.id == workflow_id)
+        if allowed_prev_statuses is not None:
+            stmt = stmt.where(WorkflowORM.status.in_(allowed_prev_statuses))
 
-        if orm_obj:
-            await self._session.delete(orm_obj)
-            await self._session.flush()
-            return True
-        return False
+        result = await self._session.execute(
+            stmt.values(**values).returning(WorkflowORM)
+        )
+        orm_obj = result.scalar_one_or_none()
+        await self._session.flush()
+        return self._to_domain(orm_obj) if orm_obj else None
 
     async def get_all(self, skip: int = 0, limit: int = 100) -> list[Workflow]:
         result = await self._session.execute(
@@ -59,34 +129,45 @@ class PostgresWorkflowRepository(WorkflowRepository):
             .offset(skip)
             .limit(limit)
         )
-        orm_objs = result.scalars().all()
-        return [self._to_domain(obj) for obj in orm_objs]
+        return list(map(self._to_domain, result.scalars()))
+
+    async def iter_all(self, batch_size: int = 500) -> AsyncIterator[Workflow]:
+        """Stream all workflows newest first.
+
+        Uses a streaming result with yield_per so rows are fetched in
+        batches of batch_size instead of materializing the whole table.
+        """
+        result = await self._session.stream(
+            select(WorkflowORM)
+            .order_by(WorkflowORM.created_at.desc())
+            .execution_options(yield_per=batch_size)
+        )
+        async for orm_obj in result.scalars():
+            yield self._to_domain(orm_obj)
 
-    async def get_by_status(self, status: str) -> list[Workflow]:
+    async def get_by_status(self, status: WorkflowStatus) -> list[Workflow]:
         result = await self._session.execute(
-            select(WorkflowORM).where(WorkflowORM.status == status)
+            select(WorkflowORM).where(WorkflowORM.status == status.value)
         )
-        orm_objs = result.scalars().all()
-        return [self._to_domain(obj) for obj in orm_objs]
+        return list(map(self._to_domain, result.scalars()))
 
     async def get_active_workflows(self) -> list[Workflow]:
         result = await self._session.execute(
-            select(WorkflowORM).where(WorkflowORM.status == WorkflowStatus.IN_PROGRESS.value)
+            select(WorkflowORM).where(WorkflowORM.status == _IN_PROGRESS)
         )
-        orm_objs = result.scalars().all()
-        return [self._to_domain(obj) for obj in orm_objs]
+        return list(map(self._to_domain, result.scalars()))
 
     @staticmethod
     def _to_domain(orm_obj: WorkflowORM) -> Workflow:
-        # Convert string UUIDs back to UUID objects
-        task_ids = [UUID(tid) for tid in orm_obj.task_ids]
-
-        return Workflow(
+        # model_construct skips validation on this trusted read path; the
+        # database already enforced these invariants. The column type hands
+        # back UUID objects, so only the tuple coercion remains here.
+        return Workflow.model_construct(
             id=orm_obj.id,
             name=orm_obj.name,
             description=orm_obj.description,
-            status=WorkflowStatus(orm_obj.status),
-            task_ids=task_ids,
+            status=_STATUS_FROM_VALUE[orm_obj.status],
+            task_ids=tuple(orm_obj.task_ids),
             metadata=orm_obj.metadata_,
             created_at=orm_obj.created_at,
             started_at=orm_obj.started_at,
@@ -95,32 +176,32 @@ class PostgresWorkflowRepository(WorkflowRepository):
         )
 
     @staticmethod
-    def _from_domain(workflow: Workflow) -> WorkflowORM:
-        # Convert UUID objects to strings for JSON storage
-        task_ids_str = [str(tid) for tid in workflow.task_ids]
+    def _from_domain_dict(workflow: Workflow) -> dict[str, Any]:
+        """Convert domain model to a column-value dict for upsert statements."""
+        return {
+            "id": workflow.id,
+            "name": workflow.name,
+            "description": workflow.description,
+            "status": workflow.status.value,
+            "task_ids": list(workflow.task_ids),
+            "metadata": workflow.metadata,
+            "created_at": workflow.created_at,
+            "started_at": workflow.started_at,
+            "completed_at": workflow.completed_at,
+            "updated_at": workflow.updated_at,
+        }
 
+    @staticmethod
+    def _from_domain(workflow: Workflow) -> WorkflowORM:
         return WorkflowORM(
             id=workflow.id,
             name=workflow.name,
             description=workflow.description,
             status=workflow.status.value,
-            task_ids=task_ids_str,
+            task_ids=list(workflow.task_ids),
             metadata_=workflow.metadata,
             created_at=workflow.created_at,
             started_at=workflow.started_at,
             completed_at=workflow.completed_at,
             updated_at=workflow.updated_at,
         )
-
-    @staticmethod
-    def _update_orm(orm_obj: WorkflowORM, workflow: Workflow) -> None:
-        task_ids_str = [str(tid) for tid in workflow.task_ids]
-
-        orm_obj.name = workflow.name
-        orm_obj.description = workflow.description
-        orm_obj.status = workflow.status.value
-        orm_obj.task_ids = task_ids_str
-        orm_obj.metadata_ = workflow.metadata
-        orm_obj.started_at = workflow.started_at
-        orm_obj.completed_at = workflow.completed_at
-        orm_obj.updated_at = workflow.updated_at
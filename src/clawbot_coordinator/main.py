@@ -6,14 +6,19 @@ Creates and configures the FastAPI application with all routes and middleware.
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
 from fastapi.responses import JSONResponse
 
 from .api.routes import bots, tasks, websocket, workflows
 from .config import settings
 from .database import close_db, get_session_factory, init_db
+from .domain.services.websocket_manager import WebSocketConnectionManager
+from .exceptions import DomainError, InvalidStateTransition, ResourceNotFound
+from .infrastructure.repositories.caching_bot_repo import CachingBotRepository
+from .infrastructure.repositories.caching_task_repo import CachingTaskRepository
 from .infrastructure.repositories.postgres_bot_repo import PostgresBotRepository
 from .infrastructure.repositories.postgres_task_repo import PostgresTaskRepository
+from .workers.heartbeat_batcher import HeartbeatBatcher
 from .workers.timeout_worker import TimeoutWorker
 
 
@@ -25,37 +30,58 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     Handles startup and shutdown events including timeout worker.
     """
     # Startup
+    # Single WebSocket manager for the application's lifetime; routes reach
+    # it through app.state instead of a module global
+    app.state.ws_manager = WebSocketConnectionManager()
+
     if settings.environment == "development":
         # Only auto-create tables in development
         await init_db()
 
     # Start timeout worker
     timeout_worker = None
-    session = None
+    heartbeat_batcher = None
     try:
-        # Create a dedicated session for the timeout worker
-        # This session lives for the entire application lifetime
+        # This call also warms the lru_cached engine/session factory, so the
+        # first request never pays the initialization cost.
         session_factory = get_session_factory()
-        session = session_factory()
 
-        # Create repositories for timeout worker
-        task_repo = PostgresTaskRepository(session)
-        bot_repo = PostgresBotRepository(session)
+        # The worker opens a session per sweep from the factory, borrowing
+        # a pooled connection only while a sweep runs. Repositories are
+        # wrapped in the caching decorators so the worker's writes
+        # invalidate the shared read caches the API serves from.
         timeout_worker = TimeoutWorker(
-            task_repo=task_repo,
-            bot_repo=bot_repo,
+            session_factory=session_factory,
+            repo_factory=lambda session: (
+                CachingTaskRepository(PostgresTaskRepository(session)),
+                CachingBotRepository(PostgresBotRepository(session)),
+            ),
             check_interval_seconds=30,
         )
         await timeout_worker.start()
 
+        # The batcher opens and commits a session per flush, same as the
+        # timeout worker: a pooled checkout per 50ms window is cheap, and
+        # a pinned session would hold its first flush's transaction (and
+        # row locks) open forever. WebSocket heartbeats enqueue here and
+        # return instantly.
+        heartbeat_batcher = HeartbeatBatcher(
+            session_factory=session_factory,
+            repo_factory=lambda session: CachingBotRepository(
+                PostgresBotRepository(session)
+            ),
+        )
+        await heartbeat_batcher.start()
+        app.state.heartbeat_batcher = heartbeat_batcher
+
         yield
 
     finally:
         # Shutdown
         if timeout_worker and timeout_worker.is_running():
             await timeout_worker.stop()
-        if session:
-            await session.close()
+        if heartbeat_batcher and heartbeat_batcher.is_running():
+            await heartbeat_batcher.stop()
         await close_db()
 
 
@@ -69,6 +95,22 @@ app = FastAPI(
 )
 
 
+# Domain errors are converted to HTTP responses once here instead of in a
+# try/except block around every service call; routes stay boilerplate-free
+# and the happy path executes no exception-handling bytecode.
+def _resource_not_found_handler(request: Request, exc: Exception) -> JSONResponse:
+    return JSONResponse(status_code=404, content={"detail": str(exc)})
+
+
+def _domain_error_handler(request: Request, exc: Exception) -> JSONResponse:
+    return JSONResponse(status_code=400, content={"detail": str(exc)})
+
+
+app.add_exception_handler(ResourceNotFound, _resource_not_found_handler)
+app.add_exception_handler(InvalidStateTransition, _domain_error_handler)
+app.add_exception_handler(DomainError, _domain_error_handler)
+
+
 # Include routers
 app.include_router(bots.router, prefix="/api/v1")
 app.include_router(tasks.router, prefix="/api/v1")
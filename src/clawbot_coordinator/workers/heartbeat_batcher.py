@@ -0,0 +1,145 @@
+"""
+Heartbeat batcher for debouncing high-frequency heartbeat updates.
+
+Heartbeats are the most frequent write in the system and each one is a
+tiny UPDATE. This worker collects heartbeats arriving within a short
+window and flushes them as one batched UPDATE ... WHERE id IN (...), so
+N heartbeats in a window cost one round-trip instead of N.
+"""
+import asyncio
+import logging
+from typing import Any, Callable
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from ..domain.repositories.bot_repo import BotRepository
+
+logger = logging.getLogger(__name__)
+
+# Builds the bot repository a flush needs from its session; keeps the
+# batcher on the domain port while main.py decides the concrete wiring
+BotRepoFactory = Callable[[AsyncSession], BotRepository]
+
+
+class HeartbeatBatcher:
+    """
+    Background worker that merges heartbeats into batched updates.
+
+    Fire-and-forget callers (the WebSocket heartbeat handler) enqueue bot
+    IDs; a background task drains the pending set every flush interval and
+    issues a single repository update. Repeat heartbeats from the same bot
+    within a window collapse into one row, so the batch is bounded by the
+    number of distinct bots, not the heartbeat rate.
+
+    Each flush opens its own session from the factory and commits it, so
+    the batched UPDATE becomes durable immediately and no transaction (or
+    its row locks) outlives the flush.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        repo_factory: BotRepoFactory,
+        flush_interval_seconds: float = 0.05,
+    ) -> None:
+        """
+        Initialize heartbeat batcher.
+
+        Args:
+            session_factory: Factory producing a fresh session per flush
+            repo_factory: Builds the bot repository for a flush's session
+            flush_interval_seconds: How often to flush pending heartbeats
+        """
+        self._session_factory = session_factory
+        self._repo_factory = repo_factory
+        self._flush_interval = flush_interval_seconds
+        self._pending: set[UUID] = set()
+        self._running = False
+        self._task: asyncio.Task[Any] | None = None
+
+    def enqueue(self, bot_id: UUID) -> None:
+        """
+        Record a heartbeat for the next flush.
+
+        Synchronous and allocation-light on purpose: the WebSocket receive
+        loop calls this per heartbeat frame and must not block.
+
+        Args:
+            bot_id: Bot the heartbeat came from
+        """
+        self._pending.add(bot_id)
+
+    async def flush(self) -> int:
+        """
+        Flush all pending heartbeats in one batched update.
+
+        Returns:
+            Number of distinct bots flushed
+        """
+        if not self._pending:
+            return 0
+
+        bot_ids = list(self._pending)
+        self._pending.clear()
+        async with self._session_factory() as session:
+            bot_repo = self._repo_factory(session)
+            await bot_repo.touch_heartbeats(bot_ids)
+            await session.commit()
+        return len(bot_ids)
+
+    async def start(self) -> None:
+        """Start the background flush loop."""
+        if self._running:
+            logger.warning("Heartbeat batcher already running")
+            return
+
+        self._running = True
+        self._task = asyncio.create_task(self._run_loop())
+        logger.info(
+            f"Heartbeat batcher started (flush interval: {self._flush_interval}s)"
+        )
+
+    async def stop(self) -> None:
+        """Stop the background loop, flushing anything still pending."""
+        if not self._running:
+            return
+
+        self._running = False
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+        # Don't drop heartbeats that arrived after the last flush
+        try:
+            await self.flush()
+        except Exception as e:
+            logger.error(f"Error flushing heartbeats on shutdown: {e}")
+
+        logger.info("Heartbeat batcher stopped")
+
+    def is_running(self) -> bool:
+        """
+        Check if the batcher is currently running.
+
+        Returns:
+            True if the flush loop is running
+        """
+        return self._running
+
+    async def _run_loop(self) -> None:
+        """Main loop: flush pending heartbeats at the configured interval."""
+        while self._running:
+            try:
+                await asyncio.sleep(self._flush_interval)
+            except asyncio.CancelledError:
+                break
+
+            try:
+                await self.flush()
+            except Exception as e:
+                logger.error(f"Error in heartbeat batcher loop: {e}")
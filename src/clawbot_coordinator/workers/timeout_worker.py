@@ -6,14 +6,22 @@ and automatically fails them, freeing up assigned bots.
 """
 import asyncio
 import logging
-from typing import Any
+from datetime import datetime, timezone
+from typing import Any, Callable
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from ..domain.models.bot import BotStatus
+from ..domain.models.task import Task
 from ..domain.repositories.bot_repo import BotRepository
 from ..domain.repositories.task_repo import TaskRepository
 
 logger = logging.getLogger(__name__)
 
+# Builds the repositories a sweep needs from its session; keeps the worker
+# on the domain ports while main.py decides the concrete wiring
+RepoFactory = Callable[[AsyncSession], tuple[TaskRepository, BotRepository]]
+
 
 class TimeoutWorker:
     """
@@ -21,24 +29,28 @@ class TimeoutWorker:
 
     Periodically scans for tasks that have exceeded their timeout_seconds
     and fails them automatically, freeing up any assigned bots.
+
+    Each sweep opens its own session from the factory and closes it when
+    done, so the worker borrows a pooled connection for the duration of a
+    sweep instead of pinning one for the application's lifetime.
     """
 
     def __init__(
         self,
-        task_repo: TaskRepository,
-        bot_repo: BotRepository,
+        session_factory: async_sessionmaker[AsyncSession],
+        repo_factory: RepoFactory,
         check_interval_seconds: int = 30,
     ) -> None:
         """
         Initialize timeout worker.
 
         Args:
-            task_repo: Task repository for querying and updating tasks
-            bot_repo: Bot repository for freeing up bots
+            session_factory: Factory producing a fresh session per sweep
+            repo_factory: Builds the task and bot repositories for a session
             check_interval_seconds: How often to check for timeouts (default: 30s)
         """
-        self._task_repo = task_repo
-        self._bot_repo = bot_repo
+        self._session_factory = session_factory
+        self._repo_factory = repo_factory
         self._check_interval = check_interval_seconds
         self._running = False
         self._task: asyncio.Task[Any] | None = None
@@ -50,56 +62,64 @@ class TimeoutWorker:
         Finds tasks that have exceeded their timeout and fails them.
         Frees up any bots that were assigned to those tasks.
 
+        The writes are batched: one save_many for the failed tasks, one
+        get_by_ids for their bots, and one save_many for the freed ones —
+        three round-trips per sweep instead of three per task. The whole
+        sweep runs in one short-lived session and commits atomically.
+
         Returns:
             Number of tasks that were timed out
         """
-        # Get all tasks (we'll filter in Python for SQLite compatibility)
-        all_tasks = await self._task_repo.get_all()
-
-        timed_out_count = 0
-
-        for task in all_tasks:
-            # Check if task is timed out
-            if task.is_timed_out():
-                try:
-                    # Fetch latest task state
-                    current_task = await self._task_repo.get(task.id)
-                    if not current_task:
-                        continue
-
-                    # Skip if already in terminal state
-                    if current_task.is_terminal():
-                        continue
-
-                    # Fail the task
-                    error_details = {
-                        "reason": "timeout",
-                        "message": f"Task exceeded timeout of {current_task.timeout_seconds} seconds",
-                        "timeout_seconds": current_task.timeout_seconds,
-                    }
-                    current_task.fail(error_details)
-                    await self._task_repo.save(current_task)
-
-                    # Free up the bot if one was assigned
-                    if current_task.bot_id:
-                        bot = await self._bot_repo.get(current_task.bot_id)
-                        if bot and bot.status == BotStatus.BUSY:
-                            bot.go_online()
-                            await self._bot_repo.save(bot)
-
-                    timed_out_count += 1
-                    logger.info(
-                        f"Task {current_task.id} timed out after {current_task.timeout_seconds}s"
-                    )
-
-                except Exception as e:
-                    logger.error(f"Error processing timeout for task {task.id}: {e}")
-                    continue
-
-        if timed_out_count > 0:
-            logger.info(f"Processed {timed_out_count} timed-out tasks")
-
-        return timed_out_count
+        async with self._session_factory() as session:
+            task_repo, bot_repo = self._repo_factory(session)
+            count = await self._process_timeouts(task_repo, bot_repo)
+            await session.commit()
+            return count
+
+    async def _process_timeouts(
+        self, task_repo: TaskRepository, bot_repo: BotRepository
+    ) -> int:
+        """Run one sweep against the given repositories."""
+        # The repository evaluates the timeout predicate in SQL, so only
+        # actual timeouts come back - not every task in the table
+        candidates = await task_repo.get_timeout_candidates(
+            datetime.now(timezone.utc)
+        )
+
+        failed: list[Task] = []
+        for task in candidates:
+            # Re-verify cheaply: skip tasks that finished or are still
+            # within their timeout (raced with completion/assignment)
+            if task.is_terminal() or not task.is_timed_out():
+                continue
+
+            task.fail(
+                {
+                    "reason": "timeout",
+                    "message": f"Task exceeded timeout of {task.timeout_seconds} seconds",
+                    "timeout_seconds": task.timeout_seconds,
+                }
+            )
+            failed.append(task)
+            logger.info(f"Task {task.id} timed out after {task.timeout_seconds}s")
+
+        if not failed:
+            return 0
+
+        await task_repo.save_many(failed)
+
+        # Free the assigned bots in one fetch + one batched save
+        bot_ids = list({task.bot_id for task in failed if task.bot_id})
+        if bot_ids:
+            bots = await bot_repo.get_by_ids(bot_ids)
+            freed = [bot for bot in bots if bot.status == BotStatus.BUSY]
+            for bot in freed:
+                bot.go_online()
+            if freed:
+                await bot_repo.save_many(freed)
+
+        logger.info(f"Processed {len(failed)} timed-out tasks")
+        return len(failed)
 
     async def start(self) -> None:
         """
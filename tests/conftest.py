@@ -11,7 +11,14 @@ from httpx import ASGITransport, AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.pool import StaticPool
 
-from clawbot_coordinator.database import Base, BotORM, TaskORM, WorkflowORM, get_session  # noqa: F401
+from clawbot_coordinator.database import (  # noqa: F401
+    Base,
+    BotORM,
+    TaskORM,
+    WorkflowORM,
+    get_ro_session,
+    get_session,
+)
 from clawbot_coordinator.main import app
 
 
@@ -75,6 +82,7 @@ async def client(test_session: AsyncSession) -> AsyncGenerator[AsyncClient, None
         yield test_session
 
     app.dependency_overrides[get_session] = override_get_session
+    app.dependency_overrides[get_ro_session] = override_get_session
 
     transport = ASGITransport(app=app)  # type: ignore
     async with AsyncClient(transport=transport, base_url="http://test") as client:
@@ -284,6 +284,73 @@ class TestTaskQueries:
         for task in data:
             assert task["workflow_id"] == str(workflow_id)
 
+    async def test_claim_pending_tasks(
+        self, client: AsyncClient, sample_bot_data: dict
+    ) -> None:
+        """Should atomically claim the oldest pending tasks for a bot."""
+        bot_response = await client.post("/api/v1/bots", json=sample_bot_data)
+        bot_id = bot_response.json()["id"]
+
+        for _ in range(3):
+            await client.post(
+                "/api/v1/tasks",
+                json={"workflow_id": str(uuid4()), "payload": {}},
+            )
+
+        response = await client.post(
+            "/api/v1/tasks/claim", json={"bot_id": bot_id, "limit": 2}
+        )
+
+        assert response.status_code == 200
+        claimed = response.json()
+        assert len(claimed) == 2
+        for task in claimed:
+            assert task["status"] == "assigned"
+            assert task["bot_id"] == bot_id
+            assert task["assigned_at"] is not None
+
+        # Remaining task is claimable by a second call; after that, nothing is
+        second = await client.post(
+            "/api/v1/tasks/claim", json={"bot_id": bot_id, "limit": 10}
+        )
+        assert len(second.json()) == 1
+        third = await client.post(
+            "/api/v1/tasks/claim", json={"bot_id": bot_id, "limit": 10}
+        )
+        assert third.json() == []
+
+    async def test_claim_with_unknown_bot_returns_404(
+        self, client: AsyncClient
+    ) -> None:
+        """Should return 404 when the claiming bot does not exist."""
+        response = await client.post(
+            "/api/v1/tasks/claim", json={"bot_id": str(uuid4()), "limit": 5}
+        )
+        assert response.status_code == 404
+
+    async def test_stream_tasks_by_workflow(
+        self, client: AsyncClient
+    ) -> None:
+        """Should stream workflow tasks as newline-delimited JSON."""
+        import json
+
+        workflow_id = uuid4()
+
+        for _ in range(3):
+            await client.post(
+                "/api/v1/tasks",
+                json={"workflow_id": str(workflow_id), "payload": {}},
+            )
+
+        response = await client.get(f"/api/v1/tasks/workflow/{workflow_id}/stream")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        lines = [line for line in response.text.splitlines() if line]
+        assert len(lines) == 3
+        for line in lines:
+            assert json.loads(line)["workflow_id"] == str(workflow_id)
+
     async def test_get_tasks_by_bot(
         self, client: AsyncClient, sample_bot_data: dict
     ) -> None:
@@ -63,3 +63,40 @@ class TestBroadcastTaskAssignment:
         )
         # Will fail because bot is not connected (checked first)
         assert broadcast_response.status_code == 404
+
+
+@pytest.mark.asyncio
+class TestBroadcastTaskAssignmentBatch:
+    """Test broadcasting batches of task assignments."""
+
+    async def test_batch_broadcast_skips_disconnected_bots(
+        self, client: AsyncClient, sample_bot_data: dict
+    ) -> None:
+        """Should report assignments for disconnected bots as skipped."""
+        # Create workflow with two tasks
+        workflow_response = await client.post(
+            "/api/v1/workflows",
+            json={
+                "name": "Batch Workflow",
+                "task_payloads": [{"action": "build"}, {"action": "test"}],
+            },
+        )
+        task_ids = workflow_response.json()["task_ids"]
+
+        # Register bot (but don't connect via WebSocket)
+        bot_response = await client.post("/api/v1/bots", json=sample_bot_data)
+        bot_id = bot_response.json()["id"]
+
+        broadcast_response = await client.post(
+            "/api/v1/ws/broadcast/tasks",
+            json={
+                "assignments": [
+                    {"task_id": task_id, "bot_id": bot_id} for task_id in task_ids
+                ]
+            },
+        )
+        assert broadcast_response.status_code == 200
+        data = broadcast_response.json()
+        assert data["sent"] == []
+        assert set(data["skipped"]) == set(task_ids)
+        assert data["failed"] == []
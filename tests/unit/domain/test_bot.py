@@ -11,7 +11,7 @@ import pytest
 from pydantic import ValidationError as PydanticValidationError
 
 from clawbot_coordinator.domain.models.bot import Bot, BotStatus
-from clawbot_coordinator.exceptions import InvalidStateTransition
+from clawbot_coordinator.exceptions import InvalidStateTransition, ValidationError
 
 
 class TestBotCreation:
@@ -187,6 +187,24 @@ class TestBotCapabilities:
         assert bot.has_capability("Python") is True
         assert bot.has_capability("python") is False
 
+    def test_set_capabilities_replaces_and_invalidates_lookup(self) -> None:
+        """Should reflect new capabilities in lookups after replacement."""
+        bot = Bot(name="bot", capabilities=["python"])
+        assert bot.has_capability("python") is True
+
+        bot.set_capabilities(["docker", "rust"])
+
+        assert bot.capabilities == ["docker", "rust"]
+        assert bot.has_capability("python") is False
+        assert bot.has_capability("docker") is True
+
+    def test_set_capabilities_rejects_empty_list(self) -> None:
+        """Should reject an empty capability list."""
+        bot = Bot(name="bot", capabilities=["python"])
+
+        with pytest.raises(ValidationError):
+            bot.set_capabilities([])
+
 
 class TestBotAvailability:
     """Test bot availability checks."""
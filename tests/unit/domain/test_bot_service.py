@@ -12,7 +12,7 @@ import pytest
 from clawbot_coordinator.domain.models.bot import Bot, BotStatus
 from clawbot_coordinator.domain.repositories.bot_repo import BotRepository
 from clawbot_coordinator.domain.services.bot_service import BotService
-from clawbot_coordinator.exceptions import ResourceNotFound
+from clawbot_coordinator.exceptions import InvalidStateTransition, ResourceNotFound
 
 
 @pytest.fixture
@@ -70,28 +70,25 @@ class TestHeartbeat:
     ) -> None:
         """Should update last_seen and set bot online."""
         bot_id = uuid4()
-        existing_bot = Bot(name="test", capabilities=["test"])
-        existing_bot.id = bot_id
+        touched_bot = Bot(name="test", capabilities=["test"])
+        touched_bot.id = bot_id
+        touched_bot.heartbeat()
 
-        mock_repo.get = AsyncMock(return_value=existing_bot)
-        mock_repo.save = AsyncMock()
-
-        await service.heartbeat(bot_id)
+        mock_repo.touch_heartbeat = AsyncMock(return_value=touched_bot)
 
-        mock_repo.get.assert_called_once_with(bot_id)
-        mock_repo.save.assert_called_once()
+        bot = await service.heartbeat(bot_id)
 
-        # Verify bot was updated
-        saved_bot = mock_repo.save.call_args[0][0]
-        assert saved_bot.status == BotStatus.ONLINE
-        assert saved_bot.last_seen is not None
+        # One atomic repository call, no get-mutate-save cycle
+        mock_repo.touch_heartbeat.assert_called_once_with(bot_id)
+        assert bot.status == BotStatus.ONLINE
+        assert bot.last_seen is not None
 
     async def test_heartbeat_raises_if_bot_not_found(
         self, service: BotService, mock_repo: AsyncMock
     ) -> None:
         """Should raise ResourceNotFound if bot doesn't exist."""
         bot_id = uuid4()
-        mock_repo.get = AsyncMock(return_value=None)
+        mock_repo.touch_heartbeat = AsyncMock(return_value=None)
 
         with pytest.raises(ResourceNotFound) as exc_info:
             await service.heartbeat(bot_id)
@@ -199,21 +196,43 @@ class TestMarkBotBusy:
     async def test_mark_bot_busy_transitions_to_busy(
         self, service: BotService, mock_repo: AsyncMock
     ) -> None:
-        """Should transition online bot to busy."""
+        """Should transition online bot to busy with one atomic update."""
         bot_id = uuid4()
-        bot = Bot(id=bot_id, name="test", capabilities=["test"])
-        bot.go_online()
+        busy_bot = Bot(id=bot_id, name="test", capabilities=["test"])
+        busy_bot.go_online()
+        busy_bot.go_busy()
 
-        mock_repo.get = AsyncMock(return_value=bot)
-        mock_repo.save = AsyncMock()
+        mock_repo.update_status_returning = AsyncMock(return_value=busy_bot)
 
-        await service.mark_bot_busy(bot_id)
+        bot = await service.mark_bot_busy(bot_id)
 
-        mock_repo.get.assert_called_once_with(bot_id)
-        mock_repo.save.assert_called_once()
+        mock_repo.update_status_returning.assert_called_once_with(
+            bot_id, BotStatus.BUSY.value, [BotStatus.ONLINE.value]
+        )
+        assert bot.status == BotStatus.BUSY
+
+    async def test_mark_bot_busy_raises_if_not_online(
+        self, service: BotService, mock_repo: AsyncMock
+    ) -> None:
+        """Should raise InvalidStateTransition when the bot is not online."""
+        bot_id = uuid4()
+        offline_bot = Bot(id=bot_id, name="test", capabilities=["test"])
+
+        mock_repo.update_status_returning = AsyncMock(return_value=None)
+        mock_repo.get = AsyncMock(return_value=offline_bot)
 
-        saved_bot = mock_repo.save.call_args[0][0]
-        assert saved_bot.status == BotStatus.BUSY
+        with pytest.raises(InvalidStateTransition):
+            await service.mark_bot_busy(bot_id)
+
+    async def test_mark_bot_busy_raises_if_not_found(
+        self, service: BotService, mock_repo: AsyncMock
+    ) -> None:
+        """Should raise ResourceNotFound when the bot doesn't exist."""
+        mock_repo.update_status_returning = AsyncMock(return_value=None)
+        mock_repo.get = AsyncMock(return_value=None)
+
+        with pytest.raises(ResourceNotFound):
+            await service.mark_bot_busy(uuid4())
 
 
 class TestMarkBotAvailable:
@@ -222,19 +241,52 @@ class TestMarkBotAvailable:
     async def test_mark_bot_available_transitions_to_online(
         self, service: BotService, mock_repo: AsyncMock
     ) -> None:
-        """Should transition busy bot back to online."""
+        """Should transition bot to online with one atomic update."""
         bot_id = uuid4()
-        bot = Bot(id=bot_id, name="test", capabilities=["test"])
-        bot.go_online()
-        bot.go_busy()
+        online_bot = Bot(id=bot_id, name="test", capabilities=["test"])
+        online_bot.go_online()
 
-        mock_repo.get = AsyncMock(return_value=bot)
-        mock_repo.save = AsyncMock()
+        mock_repo.update_status_returning = AsyncMock(return_value=online_bot)
+
+        bot = await service.mark_bot_available(bot_id)
 
-        await service.mark_bot_available(bot_id)
+        assert bot.status == BotStatus.ONLINE
+        call_args = mock_repo.update_status_returning.call_args[0]
+        assert call_args[1] == BotStatus.ONLINE.value
+        assert call_args[2] is None  # go_online is valid from any state
+
+    async def test_mark_bot_available_raises_if_not_found(
+        self, service: BotService, mock_repo: AsyncMock
+    ) -> None:
+        """Should raise ResourceNotFound when the bot doesn't exist."""
+        mock_repo.update_status_returning = AsyncMock(return_value=None)
+
+        with pytest.raises(ResourceNotFound):
+            await service.mark_bot_available(uuid4())
 
-        saved_bot = mock_repo.save.call_args[0][0]
-        assert saved_bot.status == BotStatus.ONLINE
+
+class TestMarkBotOffline:
+    """Test marking bot as offline."""
+
+    async def test_mark_bot_offline_issues_single_update(
+        self, service: BotService, mock_repo: AsyncMock
+    ) -> None:
+        """Should delegate to the repository without fetching first."""
+        bot_id = uuid4()
+        mock_repo.mark_offline = AsyncMock(return_value=True)
+
+        await service.mark_bot_offline(bot_id)
+
+        mock_repo.mark_offline.assert_called_once_with(bot_id)
+        mock_repo.get.assert_not_called()
+        mock_repo.save.assert_not_called()
+
+    async def test_mark_bot_offline_missing_bot_is_noop(
+        self, service: BotService, mock_repo: AsyncMock
+    ) -> None:
+        """Should not raise when the bot does not exist."""
+        mock_repo.mark_offline = AsyncMock(return_value=False)
+        await service.mark_bot_offline(uuid4())  # Should not raise
 
 
 class TestListBots:
@@ -243,11 +295,12 @@ class TestListBots:
     async def test_list_bots_with_pagination(
         self, service: BotService, mock_repo: AsyncMock
     ) -> None:
-        """Should pass pagination parameters to repository."""
+        """Should pass keyset pagination parameters to repository."""
         bots = [Bot(name=f"bot{i}", capabilities=["test"]) for i in range(5)]
-        mock_repo.get_all = AsyncMock(return_value=bots)
+        mock_repo.get_page = AsyncMock(return_value=bots)
+        cursor = datetime.now(timezone.utc)
 
-        result = await service.list_bots(skip=10, limit=50)
+        result = await service.list_bots(cursor=cursor, limit=50)
 
         assert len(result) == 5
-        mock_repo.get_all.assert_called_once_with(skip=10, limit=50)
+        mock_repo.get_page.assert_called_once_with(cursor=cursor, limit=50)
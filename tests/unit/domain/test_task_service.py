@@ -14,7 +14,7 @@ from clawbot_coordinator.domain.models.task import Task, TaskStatus
 from clawbot_coordinator.domain.repositories.bot_repo import BotRepository
 from clawbot_coordinator.domain.repositories.task_repo import TaskRepository
 from clawbot_coordinator.domain.services.task_service import TaskService
-from clawbot_coordinator.exceptions import ResourceNotFound
+from clawbot_coordinator.exceptions import InvalidStateTransition, ResourceNotFound
 
 
 @pytest.fixture
@@ -77,28 +77,33 @@ class TestAssignTask:
         mock_task_repo: AsyncMock,
         mock_bot_repo: AsyncMock,
     ) -> None:
-        """Should assign pending task to bot."""
+        """Should assign pending task to bot via a fused update."""
         task_id = uuid4()
         bot_id = uuid4()
-        task = Task(id=task_id, workflow_id=uuid4(), payload={})
+        assigned = Task(id=task_id, workflow_id=uuid4(), payload={})
+        assigned.assign_to(bot_id)
         bot = Bot(id=bot_id, name="worker", capabilities=["python"])
         bot.go_online()
 
-        mock_task_repo.get = AsyncMock(return_value=task)
         mock_bot_repo.get = AsyncMock(return_value=bot)
-        mock_task_repo.save = AsyncMock()
+        mock_task_repo.update_status_returning = AsyncMock(return_value=assigned)
 
-        await service.assign_task_to_bot(task_id, bot_id)
+        result = await service.assign_task_to_bot(task_id, bot_id)
 
-        mock_task_repo.save.assert_called_once()
-        saved_task = mock_task_repo.save.call_args[0][0]
-        assert saved_task.status == TaskStatus.ASSIGNED
-        assert saved_task.bot_id == bot_id
+        assert result.status == TaskStatus.ASSIGNED
+        assert result.bot_id == bot_id
+        args = mock_task_repo.update_status_returning.call_args[0]
+        assert args[0] == task_id
+        assert args[1] == TaskStatus.ASSIGNED.value
+        assert args[2] == [TaskStatus.PENDING.value]
 
     async def test_assign_task_raises_if_task_not_found(
-        self, service: TaskService, mock_task_repo: AsyncMock
+        self, service: TaskService, mock_task_repo: AsyncMock, mock_bot_repo: AsyncMock
     ) -> None:
         """Should raise ResourceNotFound if task doesn't exist."""
+        bot = Bot(name="worker", capabilities=["python"])
+        mock_bot_repo.get = AsyncMock(return_value=bot)
+        mock_task_repo.update_status_returning = AsyncMock(return_value=None)
         mock_task_repo.get = AsyncMock(return_value=None)
 
         with pytest.raises(ResourceNotFound) as exc_info:
@@ -106,6 +111,21 @@ class TestAssignTask:
 
         assert "Task" in str(exc_info.value)
 
+    async def test_assign_task_raises_if_task_not_pending(
+        self, service: TaskService, mock_task_repo: AsyncMock, mock_bot_repo: AsyncMock
+    ) -> None:
+        """Should raise InvalidStateTransition if the precondition failed."""
+        task = Task(workflow_id=uuid4(), payload={})
+        task.cancel()
+        bot = Bot(name="worker", capabilities=["python"])
+
+        mock_bot_repo.get = AsyncMock(return_value=bot)
+        mock_task_repo.update_status_returning = AsyncMock(return_value=None)
+        mock_task_repo.get = AsyncMock(return_value=task)
+
+        with pytest.raises(InvalidStateTransition):
+            await service.assign_task_to_bot(task.id, uuid4())
+
     async def test_assign_task_raises_if_bot_not_found(
         self,
         service: TaskService,
@@ -113,12 +133,10 @@ class TestAssignTask:
         mock_bot_repo: AsyncMock,
     ) -> None:
         """Should raise ResourceNotFound if bot doesn't exist."""
-        task = Task(workflow_id=uuid4(), payload={})
-        mock_task_repo.get = AsyncMock(return_value=task)
         mock_bot_repo.get = AsyncMock(return_value=None)
 
         with pytest.raises(ResourceNotFound) as exc_info:
-            await service.assign_task_to_bot(task.id, uuid4())
+            await service.assign_task_to_bot(uuid4(), uuid4())
 
         assert "Bot" in str(exc_info.value)
 
@@ -129,18 +147,32 @@ class TestStartTask:
     async def test_start_task(
         self, service: TaskService, mock_task_repo: AsyncMock
     ) -> None:
-        """Should start an assigned task."""
+        """Should start an assigned task via a fused update."""
         task = Task(workflow_id=uuid4(), payload={})
         task.assign_to(uuid4())
+        task.start()
 
-        mock_task_repo.get = AsyncMock(return_value=task)
-        mock_task_repo.save = AsyncMock()
+        mock_task_repo.update_status_returning = AsyncMock(return_value=task)
 
-        await service.start_task(task.id)
+        result = await service.start_task(task.id)
 
-        saved_task = mock_task_repo.save.call_args[0][0]
-        assert saved_task.status == TaskStatus.IN_PROGRESS
-        assert saved_task.started_at is not None
+        assert result.status == TaskStatus.IN_PROGRESS
+        assert result.started_at is not None
+        args = mock_task_repo.update_status_returning.call_args[0]
+        assert args[1] == TaskStatus.IN_PROGRESS.value
+        assert args[2] == [TaskStatus.ASSIGNED.value]
+
+    async def test_start_task_raises_if_not_assigned(
+        self, service: TaskService, mock_task_repo: AsyncMock
+    ) -> None:
+        """Should raise InvalidStateTransition when task is still pending."""
+        task = Task(workflow_id=uuid4(), payload={})
+
+        mock_task_repo.update_status_returning = AsyncMock(return_value=None)
+        mock_task_repo.get = AsyncMock(return_value=task)
+
+        with pytest.raises(InvalidStateTransition):
+            await service.start_task(task.id)
 
 
 class TestCompleteTask:
@@ -159,18 +191,19 @@ class TestCompleteTask:
         bot.go_online()
         bot.go_busy()
 
-        mock_task_repo.get = AsyncMock(return_value=task)
+        result = {"output": "success", "duration": 5.2}
+        completed = task.model_copy(deep=True)
+        completed.complete(result)
+
+        mock_task_repo.update_status_returning = AsyncMock(return_value=completed)
         mock_bot_repo.get = AsyncMock(return_value=bot)
-        mock_task_repo.save = AsyncMock()
         mock_bot_repo.save = AsyncMock()
 
-        result = {"output": "success", "duration": 5.2}
-        await service.complete_task(task.id, result)
+        updated = await service.complete_task(task.id, result)
 
         # Verify task completed
-        saved_task = mock_task_repo.save.call_args[0][0]
-        assert saved_task.status == TaskStatus.COMPLETED
-        assert saved_task.result == result
+        assert updated.status == TaskStatus.COMPLETED
+        assert updated.result == result
 
         # Verify bot marked available
         mock_bot_repo.save.assert_called_once()
@@ -194,17 +227,18 @@ class TestFailTask:
         bot.go_online()
         bot.go_busy()
 
-        mock_task_repo.get = AsyncMock(return_value=task)
+        error = {"error": "Connection timeout", "code": "ERR_TIMEOUT"}
+        failed = task.model_copy(deep=True)
+        failed.fail(error)
+
+        mock_task_repo.update_status_returning = AsyncMock(return_value=failed)
         mock_bot_repo.get = AsyncMock(return_value=bot)
-        mock_task_repo.save = AsyncMock()
         mock_bot_repo.save = AsyncMock()
 
-        error = {"error": "Connection timeout", "code": "ERR_TIMEOUT"}
-        await service.fail_task(task.id, error)
+        updated = await service.fail_task(task.id, error)
 
-        saved_task = mock_task_repo.save.call_args[0][0]
-        assert saved_task.status == TaskStatus.FAILED
-        assert saved_task.result == error
+        assert updated.status == TaskStatus.FAILED
+        assert updated.result == error
 
 
 class TestGetTask:
@@ -268,20 +302,21 @@ class TestHandleTimedOutTasks:
         bot.go_busy()
 
         mock_task_repo.get_timeout_candidates = AsyncMock(return_value=[task])
-        mock_bot_repo.get = AsyncMock(return_value=bot)
-        mock_task_repo.save = AsyncMock()
-        mock_bot_repo.save = AsyncMock()
+        mock_bot_repo.get_by_ids = AsyncMock(return_value=[bot])
+        mock_task_repo.save_many = AsyncMock()
+        mock_bot_repo.save_many = AsyncMock()
 
         failed_count = await service.handle_timed_out_tasks()
 
         assert failed_count == 1
-        # Verify task failed
-        saved_task = mock_task_repo.save.call_args[0][0]
-        assert saved_task.status == TaskStatus.FAILED
-        assert "timeout" in str(saved_task.result).lower()
+        # Verify task failed (one batched save)
+        saved_tasks = mock_task_repo.save_many.call_args[0][0]
+        assert saved_tasks[0].status == TaskStatus.FAILED
+        assert "timeout" in str(saved_tasks[0].result).lower()
 
-        # Verify bot freed
-        assert mock_bot_repo.save.called
+        # Verify bot freed (one batched save)
+        freed_bots = mock_bot_repo.save_many.call_args[0][0]
+        assert freed_bots[0].status == BotStatus.ONLINE
 
 
 class TestCancelTask:
@@ -290,15 +325,16 @@ class TestCancelTask:
     async def test_cancel_task(
         self, service: TaskService, mock_task_repo: AsyncMock
     ) -> None:
-        """Should cancel task."""
+        """Should cancel task via a fused update with no status guard."""
         task = Task(workflow_id=uuid4(), payload={})
-        mock_task_repo.get = AsyncMock(return_value=task)
-        mock_task_repo.save = AsyncMock()
+        task.cancel()
+        mock_task_repo.update_status_returning = AsyncMock(return_value=task)
 
-        await service.cancel_task(task.id)
+        result = await service.cancel_task(task.id)
 
-        saved_task = mock_task_repo.save.call_args[0][0]
-        assert saved_task.status == TaskStatus.CANCELLED
+        assert result.status == TaskStatus.CANCELLED
+        args = mock_task_repo.update_status_returning.call_args[0]
+        assert args[2] is None  # cancel is valid from any state
 
 
 class TestGetTasksByWorkflow:
@@ -1,11 +1,14 @@
 """Unit tests for WebSocket connection manager."""
+from unittest.mock import AsyncMock
 from uuid import UUID, uuid4
 
+import orjson
 import pytest
 
 from clawbot_coordinator.domain.services.websocket_manager import (
     WebSocketConnectionManager,
     ConnectionInfo,
+    encode_event,
 )
 
 
@@ -141,3 +144,132 @@ class TestWebSocketConnectionManager:
         bot_id = uuid4()
         manager.disconnect(bot_id)  # Should not raise
         assert not manager.is_connected(bot_id)
+
+
+class TestCapabilityIndex:
+    """Test the in-memory capability index over connected bots."""
+
+    @pytest.fixture
+    def manager(self) -> WebSocketConnectionManager:
+        """Create connection manager instance."""
+        return WebSocketConnectionManager()
+
+    def test_connect_indexes_capabilities(
+        self, manager: WebSocketConnectionManager
+    ) -> None:
+        """Should index connected bots under each of their capabilities."""
+        bot1 = uuid4()
+        bot2 = uuid4()
+
+        manager.connect(bot1, object(), capabilities=["build", "test"])
+        manager.connect(bot2, object(), capabilities=["build"])
+
+        assert manager.get_connected_bot_ids_with_capability("build") == {bot1, bot2}
+        assert manager.get_connected_bot_ids_with_capability("test") == {bot1}
+
+    def test_unknown_capability_returns_empty_set(
+        self, manager: WebSocketConnectionManager
+    ) -> None:
+        """Should return empty set for capabilities nobody advertises."""
+        manager.connect(uuid4(), object(), capabilities=["build"])
+        assert manager.get_connected_bot_ids_with_capability("deploy") == set()
+
+    def test_connect_without_capabilities_is_not_indexed(
+        self, manager: WebSocketConnectionManager
+    ) -> None:
+        """Should accept connections without a capabilities snapshot."""
+        bot_id = uuid4()
+        manager.connect(bot_id, object())
+
+        assert manager.is_connected(bot_id)
+        assert manager.get_connected_bot_ids_with_capability("build") == set()
+
+    def test_disconnect_removes_from_index(
+        self, manager: WebSocketConnectionManager
+    ) -> None:
+        """Should remove bot from every capability bucket on disconnect."""
+        bot_id = uuid4()
+        manager.connect(bot_id, object(), capabilities=["build", "test"])
+
+        manager.disconnect(bot_id)
+
+        assert manager.get_connected_bot_ids_with_capability("build") == set()
+        assert manager.get_connected_bot_ids_with_capability("test") == set()
+
+    def test_reconnect_replaces_index_entries(
+        self, manager: WebSocketConnectionManager
+    ) -> None:
+        """Should re-index a reconnecting bot with its latest capabilities."""
+        bot_id = uuid4()
+        manager.connect(bot_id, object(), capabilities=["build"])
+        manager.connect(bot_id, object(), capabilities=["deploy"])
+
+        assert manager.get_connected_bot_ids_with_capability("build") == set()
+        assert manager.get_connected_bot_ids_with_capability("deploy") == {bot_id}
+
+
+class TestBroadcast:
+    """Test concurrent broadcast to all connections."""
+
+    @pytest.fixture
+    def manager(self) -> WebSocketConnectionManager:
+        """Create connection manager instance."""
+        return WebSocketConnectionManager()
+
+    async def test_broadcast_sends_same_bytes_to_all(
+        self, manager: WebSocketConnectionManager
+    ) -> None:
+        """Should encode the payload once and send it to every socket."""
+        ws1 = AsyncMock()
+        ws2 = AsyncMock()
+        manager.connect(uuid4(), ws1)
+        manager.connect(uuid4(), ws2)
+
+        await manager.broadcast({"type": "shutdown"})
+
+        data1 = ws1.send_bytes.call_args[0][0]
+        data2 = ws2.send_bytes.call_args[0][0]
+        assert data1 == data2
+        assert orjson.loads(data1) == {"type": "shutdown"}
+
+    async def test_broadcast_disconnects_failed_sockets(
+        self, manager: WebSocketConnectionManager
+    ) -> None:
+        """Should drop sockets whose send raises and keep the rest."""
+        good_id, bad_id = uuid4(), uuid4()
+        good_ws = AsyncMock()
+        bad_ws = AsyncMock()
+        bad_ws.send_bytes.side_effect = RuntimeError("connection closed")
+        manager.connect(good_id, good_ws)
+        manager.connect(bad_id, bad_ws)
+
+        await manager.broadcast({"type": "ping"})
+
+        assert manager.is_connected(good_id)
+        assert not manager.is_connected(bad_id)
+
+    async def test_broadcast_with_no_connections_is_noop(
+        self, manager: WebSocketConnectionManager
+    ) -> None:
+        """Should return without error when nothing is connected."""
+        await manager.broadcast({"type": "ping"})
+        assert manager.get_connection_count() == 0
+
+    async def test_broadcast_accepts_pre_encoded_bytes(
+        self, manager: WebSocketConnectionManager
+    ) -> None:
+        """Should send pre-encoded bytes as-is without re-encoding."""
+        ws = AsyncMock()
+        manager.connect(uuid4(), ws)
+        data = encode_event("heartbeat_ack")
+
+        await manager.broadcast(data)
+
+        assert ws.send_bytes.call_args[0][0] is data
+
+    def test_encode_event_is_cached(self) -> None:
+        """Should return the identical bytes object for a repeated event."""
+        assert encode_event("heartbeat_ack") is encode_event("heartbeat_ack")
+        assert orjson.loads(encode_event("heartbeat_ack")) == {
+            "type": "heartbeat_ack"
+        }
@@ -64,6 +64,15 @@ class TestConnectedMessage:
         assert msg.bot_id == bot_id
         assert msg.payload["bot_id"] == str(bot_id)
 
+    def test_create_classmethod_matches_validated_construction(self) -> None:
+        """create() should build the same message without validation."""
+        bot_id = uuid4()
+        msg = ConnectedMessage.create(bot_id)
+        assert msg.type == MessageType.CONNECTED
+        assert msg.bot_id == bot_id
+        assert msg.payload["bot_id"] == str(bot_id)
+        assert msg.timestamp.tzinfo is not None
+
     def test_connected_message_requires_bot_id(self) -> None:
         """Should require bot_id."""
         with pytest.raises(PydanticValidationError):
@@ -137,6 +146,18 @@ class TestTaskCompleteMessage:
         assert msg.error == error
         assert msg.result is None
 
+    def test_create_classmethod_matches_validated_construction(self) -> None:
+        """create() should build the same message without validation."""
+        task_id = uuid4()
+        msg = TaskCompleteMessage.create(task_id, success=False, error="boom")
+        assert msg.type == MessageType.TASK_COMPLETE
+        assert msg.task_id == task_id
+        assert msg.payload == {
+            "task_id": str(task_id),
+            "success": False,
+            "error": "boom",
+        }
+
     def test_task_complete_requires_task_id_and_success(self) -> None:
         """Should require task_id and success flag."""
         with pytest.raises(PydanticValidationError):
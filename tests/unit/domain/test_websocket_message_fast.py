@@ -0,0 +1,103 @@
+"""Unit tests for the msgspec WebSocket message structs."""
+import orjson
+import pytest
+from uuid import uuid4
+
+import msgspec
+
+from clawbot_coordinator.domain.models.websocket_message_fast import (
+    ENCODER,
+    INCOMING_DECODER,
+    HeartbeatMessage,
+    TaskCompleteMessage,
+    connected_message,
+    task_assigned_message,
+)
+
+
+class TestOutboundEncoding:
+    """Test outbound message encoding."""
+
+    def test_connected_message_wire_format(self) -> None:
+        """Should match the Pydantic ConnectedMessage wire shape."""
+        bot_id = uuid4()
+        data = orjson.loads(ENCODER.encode(connected_message(bot_id)))
+        assert data["type"] == "connected"
+        assert data["bot_id"] == str(bot_id)
+        assert data["payload"] == {"bot_id": str(bot_id)}
+        assert "timestamp" in data
+
+    def test_task_assigned_message_wire_format(self) -> None:
+        """Should match the Pydantic TaskAssignedMessage wire shape."""
+        task_id = uuid4()
+        workflow_id = uuid4()
+        msg = task_assigned_message(task_id, workflow_id, {"action": "build"})
+        data = orjson.loads(ENCODER.encode(msg))
+        assert data["type"] == "task_assigned"
+        assert data["task_id"] == str(task_id)
+        assert data["workflow_id"] == str(workflow_id)
+        assert data["task_payload"] == {"action": "build"}
+        assert data["payload"]["task_id"] == str(task_id)
+        assert data["payload"]["workflow_id"] == str(workflow_id)
+        assert data["payload"]["task_payload"] == {"action": "build"}
+
+
+class TestIncomingDecoding:
+    """Test inbound message decoding and tag dispatch."""
+
+    def test_decode_task_complete(self) -> None:
+        """Should decode a task_complete message into a typed struct."""
+        task_id = uuid4()
+        raw = orjson.dumps(
+            {
+                "type": "task_complete",
+                "payload": {
+                    "task_id": str(task_id),
+                    "success": True,
+                    "result": {"output": "done"},
+                },
+            }
+        )
+        msg = INCOMING_DECODER.decode(raw)
+        assert isinstance(msg, TaskCompleteMessage)
+        assert msg.payload.task_id == task_id
+        assert msg.payload.success is True
+        assert msg.payload.result == {"output": "done"}
+        assert msg.payload.error is None
+
+    def test_decode_task_failure(self) -> None:
+        """Should decode failure messages with an error string."""
+        raw = orjson.dumps(
+            {
+                "type": "task_complete",
+                "payload": {
+                    "task_id": str(uuid4()),
+                    "success": False,
+                    "error": "boom",
+                },
+            }
+        )
+        msg = INCOMING_DECODER.decode(raw)
+        assert isinstance(msg, TaskCompleteMessage)
+        assert msg.payload.success is False
+        assert msg.payload.error == "boom"
+
+    def test_decode_heartbeat(self) -> None:
+        """Should decode a heartbeat message."""
+        bot_id = uuid4()
+        raw = orjson.dumps({"type": "heartbeat", "payload": {"bot_id": str(bot_id)}})
+        msg = INCOMING_DECODER.decode(raw)
+        assert isinstance(msg, HeartbeatMessage)
+        assert msg.payload == {"bot_id": str(bot_id)}
+
+    def test_unknown_type_raises_decode_error(self) -> None:
+        """Should reject unknown message types with a DecodeError."""
+        raw = orjson.dumps({"type": "unknown", "payload": {}})
+        with pytest.raises(msgspec.DecodeError):
+            INCOMING_DECODER.decode(raw)
+
+    def test_malformed_payload_raises_decode_error(self) -> None:
+        """Should reject task_complete messages missing required fields."""
+        raw = orjson.dumps({"type": "task_complete", "payload": {}})
+        with pytest.raises(msgspec.DecodeError):
+            INCOMING_DECODER.decode(raw)
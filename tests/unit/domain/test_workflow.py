@@ -24,7 +24,7 @@ class TestWorkflowCreation:
         assert workflow.status == WorkflowStatus.PENDING
         assert workflow.id is not None
         assert workflow.description == ""
-        assert workflow.task_ids == []
+        assert workflow.task_ids == ()
         assert isinstance(workflow.created_at, datetime)
 
     def test_create_workflow_with_all_fields(self) -> None:
@@ -47,7 +47,7 @@ class TestWorkflowCreation:
         assert workflow.name == "E2E Test Suite"
         assert workflow.description == "Full integration test workflow"
         assert workflow.status == WorkflowStatus.IN_PROGRESS
-        assert workflow.task_ids == task_ids
+        assert workflow.task_ids == tuple(task_ids)
 
     def test_workflow_requires_name(self) -> None:
         """Should reject workflow without name."""
@@ -120,32 +120,32 @@ class TestWorkflowStateTransitions:
 class TestWorkflowTaskManagement:
     """Test task management within workflow."""
 
-    def test_add_task_to_workflow(self) -> None:
-        """Should add task ID to workflow."""
+    def test_add_tasks_to_workflow(self) -> None:
+        """Should add task IDs to workflow."""
         workflow = Workflow(name="Test")
         task_id = uuid4()
 
-        workflow.add_task(task_id)
+        workflow.add_tasks([task_id])
 
         assert task_id in workflow.task_ids
         assert len(workflow.task_ids) == 1
 
-    def test_add_multiple_tasks(self) -> None:
-        """Should maintain task order."""
+    def test_add_tasks_maintains_order(self) -> None:
+        """Should maintain task order across batches."""
         workflow = Workflow(name="Test")
         task_ids = [uuid4(), uuid4(), uuid4()]
 
-        for task_id in task_ids:
-            workflow.add_task(task_id)
+        workflow.add_tasks(task_ids[:2])
+        workflow.add_tasks(task_ids[2:])
 
-        assert workflow.task_ids == task_ids
+        assert workflow.task_ids == tuple(task_ids)
 
     def test_has_tasks_returns_true_when_tasks_exist(self) -> None:
         """Should detect when workflow has tasks."""
         workflow = Workflow(name="Test")
         assert workflow.has_tasks() is False
 
-        workflow.add_task(uuid4())
+        workflow.add_tasks([uuid4()])
         assert workflow.has_tasks() is True
 
     def test_task_count_returns_correct_number(self) -> None:
@@ -153,8 +153,7 @@ class TestWorkflowTaskManagement:
         workflow = Workflow(name="Test")
         assert workflow.task_count() == 0
 
-        workflow.add_task(uuid4())
-        workflow.add_task(uuid4())
+        workflow.add_tasks([uuid4(), uuid4()])
         assert workflow.task_count() == 2
 
 
@@ -0,0 +1,136 @@
+"""Unit tests for the caching bot repository decorator."""
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+
+from clawbot_coordinator.domain.models.bot import Bot
+from clawbot_coordinator.infrastructure.repositories.caching_bot_repo import (
+    BotCache,
+    CachingBotRepository,
+)
+
+
+@pytest.fixture
+def inner() -> AsyncMock:
+    """Create a mock inner repository."""
+    return AsyncMock()
+
+
+@pytest.fixture
+def repo(inner: AsyncMock) -> CachingBotRepository:
+    """Create a caching repository with its own (non-shared) cache."""
+    return CachingBotRepository(inner, cache=BotCache(maxsize=10, ttl_seconds=60))
+
+
+@pytest.mark.asyncio
+class TestCachingBotRepository:
+    """Test read-through caching and write invalidation."""
+
+    async def test_repeat_get_served_from_cache(
+        self, repo: CachingBotRepository, inner: AsyncMock
+    ) -> None:
+        """Second get for the same bot should not hit the inner repo."""
+        bot = Bot(name="worker", capabilities=["test"])
+        inner.get = AsyncMock(return_value=bot)
+
+        first = await repo.get(bot.id)
+        second = await repo.get(bot.id)
+
+        assert first is not None and second is not None
+        assert second.id == bot.id
+        inner.get.assert_called_once_with(bot.id)
+
+    async def test_cached_bot_is_a_copy(
+        self, repo: CachingBotRepository, inner: AsyncMock
+    ) -> None:
+        """Mutating a returned bot must not leak into later reads."""
+        bot = Bot(name="worker", capabilities=["test"])
+        inner.get = AsyncMock(return_value=bot)
+
+        first = await repo.get(bot.id)
+        assert first is not None
+        first.name = "mutated"
+
+        second = await repo.get(bot.id)
+        assert second is not None
+        assert second.name == "worker"
+
+    async def test_cached_bot_nested_fields_are_isolated(
+        self, repo: CachingBotRepository, inner: AsyncMock
+    ) -> None:
+        """In-place mutation of nested fields must not corrupt the cache."""
+        bot = Bot(name="worker", capabilities=["test"], metadata={"zone": "a"})
+        inner.get = AsyncMock(return_value=bot)
+
+        first = await repo.get(bot.id)
+        assert first is not None
+        first.metadata["zone"] = "mutated"
+        first.capabilities.append("extra")
+
+        second = await repo.get(bot.id)
+        assert second is not None
+        assert second.metadata == {"zone": "a"}
+        assert second.capabilities == ["test"]
+
+    async def test_save_invalidates_cache(
+        self, repo: CachingBotRepository, inner: AsyncMock
+    ) -> None:
+        """A save should force the next get back to the database."""
+        bot = Bot(name="worker", capabilities=["test"])
+        inner.get = AsyncMock(return_value=bot)
+        inner.save = AsyncMock()
+
+        await repo.get(bot.id)
+        await repo.save(bot)
+        await repo.get(bot.id)
+
+        assert inner.get.call_count == 2
+
+    async def test_delete_invalidates_cache(
+        self, repo: CachingBotRepository, inner: AsyncMock
+    ) -> None:
+        """A delete should drop the cached entry."""
+        bot = Bot(name="worker", capabilities=["test"])
+        inner.get = AsyncMock(side_effect=[bot, None])
+        inner.delete = AsyncMock(return_value=True)
+
+        await repo.get(bot.id)
+        assert await repo.delete(bot.id) is True
+        assert await repo.get(bot.id) is None
+
+    async def test_miss_for_unknown_bot(
+        self, repo: CachingBotRepository, inner: AsyncMock
+    ) -> None:
+        """Unknown IDs should pass through and not be cached."""
+        inner.get = AsyncMock(return_value=None)
+        bot_id = uuid4()
+
+        assert await repo.get(bot_id) is None
+        assert await repo.get(bot_id) is None
+        assert inner.get.call_count == 2
+
+
+class TestBotCache:
+    """Test the TTL/LRU cache primitive."""
+
+    def test_expired_entry_is_dropped(self) -> None:
+        """Entries past their TTL should miss."""
+        cache = BotCache(maxsize=10, ttl_seconds=0)
+        bot = Bot(name="worker", capabilities=["test"])
+
+        cache.put(bot)
+
+        assert cache.get(bot.id) is None
+
+    def test_lru_eviction_at_capacity(self) -> None:
+        """Oldest entry should be evicted when over maxsize."""
+        cache = BotCache(maxsize=2, ttl_seconds=60)
+        bots = [Bot(name=f"worker-{i}", capabilities=["test"]) for i in range(3)]
+
+        for bot in bots:
+            cache.put(bot)
+
+        assert cache.get(bots[0].id) is None
+        assert cache.get(bots[1].id) is not None
+        assert cache.get(bots[2].id) is not None
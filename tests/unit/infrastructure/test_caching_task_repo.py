@@ -0,0 +1,110 @@
+"""Unit tests for the caching task repository decorator."""
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+
+from clawbot_coordinator.domain.models.task import Task
+from clawbot_coordinator.infrastructure.repositories.caching_task_repo import (
+    CachingTaskRepository,
+    TaskCache,
+)
+
+
+@pytest.fixture
+def inner() -> AsyncMock:
+    """Create a mock inner repository."""
+    return AsyncMock()
+
+
+@pytest.fixture
+def repo(inner: AsyncMock) -> CachingTaskRepository:
+    """Create a caching repository with its own (non-shared) cache."""
+    return CachingTaskRepository(inner, cache=TaskCache(maxsize=10, ttl_seconds=60))
+
+
+@pytest.mark.asyncio
+class TestCachingTaskRepository:
+    """Test read-through caching and write invalidation."""
+
+    async def test_repeat_get_served_from_cache(
+        self, repo: CachingTaskRepository, inner: AsyncMock
+    ) -> None:
+        """Second get for the same task should not hit the inner repo."""
+        task = Task(workflow_id=uuid4(), payload={"action": "test"})
+        inner.get = AsyncMock(return_value=task)
+
+        first = await repo.get(task.id)
+        second = await repo.get(task.id)
+
+        assert first is not None and second is not None
+        assert second.id == task.id
+        inner.get.assert_called_once_with(task.id)
+
+    async def test_cached_task_nested_fields_are_isolated(
+        self, repo: CachingTaskRepository, inner: AsyncMock
+    ) -> None:
+        """In-place mutation of the payload must not corrupt the cache."""
+        task = Task(workflow_id=uuid4(), payload={"action": "test"})
+        inner.get = AsyncMock(return_value=task)
+
+        first = await repo.get(task.id)
+        assert first is not None
+        first.payload["action"] = "mutated"
+
+        second = await repo.get(task.id)
+        assert second is not None
+        assert second.payload == {"action": "test"}
+
+    async def test_save_invalidates_cache(
+        self, repo: CachingTaskRepository, inner: AsyncMock
+    ) -> None:
+        """A save should force the next get back to the database."""
+        task = Task(workflow_id=uuid4(), payload={"action": "test"})
+        inner.get = AsyncMock(return_value=task)
+        inner.save = AsyncMock()
+
+        await repo.get(task.id)
+        await repo.save(task)
+        await repo.get(task.id)
+
+        assert inner.get.call_count == 2
+
+    async def test_status_transition_invalidates_cache(
+        self, repo: CachingTaskRepository, inner: AsyncMock
+    ) -> None:
+        """An atomic status transition should drop the cached entry."""
+        task = Task(workflow_id=uuid4(), payload={"action": "test"})
+        inner.get = AsyncMock(return_value=task)
+        inner.update_status_returning = AsyncMock(return_value=task)
+
+        await repo.get(task.id)
+        await repo.update_status_returning(task.id, "cancelled")
+        await repo.get(task.id)
+
+        assert inner.get.call_count == 2
+
+    async def test_claim_invalidates_claimed_entries(
+        self, repo: CachingTaskRepository, inner: AsyncMock
+    ) -> None:
+        """Claiming pending tasks should drop their cached entries."""
+        task = Task(workflow_id=uuid4(), payload={"action": "test"})
+        inner.get = AsyncMock(return_value=task)
+        inner.claim_pending_tasks = AsyncMock(return_value=[task])
+
+        await repo.get(task.id)
+        await repo.claim_pending_tasks(uuid4())
+        await repo.get(task.id)
+
+        assert inner.get.call_count == 2
+
+    async def test_miss_for_unknown_task(
+        self, repo: CachingTaskRepository, inner: AsyncMock
+    ) -> None:
+        """Unknown IDs should pass through and not be cached."""
+        inner.get = AsyncMock(return_value=None)
+        task_id = uuid4()
+
+        assert await repo.get(task_id) is None
+        assert await repo.get(task_id) is None
+        assert inner.get.call_count == 2
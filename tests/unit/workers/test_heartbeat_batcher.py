@@ -0,0 +1,100 @@
+"""Unit tests for heartbeat batcher."""
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+
+from clawbot_coordinator.workers.heartbeat_batcher import HeartbeatBatcher
+
+
+@pytest.mark.asyncio
+class TestHeartbeatBatcher:
+    """Test heartbeat batcher functionality."""
+
+    @pytest.fixture
+    def mock_bot_repo(self) -> AsyncMock:
+        """Create mock bot repository."""
+        return AsyncMock()
+
+    @pytest.fixture
+    def batcher(self, mock_bot_repo: AsyncMock) -> HeartbeatBatcher:
+        """Create heartbeat batcher with a stub session factory."""
+        # AsyncMock supports the async-with protocol the factory's
+        # sessions are used through
+        return HeartbeatBatcher(
+            session_factory=MagicMock(return_value=AsyncMock()),
+            repo_factory=lambda session: mock_bot_repo,
+            flush_interval_seconds=0.05,
+        )
+
+    async def test_batcher_initialization(self, batcher: HeartbeatBatcher) -> None:
+        """Should initialize with correct parameters."""
+        assert batcher._flush_interval == 0.05
+        assert batcher.is_running() is False
+
+    async def test_flush_with_no_pending_heartbeats(
+        self, batcher: HeartbeatBatcher, mock_bot_repo: AsyncMock
+    ) -> None:
+        """Should not touch the repository when nothing is pending."""
+        flushed = await batcher.flush()
+
+        assert flushed == 0
+        mock_bot_repo.touch_heartbeats.assert_not_called()
+
+    async def test_flush_batches_pending_heartbeats(
+        self, batcher: HeartbeatBatcher, mock_bot_repo: AsyncMock
+    ) -> None:
+        """Should flush all pending bots in a single repository call."""
+        bot1, bot2 = uuid4(), uuid4()
+        batcher.enqueue(bot1)
+        batcher.enqueue(bot2)
+
+        flushed = await batcher.flush()
+
+        assert flushed == 2
+        mock_bot_repo.touch_heartbeats.assert_called_once()
+        assert set(mock_bot_repo.touch_heartbeats.call_args[0][0]) == {bot1, bot2}
+
+    async def test_repeat_heartbeats_collapse_to_one(
+        self, batcher: HeartbeatBatcher, mock_bot_repo: AsyncMock
+    ) -> None:
+        """Should merge repeated heartbeats from the same bot."""
+        bot_id = uuid4()
+        for _ in range(10):
+            batcher.enqueue(bot_id)
+
+        flushed = await batcher.flush()
+
+        assert flushed == 1
+        assert mock_bot_repo.touch_heartbeats.call_args[0][0] == [bot_id]
+
+    async def test_flush_clears_pending_set(
+        self, batcher: HeartbeatBatcher, mock_bot_repo: AsyncMock
+    ) -> None:
+        """Should start the next window empty after a flush."""
+        batcher.enqueue(uuid4())
+        await batcher.flush()
+
+        assert await batcher.flush() == 0
+        mock_bot_repo.touch_heartbeats.assert_called_once()
+
+    async def test_start_and_stop(self, batcher: HeartbeatBatcher) -> None:
+        """Should start and stop the background loop cleanly."""
+        await batcher.start()
+        assert batcher.is_running()
+
+        await batcher.stop()
+        assert not batcher.is_running()
+
+    async def test_stop_flushes_remaining_heartbeats(
+        self, batcher: HeartbeatBatcher, mock_bot_repo: AsyncMock
+    ) -> None:
+        """Should not drop heartbeats enqueued after the last flush."""
+        await batcher.start()
+        bot_id = uuid4()
+        batcher.enqueue(bot_id)
+
+        await batcher.stop()
+
+        assert mock_bot_repo.touch_heartbeats.called
+        assert bot_id in mock_bot_repo.touch_heartbeats.call_args[0][0]
@@ -26,10 +26,12 @@ class TestTimeoutWorker:
 
     @pytest.fixture
     def worker(self, mock_task_repo: AsyncMock, mock_bot_repo: AsyncMock) -> TimeoutWorker:
-        """Create timeout worker instance."""
+        """Create timeout worker with a stub session factory."""
+        # AsyncMock supports the async-with protocol the factory's
+        # sessions are used through
         return TimeoutWorker(
-            task_repo=mock_task_repo,
-            bot_repo=mock_bot_repo,
+            session_factory=MagicMock(return_value=AsyncMock()),
+            repo_factory=lambda session: (mock_task_repo, mock_bot_repo),
             check_interval_seconds=30,
         )
 
@@ -42,12 +44,12 @@ class TestTimeoutWorker:
         self, worker: TimeoutWorker, mock_task_repo: AsyncMock
     ) -> None:
         """Should handle case with no timed-out tasks."""
-        mock_task_repo.get_all.return_value = []
+        mock_task_repo.get_timeout_candidates.return_value = []
 
         result = await worker.process_timeouts()
 
         assert result == 0
-        mock_task_repo.get_all.assert_called_once()
+        mock_task_repo.get_timeout_candidates.assert_called_once()
 
     async def test_process_timeouts_identifies_timed_out_task(
         self,
@@ -76,23 +78,22 @@ class TestTimeoutWorker:
             status=BotStatus.BUSY,
         )
 
-        mock_task_repo.get_all.return_value = [task]
-        mock_task_repo.get.return_value = task
-        mock_bot_repo.get.return_value = bot
+        mock_task_repo.get_timeout_candidates.return_value = [task]
+        mock_bot_repo.get_by_ids.return_value = [bot]
 
         result = await worker.process_timeouts()
 
         assert result == 1
-        # Should have saved the failed task
-        mock_task_repo.save.assert_called_once()
-        saved_task = mock_task_repo.save.call_args[0][0]
+        # Should have saved the failed task in one batch
+        mock_task_repo.save_many.assert_called_once()
+        saved_task = mock_task_repo.save_many.call_args[0][0][0]
         assert saved_task.status == TaskStatus.FAILED
         assert saved_task.result is not None
         assert "timeout" in str(saved_task.result).lower()
 
-        # Should have freed the bot
-        mock_bot_repo.save.assert_called_once()
-        saved_bot = mock_bot_repo.save.call_args[0][0]
+        # Should have freed the bot in one batch
+        mock_bot_repo.save_many.assert_called_once()
+        saved_bot = mock_bot_repo.save_many.call_args[0][0][0]
         assert saved_bot.status == BotStatus.ONLINE
 
     async def test_process_timeouts_ignores_active_task(
@@ -109,12 +110,12 @@ class TestTimeoutWorker:
         task.started_at = datetime.now(timezone.utc) - timedelta(minutes=2)
         task.updated_at = datetime.now(timezone.utc) - timedelta(minutes=2)
 
-        mock_task_repo.get_all.return_value = [task]
+        mock_task_repo.get_timeout_candidates.return_value = [task]
 
         result = await worker.process_timeouts()
 
         assert result == 0
-        mock_task_repo.save.assert_not_called()
+        mock_task_repo.save_many.assert_not_called()
 
     async def test_process_timeouts_handles_in_progress_task(
         self,
@@ -142,14 +143,13 @@ class TestTimeoutWorker:
             status=BotStatus.BUSY,
         )
 
-        mock_task_repo.get_all.return_value = [task]
-        mock_task_repo.get.return_value = task
-        mock_bot_repo.get.return_value = bot
+        mock_task_repo.get_timeout_candidates.return_value = [task]
+        mock_bot_repo.get_by_ids.return_value = [bot]
 
         result = await worker.process_timeouts()
 
         assert result == 1
-        mock_task_repo.save.assert_called_once()
+        mock_task_repo.save_many.assert_called_once()
 
     async def test_process_timeouts_ignores_completed_task(
         self, worker: TimeoutWorker, mock_task_repo: AsyncMock
@@ -161,12 +161,12 @@ class TestTimeoutWorker:
             status=TaskStatus.COMPLETED,
         )
 
-        mock_task_repo.get_all.return_value = [task]
+        mock_task_repo.get_timeout_candidates.return_value = [task]
 
         result = await worker.process_timeouts()
 
         assert result == 0
-        mock_task_repo.save.assert_not_called()
+        mock_task_repo.save_many.assert_not_called()
 
     async def test_process_timeouts_handles_multiple_tasks(
         self,
@@ -206,22 +206,15 @@ class TestTimeoutWorker:
         task3.started_at = datetime.now(timezone.utc) - timedelta(minutes=2)
         task3.updated_at = datetime.now(timezone.utc) - timedelta(minutes=2)
 
-        mock_task_repo.get_all.return_value = [task1, task2, task3]
-
-        # Mock get to return the task itself
-        async def get_side_effect(task_id):
-            for t in [task1, task2, task3]:
-                if t.id == task_id:
-                    return t
-            return None
-
-        mock_task_repo.get.side_effect = get_side_effect
-        mock_bot_repo.get.return_value = None  # No bot assigned
+        mock_task_repo.get_timeout_candidates.return_value = [task1, task2, task3]
+        mock_bot_repo.get_by_ids.return_value = []  # No bots found
 
         result = await worker.process_timeouts()
 
         assert result == 2
-        assert mock_task_repo.save.call_count == 2
+        # Both failures land in a single batched save
+        mock_task_repo.save_many.assert_called_once()
+        assert len(mock_task_repo.save_many.call_args[0][0]) == 2
 
     async def test_process_timeouts_handles_bot_not_found(
         self, worker: TimeoutWorker, mock_task_repo: AsyncMock, mock_bot_repo: AsyncMock
@@ -237,17 +230,16 @@ class TestTimeoutWorker:
         task.started_at = datetime.now(timezone.utc) - timedelta(minutes=10)
         task.updated_at = datetime.now(timezone.utc) - timedelta(minutes=10)
 
-        mock_task_repo.get_all.return_value = [task]
-        mock_task_repo.get.return_value = task
-        mock_bot_repo.get.return_value = None  # Bot not found
+        mock_task_repo.get_timeout_candidates.return_value = [task]
+        mock_bot_repo.get_by_ids.return_value = []  # Bot not found
 
         result = await worker.process_timeouts()
 
         assert result == 1
         # Should still fail the task
-        mock_task_repo.save.assert_called_once()
-        # Should not try to save bot
-        mock_bot_repo.save.assert_not_called()
+        mock_task_repo.save_many.assert_called_once()
+        # Should not try to save any bots
+        mock_bot_repo.save_many.assert_not_called()
 
     async def test_worker_start_sets_running_flag(self, worker: TimeoutWorker) -> None:
         """Should set running flag when started."""